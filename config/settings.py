@@ -176,6 +176,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ),
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+    'EXCEPTION_HANDLER': 'mathesar.api.utils.exception_handler',
 }
 
 # Mathesar settings
@@ -184,5 +185,51 @@ MATHESAR_UI_BUILD_LOCATION = os.path.join(BASE_DIR, 'mathesar/static/mathesar/')
 MATHESAR_MANIFEST_LOCATION = os.path.join(MATHESAR_UI_BUILD_LOCATION, 'manifest.json')
 MATHESAR_CLIENT_DEV_URL = 'http://localhost:3000'
 
+# Timeouts (in milliseconds, 0 to disable) for the queries run on user
+# databases by the records API, keyed by viewset action.
+_records_read_timeouts = {
+    'statement_timeout': decouple_config('RECORDS_READ_STATEMENT_TIMEOUT', default=30000, cast=int),
+    'lock_timeout': decouple_config('RECORDS_READ_LOCK_TIMEOUT', default=5000, cast=int),
+}
+_records_write_timeouts = {
+    'statement_timeout': decouple_config('RECORDS_WRITE_STATEMENT_TIMEOUT', default=30000, cast=int),
+    'lock_timeout': decouple_config('RECORDS_WRITE_LOCK_TIMEOUT', default=5000, cast=int),
+}
+# Admission control for the queries run on each user database, per process
+# (see db.admission).  Queries beyond the concurrency limit are queued, and
+# rejected with a 429 once the queue is full or they've waited too long.
+MATHESAR_ADMISSION_CONTROL = {
+    'max_concurrent': decouple_config('MAX_CONCURRENT_QUERIES', default=8, cast=int),
+    'max_queued': decouple_config('MAX_QUEUED_QUERIES', default=32, cast=int),
+    'queue_timeout': decouple_config('QUERY_QUEUE_TIMEOUT', default=30, cast=int),
+}
+
+# Identical concurrent record reads share one query, and the result is kept
+# for this many seconds (0 to disable), or until the table is written to
+# (see db.records.coalescing).
+MATHESAR_RECORDS_COALESCING = {
+    'result_ttl': decouple_config('RECORDS_RESULT_TTL', default=2, cast=float),
+}
+
+# Whether type inference that alters tables (as when an import with inferred
+# types falls back to text columns) infers the columns concurrently, each on
+# its own connection.  Wide tables then use more than one Postgres backend.
+MATHESAR_PARALLEL_TYPE_INFERENCE = decouple_config('PARALLEL_TYPE_INFERENCE', default=False, cast=bool)
+
+# The data version of each table (see db.tables.operations.data_version) is
+# cached for this many seconds, so that requests for unchanged records can
+# be answered without querying the database.  Serialized record responses
+# can also be cached per version (0 disables it).
+MATHESAR_RECORDS_VERSION_CACHE_TTL = decouple_config('RECORDS_VERSION_CACHE_TTL', default=2, cast=int)
+MATHESAR_RECORDS_BODY_CACHE_TTL = decouple_config('RECORDS_BODY_CACHE_TTL', default=0, cast=int)
+
+MATHESAR_RECORDS_QUERY_TIMEOUTS = {
+    'list': _records_read_timeouts,
+    'retrieve': _records_read_timeouts,
+    'create': _records_write_timeouts,
+    'partial_update': _records_write_timeouts,
+    'destroy': _records_write_timeouts,
+}
+
 
 STATICFILES_DIRS = [MATHESAR_UI_BUILD_LOCATION]
@@ -0,0 +1,276 @@
+"""
+Admission control for the queries run on each database.
+
+Every database gets a controller that lets a bounded number of queries
+run at once (in this process), and queues the rest by priority class.
+When the queue is full, or a query waits too long, the query is rejected
+with an `AdmissionRejectedError` rather than adding to the load.
+
+Engines created by `db.engine` use an `AdmittedQueuePool`, whose
+connections each hold a slot from checkout until checkin, so that all the
+statements of a transaction run under a single admission.  Longer
+operations can also hold a slot for their whole duration by calling
+`admit` themselves.  Admission is reentrant per thread, so the connections
+they check out aren't queued again, and `share_admission` lets worker
+threads share the slot of the thread that starts them.
+"""
+from contextlib import contextmanager
+import functools
+import heapq
+import itertools
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+# Priority classes, from the highest priority to the lowest
+INTERACTIVE = "interactive"
+INFERENCE = "inference"
+IMPORT = "import"
+EXPORT = "export"
+PRIORITIES = (INTERACTIVE, INFERENCE, IMPORT, EXPORT)
+
+DEFAULT_MAX_CONCURRENT = 8
+DEFAULT_MAX_QUEUED = 32
+# In seconds
+DEFAULT_QUEUE_TIMEOUT = 30
+
+
+class AdmissionRejectedError(Exception):
+    def __init__(self, database, reason):
+        self.database = database
+        self.reason = reason
+        super().__init__(f"Query on database {database} rejected: {reason}")
+
+
+class AdmissionController:
+    def __init__(
+            self, name, max_concurrent=DEFAULT_MAX_CONCURRENT,
+            max_queued=DEFAULT_MAX_QUEUED, queue_timeout=DEFAULT_QUEUE_TIMEOUT,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._running = 0
+        # Heap of [priority_index, sequence, event, priority] waiters
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._admitted = 0
+        self._rejected = 0
+
+    def acquire(self, priority=INTERACTIVE):
+        """
+        Waits for a slot to run a query.  Waiters are admitted by priority
+        class, and first-come-first-served within a class.
+        """
+        with self._lock:
+            if self._running < self.max_concurrent and not self._waiting:
+                self._running += 1
+                self._admitted += 1
+                return
+            if len(self._waiting) >= self.max_queued:
+                self._rejected += 1
+                raise AdmissionRejectedError(self.name, "too many queued queries")
+            waiter = [PRIORITIES.index(priority), next(self._sequence), threading.Event(), priority]
+            heapq.heappush(self._waiting, waiter)
+        if waiter[2].wait(self.queue_timeout):
+            return
+        with self._lock:
+            # The slot may have been handed over just after the wait timed out
+            if waiter[2].is_set():
+                return
+            self._waiting.remove(waiter)
+            heapq.heapify(self._waiting)
+            self._rejected += 1
+        raise AdmissionRejectedError(self.name, "timed out waiting in the queue")
+
+    def release(self):
+        with self._lock:
+            if self._waiting:
+                # Hand the slot over directly, so it can't be taken by a
+                # query arriving in the meantime.
+                waiter = heapq.heappop(self._waiting)
+                self._admitted += 1
+                waiter[2].set()
+            else:
+                self._running -= 1
+
+    def get_metrics(self):
+        with self._lock:
+            queued_by_priority = {priority: 0 for priority in PRIORITIES}
+            for waiter in self._waiting:
+                queued_by_priority[waiter[3]] += 1
+            return {
+                "running": self._running,
+                "queued": len(self._waiting),
+                "queued_by_priority": queued_by_priority,
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+            }
+
+
+_controllers = {}
+_controllers_lock = threading.Lock()
+_controller_options = {}
+_local = threading.local()
+
+
+def configure_admission(**controller_options):
+    """
+    Sets the options (see `AdmissionController`) of the controllers created
+    from now on.
+    """
+    with _controllers_lock:
+        _controller_options.clear()
+        _controller_options.update(controller_options)
+        _controllers.clear()
+
+
+def get_database_key(engine):
+    url = engine.url
+    return f"{url.host}:{url.port}/{url.database}"
+
+
+def _get_controller(key):
+    with _controllers_lock:
+        if key not in _controllers:
+            _controllers[key] = AdmissionController(key, **_controller_options)
+        return _controllers[key]
+
+
+def get_admission_controller(engine):
+    return _get_controller(get_database_key(engine))
+
+
+def _get_admitted_keys():
+    if not hasattr(_local, "admitted_keys"):
+        _local.admitted_keys = set()
+    return _local.admitted_keys
+
+
+def _get_current_priority():
+    return getattr(_local, "priority", INTERACTIVE)
+
+
+@contextmanager
+def query_priority(priority):
+    """
+    Sets the priority class of the queries run by this thread inside the
+    block.
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"priority must be one of {PRIORITIES}")
+    previous_priority = _get_current_priority()
+    _local.priority = priority
+    try:
+        yield
+    finally:
+        _local.priority = previous_priority
+
+
+@contextmanager
+def admit(engine, priority=None):
+    """
+    Holds a query slot on the database of the engine for the duration of the
+    block, waiting for one if needed.  Raises an `AdmissionRejectedError` if
+    the query is shed instead.
+    """
+    key = get_database_key(engine)
+    admitted_keys = _get_admitted_keys()
+    if key in admitted_keys:
+        yield
+        return
+    if priority is None:
+        priority = _get_current_priority()
+    controller = _get_controller(key)
+    controller.acquire(priority)
+    admitted_keys.add(key)
+    try:
+        yield
+    finally:
+        admitted_keys.discard(key)
+        controller.release()
+
+
+@contextmanager
+def _admitted_as(keys):
+    admitted_keys = _get_admitted_keys()
+    added_keys = set(keys) - admitted_keys
+    admitted_keys.update(added_keys)
+    try:
+        yield
+    finally:
+        admitted_keys.difference_update(added_keys)
+
+
+def bypass_admission(engine):
+    """
+    Lets the queries run by this thread inside the block skip admission
+    control, e.g., to cancel queries while the database is overloaded.
+    """
+    return _admitted_as([get_database_key(engine)])
+
+
+def share_admission(fn):
+    """
+    Wraps fn so that it runs with the admission and query priority of the
+    calling thread, for running it in worker threads.  The workers then
+    share the caller's slots, rather than each taking their own.
+    """
+    admitted_keys = set(_get_admitted_keys())
+    priority = _get_current_priority()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        with query_priority(priority), _admitted_as(admitted_keys):
+            return fn(*args, **kwargs)
+    return run
+
+
+_ADMISSION_INFO_KEY = "mathesar_admission"
+
+
+class AdmittedQueuePool(QueuePool):
+    """
+    A QueuePool whose connections each hold a query slot on their database
+    from checkout until checkin.  The slot is taken before the connection is
+    checked out, so that queued queries don't hold pooled connections.  A
+    thread that already holds a slot on the database shares it.
+    """
+    database_key = None
+
+    def connect(self):
+        key = self.database_key
+        admitted_keys = _get_admitted_keys()
+        if key is None or key in admitted_keys:
+            return super().connect()
+        controller = _get_controller(key)
+        controller.acquire(_get_current_priority())
+        admitted_keys.add(key)
+        try:
+            connection = super().connect()
+        except BaseException:
+            admitted_keys.discard(key)
+            controller.release()
+            raise
+        # Released on checkin, which may happen on another thread
+        connection.info[_ADMISSION_INFO_KEY] = (controller, admitted_keys, key)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.database_key = self.database_key
+        return pool
+
+
+@event.listens_for(AdmittedQueuePool, "checkin")
+def _release_admission_on_checkin(dbapi_connection, connection_record):
+    admission = connection_record.info.pop(_ADMISSION_INFO_KEY, None)
+    if admission is not None:
+        controller, admitted_keys, key = admission
+        admitted_keys.discard(key)
+        controller.release()
@@ -14,5 +14,9 @@ class DagCycleError(Exception):
     pass
 
 
+class OnlineAlterCancelledError(Exception):
+    pass
+
+
 class DynamicDefaultWarning(Warning):
     pass
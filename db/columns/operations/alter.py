@@ -1,20 +1,42 @@
 from alembic.migration import MigrationContext
 from alembic.operations import Operations
-from sqlalchemy import DefaultClause, text, DDL, select
+from sqlalchemy import DefaultClause, PrimaryKeyConstraint, String, text, DDL, func, select
 from sqlalchemy.exc import DataError, InternalError
+from sqlalchemy.sql import quoted_name
+from sqlalchemy.sql.functions import Function
 from psycopg2.errors import InvalidTextRepresentation, InvalidParameterValue
 
+from db import constants
 from db.columns.defaults import NAME, NULLABLE
-from db.columns.exceptions import InvalidDefaultError, InvalidTypeError, InvalidTypeOptionError
+from db.columns.exceptions import (
+    InvalidDefaultError, InvalidTypeError, InvalidTypeOptionError, OnlineAlterCancelledError
+)
 from db.columns.operations.select import get_column_default, get_column_index_from_name
 from db.columns.utils import get_mathesar_column_with_engine, get_type_options
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, get_operation_estimate
 from db.tables.operations.select import get_oid_from_table, reflect_table_from_oid
+from db.tables.utils import get_primary_key_column
 from db.types.base import get_db_type_name
 from db.types.operations.cast import get_supported_alter_column_types, get_cast_function_name
 from db.utils import execute_statement
 
 
-def alter_column(engine, table_oid, column_index, column_data):
+ONLINE_ALTER_BATCH_SIZE = 10000
+
+
+def alter_column(
+        engine, table_oid, column_index, column_data, dry_run=False,
+        online=False, batch_size=None,
+):
+    """
+    If `dry_run` is set, nothing is changed, and an estimate of the cost of
+    the alteration is returned instead (see `get_operation_estimate`).
+
+    If `online` is set, the type of the column is changed with
+    `alter_column_type_online` (in batches of `batch_size` rows), before
+    the other alterations.  The column then moves to the end of the table,
+    so the returned column has a new index.
+    """
     TYPE_KEY = 'plain_type'
     TYPE_OPTIONS_KEY = 'type_options'
     NULLABLE_KEY = NULLABLE
@@ -24,6 +46,30 @@ def alter_column(engine, table_oid, column_index, column_data):
     table = reflect_table_from_oid(table_oid, engine)
     column_index = int(column_index)
 
+    if dry_run:
+        return _get_alter_column_estimate(
+            table, table_oid, column_index, engine,
+            retype=TYPE_KEY in column_data or TYPE_OPTIONS_KEY in column_data,
+            new_type=column_data.get(TYPE_KEY),
+            type_options=column_data.get(TYPE_OPTIONS_KEY, {}),
+        )
+
+    if online and (TYPE_KEY in column_data or TYPE_OPTIONS_KEY in column_data):
+        column = table.columns[column_index]
+        new_type = column_data.get(TYPE_KEY)
+        type_options = column_data.get(TYPE_OPTIONS_KEY) or {}
+        if _needs_retype(column, engine, new_type, type_options):
+            new_type = new_type if new_type is not None else get_db_type_name(column.type, engine)
+            column_index = alter_column_type_online(
+                table_oid, column_index, engine, new_type, type_options,
+                batch_size=batch_size or ONLINE_ALTER_BATCH_SIZE,
+            )
+            table = reflect_table_from_oid(table_oid, engine)
+        column_data = {
+            key: value for key, value in column_data.items()
+            if key not in (TYPE_KEY, TYPE_OPTIONS_KEY)
+        }
+
     with engine.begin() as conn:
         if TYPE_KEY in column_data:
             retype_column(
@@ -55,61 +101,406 @@ def alter_column(engine, table_oid, column_index, column_data):
     )
 
 
-def alter_column_type(
-        table, column_name, engine, connection, target_type_str,
+def _get_alter_column_estimate(
+        table, table_oid, column_index, engine, retype, new_type, type_options
+):
+    """
+    Changing the type of a column rewrites the table, since every value is
+    cast with the USING expression, unless the values only need to be
+    relabeled (see _is_binary_coercible_retype).  The other alterations only
+    change the catalog (though setting NOT NULL scans the table to check
+    it).
+    """
+    column = table.columns[column_index]
+    if retype and _needs_retype(column, engine, new_type, type_options):
+        new_type = new_type if new_type is not None else get_db_type_name(column.type, engine)
+        target_type = get_supported_alter_column_types(engine, friendly_names=False)[new_type]
+        prepared_type_name = target_type(**type_options).compile(dialect=engine.dialect)
+        prepared_column_name = engine.dialect.identifier_preparer.format_column(column)
+        cast_function_name = get_cast_function_name(prepared_type_name)
+        with engine.begin() as conn:
+            rewrite = not _is_binary_coercible_retype(
+                table_oid, column, engine, conn, prepared_type_name, type_options
+            )
+        return get_operation_estimate(
+            engine,
+            [table_oid],
+            select(text(f"{cast_function_name}({prepared_column_name})")).select_from(table),
+            rewrite=rewrite,
+            lock=ACCESS_EXCLUSIVE,
+        )
+    return get_operation_estimate(
+        engine, [table_oid], select(column), rewrite=False, lock=ACCESS_EXCLUSIVE
+    )
+
+
+def _is_binary_coercible_retype(
+        table_oid, column, engine, connection, prepared_type_name, type_options
+):
+    """
+    Checks whether changing the type of the column to the given (compiled)
+    type only relabels its values, so that Postgres doesn't need to rewrite
+    the table.  That's the case for a binary coercible cast (castmethod 'b'
+    in pg_cast, e.g., varchar(n) to text) to a type without type options,
+    and for widening (or removing) the length of a varchar column.
+    """
+    sel = text(
+        """
+        SELECT
+          a.atttypid = to_regtype(:type_name),
+          a.atttypid = 'character varying'::regtype,
+          a.atttypmod,
+          EXISTS (
+            SELECT 1 FROM pg_cast c
+            WHERE c.castsource = a.atttypid
+              AND c.casttarget = to_regtype(:type_name)
+              AND c.castmethod = 'b'
+          )
+        FROM pg_attribute a
+        WHERE a.attrelid = :table_oid AND a.attname = :column_name
+        """
+    ).bindparams(type_name=prepared_type_name, table_oid=table_oid, column_name=column.name)
+    same_type, is_varchar, typmod, binary_coercible = execute_statement(
+        engine, sel, connection
+    ).first()
+    if same_type:
+        if not is_varchar:
+            return False
+        new_length = type_options.get('length')
+        # The typmod of a varchar is its length plus the 4 byte header
+        return new_length is None or (typmod != -1 and new_length >= typmod - 4)
+    return binary_coercible and all(value is None for value in type_options.values())
+
+
+def _get_alter_column_type_actions(
+        table, column_index, engine, connection, target_type_str,
         type_options={}, friendly_names=True,
 ):
+    """
+    Gives the ALTER TABLE actions needed to change the type of a column
+    (and to cast its default, if any) as a list of strings.  The actions
+    for several columns can be joined into a single ALTER TABLE statement.
+    """
     _preparer = engine.dialect.identifier_preparer
     supported_types = get_supported_alter_column_types(
         engine, friendly_names=friendly_names
     )
     target_type = supported_types.get(target_type_str)
-    schema = table.schema
+    column = table.columns[column_index]
+    table_oid = get_oid_from_table(table.name, table.schema, engine)
 
-    table_oid = get_oid_from_table(table.name, schema, engine)
-    # Re-reflect table so that column is accurate
-    table = reflect_table_from_oid(table_oid, engine, connection)
-    column = table.columns[column_name]
-    column_index = get_column_index_from_name(table_oid, column_name, engine, connection)
+    prepared_column_name = _preparer.format_column(column)
+    prepared_type_name = target_type(**type_options).compile(dialect=engine.dialect)
+    cast_function_name = get_cast_function_name(prepared_type_name)
 
+    actions = [f"ALTER COLUMN {prepared_column_name} DROP DEFAULT"]
+    if _is_binary_coercible_retype(
+            table_oid, column, engine, connection, prepared_type_name, type_options
+    ):
+        # A USING expression would make Postgres rewrite the table
+        actions.append(f"ALTER COLUMN {prepared_column_name} TYPE {prepared_type_name}")
+    else:
+        actions.append(
+            f"ALTER COLUMN {prepared_column_name} TYPE {prepared_type_name}"
+            f" USING {cast_function_name}({prepared_column_name})"
+        )
     default = get_column_default(table_oid, column_index, engine, connection)
     if default is not None:
+        # We cast the default before altering the column, so that the new
+        # default can be set as part of the same statement.
         default_text = column.server_default.arg.text
-    set_column_default(table, column_index, engine, connection, None)
+        cast_stmt = f"{cast_function_name}({default_text})"
+        default_stmt = select(text(cast_stmt))
+        new_default = str(execute_statement(engine, default_stmt, connection).first()[0])
+        prepared_default = String().literal_processor(dialect=engine.dialect)(new_default)
+        actions.append(
+            f"ALTER COLUMN {prepared_column_name} SET DEFAULT {prepared_default}"
+        )
+    return actions
 
+
+def execute_alter_table_actions(table, engine, connection, actions):
+    """
+    Runs the given actions (strings such as "DROP COLUMN ...") on the table
+    as a single ALTER TABLE statement.
+    """
+    prepared_table_name = engine.dialect.identifier_preparer.format_table(table)
+    alter_stmt = f"ALTER TABLE {prepared_table_name} {', '.join(actions)};"
+    execute_statement(engine, DDL(alter_stmt), connection)
+
+
+def alter_column_type(
+        table, column_name, engine, connection, target_type_str,
+        type_options={}, friendly_names=True,
+):
+    table_oid = get_oid_from_table(table.name, table.schema, engine)
+    # Re-reflect table so that column is accurate
+    table = reflect_table_from_oid(table_oid, engine, connection)
+    column_index = get_column_index_from_name(table_oid, column_name, engine, connection)
+    actions = _get_alter_column_type_actions(
+        table, column_index, engine, connection, target_type_str,
+        type_options=type_options, friendly_names=friendly_names,
+    )
+    execute_alter_table_actions(table, engine, connection, actions)
+
+
+def alter_column_types_along_paths(table_oid, column_paths, engine):
+    """
+    Alters columns of a table along paths of types, given as a dict mapping
+    each column name to its list of type strings.  All of the columns take
+    their next type in a single ALTER TABLE, so the table is rewritten once
+    per step of the longest path, rather than once per type of each column.
+    """
+    path_length = max((len(path) for path in column_paths.values()), default=0)
+    for step in range(path_length):
+        with engine.begin() as conn:
+            table = reflect_table_from_oid(table_oid, engine, conn)
+            column_indexes = {name: index for index, name in enumerate(table.columns.keys())}
+            actions = []
+            for column_name, path in column_paths.items():
+                if len(path) > step:
+                    actions.extend(_get_alter_column_type_actions(
+                        table, column_indexes[column_name], engine, conn, path[step]
+                    ))
+            execute_alter_table_actions(table, engine, conn, actions)
+
+
+def _get_online_alter_names(table_oid, column_index):
+    suffix = f"{table_oid}_{column_index}"
+    return (
+        f"{constants.MATHESAR_PREFIX}shadow_{suffix}",
+        f"{constants.MATHESAR_PREFIX}shadow_trigger_{suffix}",
+        f"{constants.MATHESAR_PREFIX}shadow_not_null_{suffix}",
+    )
+
+
+def _validate_column_for_online_alter(table, column):
+    if column.primary_key or column.foreign_keys:
+        raise ValueError('Key columns cannot be retyped online')
+    constrained = [
+        c for c in list(table.constraints) + list(table.indexes)
+        if column.name in c.columns and not isinstance(c, PrimaryKeyConstraint)
+    ]
+    if constrained:
+        raise ValueError('Columns with constraints or indexes cannot be retyped online')
+
+
+def _drop_online_alter_objects(table, engine, connection, shadow_name, trigger_name):
+    _preparer = engine.dialect.identifier_preparer
     prepared_table_name = _preparer.format_table(table)
-    prepared_column_name = _preparer.format_column(column)
+    prepared_function_name = (
+        f"{_preparer.quote_schema(table.schema)}.{_preparer.quote(trigger_name)}"
+    )
+    drop_stmt = f"""
+    DROP TRIGGER IF EXISTS {_preparer.quote(trigger_name)} ON {prepared_table_name};
+    DROP FUNCTION IF EXISTS {prepared_function_name}();
+    ALTER TABLE {prepared_table_name} DROP COLUMN IF EXISTS {_preparer.quote(shadow_name)};
+    """
+    execute_statement(engine, DDL(drop_stmt), connection)
+
+
+def alter_column_type_online(
+        table_oid, column_index, engine, target_type_str, type_options={},
+        batch_size=ONLINE_ALTER_BATCH_SIZE, progress_callback=None,
+        is_cancelled=None,
+):
+    """
+    Changes the type of a column without holding an ACCESS EXCLUSIVE lock
+    on the table while its data is cast.
+
+    A shadow column of the target type is added, and a trigger keeps it up
+    to date with inserts and updates of the column.  The existing rows are
+    backfilled with the cast_to_<type> function in batches ordered by the
+    primary key, each batch in its own transaction.  Finally, the original
+    column is dropped and the shadow column renamed in a short transaction.
+    For a NOT NULL column, the shadow column is first checked for NULLs
+    with a NOT VALID check constraint that is validated outside of that
+    transaction, so that SET NOT NULL doesn't scan the table while holding
+    its ACCESS EXCLUSIVE lock.  Columns with keys, constraints or indexes
+    aren't supported.
+
+    Postgres can't move a column, so the retyped column ends up at the end
+    of the table: its index changes, and the columns after it move up by
+    one.  The new index of the column is returned.
+
+    Args:
+        batch_size:        number of rows cast per transaction.
+        progress_callback: called with (rows_done, total_rows) after each
+                           batch.
+        is_cancelled:      called before each batch; if it returns True,
+                           the shadow column and trigger are dropped, and
+                           OnlineAlterCancelledError is raised.
+    """
+    _preparer = engine.dialect.identifier_preparer
+    table = reflect_table_from_oid(table_oid, engine)
+    column = table.columns[column_index]
+    _validate_column_for_online_alter(table, column)
+    primary_key_column = get_primary_key_column(table)
+    shadow_name, trigger_name, not_null_name = _get_online_alter_names(table_oid, column_index)
+
+    supported_types = get_supported_alter_column_types(engine, friendly_names=False)
+    target_type = supported_types.get(target_type_str)
     prepared_type_name = target_type(**type_options).compile(dialect=engine.dialect)
     cast_function_name = get_cast_function_name(prepared_type_name)
-    alter_stmt = f"""
-    ALTER TABLE {prepared_table_name}
-      ALTER COLUMN {prepared_column_name}
-      TYPE {prepared_type_name}
-      USING {cast_function_name}({prepared_column_name});
+
+    prepared_table_name = _preparer.format_table(table)
+    prepared_column_name = _preparer.format_column(column)
+    prepared_shadow_name = _preparer.quote(shadow_name)
+    prepared_function_name = (
+        f"{_preparer.quote_schema(table.schema)}.{_preparer.quote(trigger_name)}"
+    )
+    setup_stmt = f"""
+    ALTER TABLE {prepared_table_name} ADD COLUMN {prepared_shadow_name} {prepared_type_name};
+    CREATE FUNCTION {prepared_function_name}() RETURNS trigger AS $$
+    BEGIN
+      NEW.{prepared_shadow_name} := {cast_function_name}(NEW.{prepared_column_name});
+      RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    CREATE TRIGGER {_preparer.quote(trigger_name)}
+      BEFORE INSERT OR UPDATE OF {prepared_column_name} ON {prepared_table_name}
+      FOR EACH ROW EXECUTE PROCEDURE {prepared_function_name}();
     """
+    with engine.begin() as conn:
+        execute_statement(engine, DDL(setup_stmt), conn)
 
-    execute_statement(engine, DDL(alter_stmt), connection)
+    try:
+        with engine.begin() as conn:
+            default = get_column_default(table_oid, column_index, engine, conn)
+            if default is not None:
+                # Cast the default up front, so that a bad default fails
+                # before any data is backfilled.
+                default_text = column.server_default.arg.text
+                default_stmt = select(text(f"{cast_function_name}({default_text})"))
+                default = str(execute_statement(engine, default_stmt, conn).first()[0])
+            total_rows = execute_statement(
+                engine, select(func.count()).select_from(table), conn
+            ).scalar()
+
+        shadow_table = reflect_table_from_oid(table_oid, engine)
+        shadow_column = shadow_table.columns[shadow_name]
+        primary_key_column = shadow_table.columns[primary_key_column.name]
+        cast_expr = Function(
+            quoted_name(cast_function_name, False), shadow_table.columns[column.name]
+        )
+        if is_cancelled is not None and is_cancelled():
+            raise OnlineAlterCancelledError
+        rows_done = 0
+        backfill = shadow_table.update().values({shadow_column: cast_expr})
+        for _, batch_count in update_in_primary_key_batches(
+                engine, backfill, primary_key_column, batch_size
+        ):
+            rows_done += batch_count
+            if progress_callback is not None:
+                progress_callback(rows_done, total_rows)
+            if is_cancelled is not None and is_cancelled():
+                raise OnlineAlterCancelledError
+
+        swap_actions = [f"DROP COLUMN {prepared_column_name}"]
+        if not column.nullable:
+            prepared_not_null_name = _preparer.quote(not_null_name)
+            with engine.begin() as conn:
+                execute_statement(engine, DDL(
+                    f"ALTER TABLE {prepared_table_name} ADD CONSTRAINT {prepared_not_null_name}"
+                    f" CHECK ({prepared_shadow_name} IS NOT NULL) NOT VALID"
+                ), conn)
+            # Validating only takes a SHARE UPDATE EXCLUSIVE lock, and lets
+            # SET NOT NULL skip its scan of the table.
+            with engine.begin() as conn:
+                execute_statement(engine, DDL(
+                    f"ALTER TABLE {prepared_table_name} VALIDATE CONSTRAINT {prepared_not_null_name}"
+                ), conn)
+            swap_actions = [
+                f"ALTER COLUMN {prepared_shadow_name} SET NOT NULL",
+                f"DROP CONSTRAINT {prepared_not_null_name}",
+            ] + swap_actions
+        swap_stmt = f"""
+        DROP TRIGGER {_preparer.quote(trigger_name)} ON {prepared_table_name};
+        DROP FUNCTION {prepared_function_name}();
+        ALTER TABLE {prepared_table_name} {', '.join(swap_actions)};
+        ALTER TABLE {prepared_table_name}
+          RENAME COLUMN {prepared_shadow_name} TO {prepared_column_name};
+        """
+        if default is not None:
+            prepared_default = String().literal_processor(dialect=engine.dialect)(default)
+            swap_stmt += f"""
+        ALTER TABLE {prepared_table_name}
+          ALTER COLUMN {prepared_column_name} SET DEFAULT {prepared_default};
+            """
+        with engine.begin() as conn:
+            execute_statement(engine, DDL(swap_stmt), conn)
+    except BaseException as e:
+        with engine.begin() as conn:
+            _drop_online_alter_objects(table, engine, conn, shadow_name, trigger_name)
+        if isinstance(e, (DataError, InternalError)):
+            _raise_retype_error(e)
+        raise
+    return get_column_index_from_name(table_oid, column.name, engine)
+
+
+def update_in_primary_key_batches(
+        engine, update_stmt, primary_key_column, batch_size, start_after=None
+):
+    """
+    Runs the given UPDATE over ranges of at most `batch_size` rows, ordered
+    by the primary key, each range in its own transaction.  Only rows with
+    a key greater than `start_after` (if given) are updated, so an
+    interrupted run can be resumed from the last key it yielded.
 
-    if default is not None:
-        cast_stmt = f"{cast_function_name}({default_text})"
-        default_stmt = select(text(cast_stmt))
-        new_default = str(execute_statement(engine, default_stmt, connection).first()[0])
-        set_column_default(table, column_index, engine, connection, new_default)
+    Yields (last_key, batch_count) after each batch is committed.
+    """
+    last_key = start_after
+    while True:
+        batch_keys = select(primary_key_column).order_by(primary_key_column).limit(batch_size)
+        if last_key is not None:
+            batch_keys = batch_keys.where(primary_key_column > last_key)
+        batch_keys = batch_keys.subquery()
+        with engine.begin() as conn:
+            batch_end, batch_count = execute_statement(
+                engine,
+                select(func.max(batch_keys.c[0]), func.count()).select_from(batch_keys),
+                conn
+            ).first()
+            if batch_count == 0:
+                return
+            batch_update = update_stmt.where(primary_key_column <= batch_end)
+            if last_key is not None:
+                batch_update = batch_update.where(primary_key_column > last_key)
+            execute_statement(engine, batch_update, conn)
+        last_key = batch_end
+        yield last_key, batch_count
+
+
+def _needs_retype(column, engine, new_type, type_options):
+    column_db_type = get_db_type_name(column.type, engine)
+    new_type = new_type if new_type is not None else column_db_type
+    column_type_options = get_type_options(column)
+    return not (
+        (new_type.lower() == column_db_type.lower())
+        and _check_type_option_equivalence(type_options, column_type_options)
+    )
+
+
+def _raise_retype_error(e):
+    if isinstance(e, DataError):
+        if type(e.orig) == InvalidParameterValue:
+            raise InvalidTypeOptionError
+        if type(e.orig) == InvalidTextRepresentation:
+            raise InvalidTypeError
+        else:
+            raise e
+    elif isinstance(e, InternalError):
+        raise e.orig
+    raise e
 
 
 def retype_column(
         table, column_index, engine, connection, new_type=None, type_options={},
 ):
     column = table.columns[column_index]
-    column_db_type = get_db_type_name(column.type, engine)
-    new_type = new_type if new_type is not None else column_db_type
-    column_type_options = get_type_options(column)
-
-    if (
-            (new_type.lower() == column_db_type.lower())
-            and _check_type_option_equivalence(type_options, column_type_options)
-    ):
+    if not _needs_retype(column, engine, new_type, type_options):
         return
+    new_type = new_type if new_type is not None else get_db_type_name(column.type, engine)
 
     try:
         alter_column_type(
@@ -121,15 +512,8 @@ def retype_column(
             type_options,
             friendly_names=False
         )
-    except DataError as e:
-        if type(e.orig) == InvalidParameterValue:
-            raise InvalidTypeOptionError
-        if type(e.orig) == InvalidTextRepresentation:
-            raise InvalidTypeError
-        else:
-            raise e
-    except InternalError as e:
-        raise e.orig
+    except (DataError, InternalError) as e:
+        _raise_retype_error(e)
 
 
 def change_column_nullable(table, column_index, engine, connection, nullable):
@@ -180,34 +564,66 @@ def _validate_columns_for_batch_update(table, column_data):
                 raise ValueError(f'Key "{key}" found in columns. Keys allowed are: {allowed_key_list}')
 
 
-def _batch_update_column_types(table, column_data_list, connection, engine):
+def _get_batch_retype_actions(table, column_data_list, connection, engine):
+    actions = []
     for index, column_data in enumerate(column_data_list):
         if 'plain_type' in column_data:
             new_type = column_data['plain_type']
             type_options = column_data.get('type_options', {})
             if type_options is None:
                 type_options = {}
-            retype_column(table, index, engine, connection, new_type, type_options)
+            if _needs_retype(table.columns[index], engine, new_type, type_options):
+                actions.extend(
+                    _get_alter_column_type_actions(
+                        table, index, engine, connection, new_type,
+                        type_options, friendly_names=False,
+                    )
+                )
+    return actions
 
 
-def _batch_alter_table_columns(table, column_data_list, connection):
-    ctx = MigrationContext.configure(connection)
-    op = Operations(ctx)
-    with op.batch_alter_table(table.name, schema=table.schema) as batch_op:
-        for index, column_data in enumerate(column_data_list):
-            column = table.columns[index]
-            if 'name' in column_data and column.name != column_data['name']:
-                batch_op.alter_column(
-                    column.name,
-                    new_column_name=column_data['name']
-                )
-            elif len(column_data.keys()) == 0:
-                batch_op.drop_column(column.name)
+def _get_batch_drop_actions(table, column_data_list, engine):
+    _preparer = engine.dialect.identifier_preparer
+    return [
+        f"DROP COLUMN {_preparer.format_column(table.columns[index])}"
+        for index, column_data in enumerate(column_data_list)
+        if len(column_data.keys()) == 0
+    ]
+
+
+def _batch_rename_columns(table, column_data_list, connection, engine):
+    _preparer = engine.dialect.identifier_preparer
+    prepared_table_name = _preparer.format_table(table)
+    for index, column_data in enumerate(column_data_list):
+        column = table.columns[index]
+        if 'name' in column_data and column.name != column_data['name']:
+            rename_stmt = (
+                f"ALTER TABLE {prepared_table_name}"
+                f" RENAME COLUMN {_preparer.format_column(column)}"
+                f" TO {_preparer.quote(column_data['name'])};"
+            )
+            execute_statement(engine, DDL(rename_stmt), connection)
 
 
 def batch_update_columns(table_oid, engine, column_data_list):
+    """
+    Changes the types of, drops, and renames the columns of a table.
+
+    All type changes (with their default re-casts) and drops are compiled
+    into a single ALTER TABLE statement, so that the table is rewritten at
+    most once.  Postgres doesn't allow RENAME COLUMN to be combined with
+    other actions, so renames follow as separate statements; they only
+    touch the catalog, and run in the same transaction, under the lock
+    already taken by the first statement.
+    """
     table = reflect_table_from_oid(table_oid, engine)
     _validate_columns_for_batch_update(table, column_data_list)
     with engine.begin() as conn:
-        _batch_update_column_types(table, column_data_list, conn, engine)
-        _batch_alter_table_columns(table, column_data_list, conn)
+        actions = _get_batch_retype_actions(table, column_data_list, conn, engine)
+        actions.extend(_get_batch_drop_actions(table, column_data_list, engine))
+        if actions:
+            try:
+                execute_alter_table_actions(table, engine, conn, actions)
+            except (DataError, InternalError) as e:
+                _raise_retype_error(e)
+        _batch_rename_columns(table, column_data_list, conn, engine)
@@ -1,39 +1,44 @@
-from alembic.migration import MigrationContext
-from alembic.operations import Operations
+from sqlalchemy import TEXT, bindparam, cast, false, func, select, text
 from sqlalchemy.ext import compiler
 from sqlalchemy.exc import DataError
-from sqlalchemy.schema import DDLElement
+from sqlalchemy.schema import CreateColumn, DDLElement
 from psycopg2.errors import InvalidTextRepresentation, InvalidParameterValue
 
 from db.columns.base import MathesarColumn
 from db.columns.defaults import DEFAULT, NAME, NULLABLE, TYPE
 from db.columns.exceptions import InvalidDefaultError, InvalidTypeError, InvalidTypeOptionError
-from db.columns.operations.alter import set_column_default, change_column_nullable
+from db.columns.operations.alter import (
+    execute_alter_table_actions, update_in_primary_key_batches, set_column_default,
+    change_column_nullable
+)
 from db.columns.operations.select import get_column_default, get_column_index_from_name
 from db.columns.utils import get_mathesar_column_with_engine
 from db.constraints.operations.create import copy_constraint
 from db.constraints.operations.select import get_column_constraints
 from db.constraints import utils as constraint_utils
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, get_operation_estimate
 from db.tables.operations.select import reflect_table_from_oid
+from db.tables.utils import get_primary_key_column
 from db.types.operations.cast import get_supported_alter_column_types
+from db.utils import execute_statement
 
 
 def create_column(engine, table_oid, column_data):
+    return batch_create_columns(engine, table_oid, [column_data])[0]
+
+
+def _get_mathesar_column(column_data, supported_types):
     column_type = column_data.get(TYPE, column_data.get("type"))
     column_type_options = column_data.get("type_options", {})
     column_nullable = column_data.get(NULLABLE, True)
-    supported_types = get_supported_alter_column_types(
-        engine, friendly_names=False,
-    )
     sa_type = supported_types.get(column_type)
     if sa_type is None:
         # Requested type not supported. falling back to VARCHAR
         sa_type = supported_types["VARCHAR"]
         column_type_options = {}
-    table = reflect_table_from_oid(table_oid, engine)
 
     try:
-        column = MathesarColumn(
+        return MathesarColumn(
             column_data[NAME], sa_type(**column_type_options), nullable=column_nullable,
             server_default=column_data.get(DEFAULT, None)
         )
@@ -43,12 +48,27 @@ def create_column(engine, table_oid, column_data):
         else:
             raise e
 
+
+def batch_create_columns(engine, table_oid, column_data_list):
+    """
+    Adds the given columns to a table with a single ALTER TABLE statement,
+    and returns the new columns (as MathesarColumns) in the order given.
+    """
+    supported_types = get_supported_alter_column_types(
+        engine, friendly_names=False,
+    )
+    columns = [
+        _get_mathesar_column(column_data, supported_types)
+        for column_data in column_data_list
+    ]
     table = reflect_table_from_oid(table_oid, engine)
+    actions = [
+        f"ADD COLUMN {CreateColumn(column).compile(dialect=engine.dialect)}"
+        for column in columns
+    ]
     try:
         with engine.begin() as conn:
-            ctx = MigrationContext.configure(conn)
-            op = Operations(ctx)
-            op.add_column(table.name, column, schema=table.schema)
+            execute_alter_table_actions(table, engine, conn, actions)
     except DataError as e:
         if type(e.orig) == InvalidTextRepresentation:
             raise InvalidDefaultError
@@ -57,10 +77,11 @@ def create_column(engine, table_oid, column_data):
         else:
             raise e
 
-    return get_mathesar_column_with_engine(
-        reflect_table_from_oid(table_oid, engine).columns[column_data[NAME]],
-        engine
-    )
+    table = reflect_table_from_oid(table_oid, engine)
+    return [
+        get_mathesar_column_with_engine(table.columns[column.name], engine)
+        for column in columns
+    ]
 
 
 def _gen_col_name(table, column_name):
@@ -101,12 +122,96 @@ def _duplicate_column_data(table_oid, from_column, to_column, engine):
     with engine.begin() as conn:
         conn.execute(copy)
 
+
+def copy_column_data_batched(
+        table_oid, from_column, to_column, engine, batch_size,
+        start_after=None, progress_callback=None,
+):
+    """
+    Copies the data between columns in batches of rows ordered by the
+    primary key, committing after each batch.  This avoids holding row
+    locks on the whole table, and lets vacuum reclaim dead tuples while
+    the copy runs.  The copy is not a consistent snapshot of the source
+    column; rows changed after their batch was copied keep the old value.
+    Returns the last primary key copied.  If a copy is interrupted, it can
+    be resumed by passing the last key given to `progress_callback` as
+    `start_after`.
+    """
+    table = reflect_table_from_oid(table_oid, engine)
+    primary_key_column = get_primary_key_column(table)
+    with engine.begin() as conn:
+        total_rows = execute_statement(
+            engine, select(func.count()).select_from(table), conn
+        ).scalar()
+    copy = table.update().values({table.c[to_column]: table.c[from_column]})
+    rows_done = 0
+    last_key = start_after
+    for last_key, batch_count in update_in_primary_key_batches(
+            engine, copy, primary_key_column, batch_size, start_after=start_after
+    ):
+        rows_done += batch_count
+        if progress_callback is not None:
+            progress_callback(rows_done, total_rows, last_key)
+    return last_key
+
+
+def _duplicate_column_default(table_oid, from_column, to_column, engine, drop_missing=False):
+    table = reflect_table_from_oid(table_oid, engine)
     from_default = get_column_default(table_oid, from_column, engine)
-    if from_default is not None:
+    if from_default is not None or drop_missing:
         with engine.begin() as conn:
             set_column_default(table, to_column, engine, conn, from_default)
 
 
+def _may_be_constant_column(table, column, engine):
+    """
+    Checks the planner statistics of a column for whether it may hold a
+    single value in every row, without reading the table.  Columns that
+    haven't been analyzed yet are assumed not to.
+    """
+    sel = text(
+        "SELECT s.null_frac, s.n_distinct, c.reltuples FROM pg_stats s"
+        " JOIN pg_namespace n ON n.nspname = s.schemaname"
+        " JOIN pg_class c ON c.relnamespace = n.oid AND c.relname = s.tablename"
+        " WHERE s.schemaname = :schema AND s.tablename = :table AND s.attname = :column"
+        " AND NOT s.inherited"
+    ).bindparams(
+        bindparam("schema", table.schema),
+        bindparam("table", table.name),
+        bindparam("column", column.name),
+    )
+    with engine.begin() as conn:
+        stats = execute_statement(engine, sel, conn).first()
+    if stats is None:
+        return False
+    null_frac, n_distinct, row_estimate = stats
+    if n_distinct < 0:
+        # A negative n_distinct is the number of distinct values divided by
+        # the number of rows, used when that's more than a tenth of the rows
+        # (e.g., for any column of a table with less than 10 rows).
+        n_distinct = -n_distinct * row_estimate
+    return null_frac == 1 or (null_frac == 0 and round(n_distinct) == 1)
+
+
+def _get_constant_column_value(table, column, engine):
+    """
+    Checks whether a column holds a single value in every row.  This takes
+    a full scan of the table.
+
+    Returns a tuple (is_constant, value), where value is the text
+    representation of the value (or None if the column holds only NULLs).
+    """
+    as_text = cast(column, TEXT)
+    sel = select(func.count(), func.count(column), func.min(as_text), func.max(as_text))
+    with engine.begin() as conn:
+        row_count, value_count, min_value, max_value = execute_statement(
+            engine, sel.select_from(table), conn
+        ).first()
+    if value_count == 0:
+        return True, None
+    return value_count == row_count and min_value == max_value, min_value
+
+
 def _duplicate_column_constraints(table_oid, from_column, to_column, engine, copy_nullable=True):
     table = reflect_table_from_oid(table_oid, engine)
     if copy_nullable:
@@ -124,9 +229,39 @@ def _duplicate_column_constraints(table_oid, from_column, to_column, engine, cop
         )
 
 
-def duplicate_column(table_oid, copy_from_index, engine, new_column_name=None, copy_data=True, copy_constraints=True):
+def duplicate_column(
+        table_oid, copy_from_index, engine, new_column_name=None, copy_data=True,
+        copy_constraints=True, batch_size=None, progress_callback=None,
+        dry_run=False,
+):
+    """
+    Adds a copy of a column to a table.
+
+    If the source column holds a single value (or only NULLs), the data is
+    copied by adding the column with that value as its default, which
+    Postgres stores in the catalog without rewriting the table.  Since
+    checking for this takes a full scan, it's only done when the planner
+    statistics of the column suggest that it's constant.  Otherwise,
+    the data is copied with a single UPDATE, or, if `batch_size` is given,
+    with `copy_column_data_batched`; in that case, `progress_callback` is
+    called with (rows_done, total_rows, last_key) after each batch.
+
+    If `dry_run` is set, nothing is changed, and an estimate of the cost of
+    the copy is returned instead (see `get_operation_estimate`).  Checking
+    whether the source column is constant takes a full scan, so the
+    estimate assumes that it isn't.
+    """
     table = reflect_table_from_oid(table_oid, engine)
     from_column = table.c[copy_from_index]
+    if dry_run:
+        copy_sel = select(from_column)
+        if not copy_data:
+            copy_sel = copy_sel.where(false())
+        # Adding the column doesn't rewrite the table, but the UPDATE writes
+        # a new version of each row.
+        return get_operation_estimate(
+            engine, [table_oid], copy_sel, rewrite=False, lock=ACCESS_EXCLUSIVE
+        )
     if new_column_name is None:
         new_column_name = _gen_col_name(table, from_column.name)
 
@@ -135,15 +270,38 @@ def duplicate_column(table_oid, copy_from_index, engine, new_column_name=None, c
         "type": from_column.type.compile(dialect=engine.dialect),
         NULLABLE: True,
     }
+    is_constant = False
+    if copy_data and _may_be_constant_column(table, from_column, engine):
+        is_constant, constant_value = _get_constant_column_value(table, from_column, engine)
+        if is_constant and constant_value is not None:
+            column_data[DEFAULT] = constant_value
     new_column = create_column(engine, table_oid, column_data)
     new_column_index = get_column_index_from_name(table_oid, new_column.name, engine)
 
+    if copy_data and not is_constant:
+        if batch_size is None:
+            _duplicate_column_data(
+                table_oid,
+                copy_from_index,
+                new_column_index,
+                engine
+            )
+        else:
+            copy_column_data_batched(
+                table_oid,
+                copy_from_index,
+                new_column_index,
+                engine,
+                batch_size,
+                progress_callback=progress_callback,
+            )
     if copy_data:
-        _duplicate_column_data(
+        _duplicate_column_default(
             table_oid,
             copy_from_index,
             new_column_index,
-            engine
+            engine,
+            drop_missing=DEFAULT in column_data,
         )
 
     if copy_constraints:
@@ -1,6 +1,7 @@
 from alembic.migration import MigrationContext
 from alembic.operations import Operations
 
+from db.columns.operations.alter import execute_alter_table_actions
 from db.tables.operations.select import reflect_table_from_oid
 
 
@@ -12,3 +13,16 @@ def drop_column(table_oid, column_index, engine):
         ctx = MigrationContext.configure(conn)
         op = Operations(ctx)
         op.drop_column(table.name, column.name, schema=table.schema)
+
+
+def batch_drop_columns(table_oid, column_indexes, engine):
+    """
+    Drops the columns at the given indexes with a single ALTER TABLE
+    statement.
+    """
+    table = reflect_table_from_oid(table_oid, engine)
+    columns = [table.columns[int(column_index)] for column_index in dict.fromkeys(column_indexes)]
+    _preparer = engine.dialect.identifier_preparer
+    actions = [f"DROP COLUMN {_preparer.format_column(column)}" for column in columns]
+    with engine.begin() as conn:
+        execute_alter_table_actions(table, engine, conn, actions)
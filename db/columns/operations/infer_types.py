@@ -1,12 +1,15 @@
 import logging
 
-from sqlalchemy import VARCHAR, TEXT, Text
+from sqlalchemy import VARCHAR, TEXT, Text, func, or_, true
 from sqlalchemy.exc import DatabaseError
+from sqlalchemy.sql import quoted_name
+from sqlalchemy.sql.functions import Function
 
 from db.columns.exceptions import DagCycleError
 from db.columns.operations.alter import alter_column_type
 from db.tables.operations.select import reflect_table
-from db.types.operations.cast import get_supported_alter_column_types
+from db.types.operations.cast import get_supported_alter_column_types, get_try_cast_function_name
+from db.types.operations.python_cast import PythonCastError, cast_column_values
 from db.types import base
 
 
@@ -49,6 +52,77 @@ def _get_reverse_type_map(engine):
     return reverse_type_map
 
 
+def get_column_type_str(column, engine):
+    """
+    Gives the key of the type_inference_dag corresponding to the type of
+    the given column (or None if the type isn't in the DAG).
+    """
+    return _get_reverse_type_map(engine).get(column.type.__class__)
+
+
+def get_type_inference_paths(column_type_str, depth=0, type_inference_dag=TYPE_INFERENCE_DAG):
+    """
+    Returns a list of all paths through the type_inference_dag starting
+    from (but not including) the given type.  Each path is a tuple of
+    type strings, giving the sequence of casts needed to get there.
+    """
+    if depth > MAX_INFERENCE_DAG_DEPTH:
+        raise DagCycleError("The type_inference_dag likely has a cycle")
+    paths = []
+    for type_str in type_inference_dag.get(column_type_str, []):
+        paths.append((type_str,))
+        paths.extend(
+            (type_str,) + sub_path
+            for sub_path in get_type_inference_paths(
+                type_str, depth=depth + 1, type_inference_dag=type_inference_dag
+            )
+        )
+    return paths
+
+
+def get_type_inference_path_check(column, path, engine):
+    """
+    Returns an aggregate expression that is true if every value of the
+    column survives the sequence of casts given by the path.  The casts
+    use the non-raising try_cast_to_<type> functions, so checking the
+    path never raises, and NULLs are considered castable to any type.
+    """
+    supported_types = get_supported_alter_column_types(engine)
+    cast_expr = column
+    for type_str in path:
+        prepared_type_name = supported_types[type_str]().compile(dialect=engine.dialect)
+        cast_expr = Function(
+            quoted_name(get_try_cast_function_name(prepared_type_name), False),
+            cast_expr,
+        )
+    # An aggregate over zero rows is NULL, but an empty column can be
+    # altered to any type.
+    return func.coalesce(
+        func.bool_and(or_(column.is_(None), cast_expr.isnot(None))),
+        true(),
+    )
+
+
+def walk_type_inference_dag(column_type_str, path_is_valid, type_inference_dag=TYPE_INFERENCE_DAG):
+    """
+    Walks the type_inference_dag the same way as infer_column_type, but
+    using a precomputed map from paths (as given by
+    get_type_inference_paths) to whether the column can be cast along
+    that path.  Returns the chosen path; the inferred type is its last
+    element, or the original type if the path is empty.
+    """
+    path = ()
+    for _ in range(MAX_INFERENCE_DAG_DEPTH + 1):
+        for type_str in type_inference_dag.get(column_type_str, []):
+            if path_is_valid[path + (type_str,)]:
+                path = path + (type_str,)
+                column_type_str = type_str
+                break
+        else:
+            return path
+    raise DagCycleError("The type_inference_dag likely has a cycle")
+
+
 def infer_column_type(schema, table_name, column_name, engine, depth=0, type_inference_dag=TYPE_INFERENCE_DAG):
     if depth > MAX_INFERENCE_DAG_DEPTH:
         raise DagCycleError("The type_inference_dag likely has a cycle")
@@ -80,3 +154,39 @@ def infer_column_type(schema, table_name, column_name, engine, depth=0, type_inf
                 f"Cannot alter column {column_name} to type {type_str}"
             )
     return column_type
+
+
+def infer_column_type_from_values(
+        values, column_type_str=base.STRING, depth=0,
+        type_inference_dag=TYPE_INFERENCE_DAG,
+):
+    """
+    Infers a type for a column given a list of its (Python) values, without
+    touching the DB.  The type_inference_dag is walked in the same way as
+    in infer_column_type, but each candidate type is checked by casting the
+    whole list of values in Python, rather than by altering a DB column.
+
+    Null and empty values are ignored, since they'd be loaded as NULL.
+
+    Returns the type string (a key or value of the type_inference_dag).
+    """
+    if depth > MAX_INFERENCE_DAG_DEPTH:
+        raise DagCycleError("The type_inference_dag likely has a cycle")
+    if depth == 0:
+        values = [value for value in values if value is not None and value != '']
+
+    for type_str in type_inference_dag.get(column_type_str, []):
+        try:
+            cast_values = cast_column_values(values, type_str)
+        # It's expected we catch this error when the test to see whether
+        # a type is appropriate for a column fails.
+        except PythonCastError:
+            logger.debug(f"Cannot cast values to type {type_str}")
+            continue
+        return infer_column_type_from_values(
+            cast_values,
+            column_type_str=type_str,
+            depth=depth + 1,
+            type_inference_dag=type_inference_dag,
+        )
+    return column_type_str
@@ -30,6 +30,22 @@ def get_columns_attnum_from_names(table_oid, column_names, engine, connection_to
     return execute_statement(engine, sel, connection_to_use).fetchall()
 
 
+def get_columns_attnum_map_from_names(table_oid, column_names, engine, connection_to_use=None):
+    """
+    Returns a dict mapping each of the given column names to its attnum.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Did not recognize type")
+        pg_attribute = Table("pg_attribute", MetaData(), autoload_with=engine)
+    sel = select(pg_attribute.c.attname, pg_attribute.c.attnum).where(
+        and_(
+            pg_attribute.c.attrelid == table_oid,
+            pg_attribute.c.attname.in_(column_names)
+        )
+    )
+    return dict(execute_statement(engine, sel, connection_to_use).fetchall())
+
+
 def get_column_index_from_name(table_oid, column_name, engine, connection_to_use=None):
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Did not recognize type")
@@ -0,0 +1,4 @@
+class DuplicateValuesError(Exception):
+    def __init__(self, duplicate_groups):
+        self.duplicate_groups = duplicate_groups
+        super().__init__(f"{len(duplicate_groups)} groups of values are duplicated")
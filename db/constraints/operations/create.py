@@ -1,8 +1,18 @@
 from alembic.migration import MigrationContext
 from alembic.operations import Operations
-from sqlalchemy import MetaData
+from sqlalchemy import DDL, MetaData
+from sqlalchemy.exc import DBAPIError
+from psycopg2.errors import DuplicateTable
 
-from db.constraints.utils import get_constraint_type_from_char, ConstraintType, naming_convention
+from db.constraints.exceptions import DuplicateValuesError
+from db.constraints.utils import (
+    get_constraint_name, get_constraint_type_from_char, ConstraintType, naming_convention
+)
+from db.records.operations.select import get_duplicate_groups
+from db.tables.operations.select import reflect_table
+from db.utils import execute_statement
+
+DUPLICATE_GROUPS_LIMIT = 20
 
 
 def create_unique_constraint(table_name, schema, engine, columns, constraint_name=None):
@@ -16,6 +26,81 @@ def create_unique_constraint(table_name, schema, engine, columns, constraint_nam
         op.create_unique_constraint(constraint_name, table_name, columns, schema)
 
 
+def create_unique_constraint_concurrently(
+        table_name, schema, engine, columns, constraint_name=None,
+        duplicate_groups_limit=DUPLICATE_GROUPS_LIMIT,
+):
+    """
+    Creates a unique constraint without blocking writes to the table while
+    its index is built.
+
+    The table is first checked for duplicate values in the columns; if
+    there are any, a DuplicateValuesError holding (up to
+    `duplicate_groups_limit` of) the conflicting groups is raised before
+    anything is built.  The index is then built with CREATE UNIQUE INDEX
+    CONCURRENTLY, which can't run in a transaction, and attached as the
+    constraint with a quick ADD CONSTRAINT ... USING INDEX.  If the build
+    fails or is interrupted (e.g., because duplicates were inserted during
+    it), the invalid index it leaves behind is dropped, and so is the index
+    if it can't be attached.
+    """
+    table = reflect_table(table_name, schema, engine)
+    duplicate_groups = get_duplicate_groups(
+        table, engine, columns, limit=duplicate_groups_limit
+    )
+    if duplicate_groups:
+        raise DuplicateValuesError([dict(group._mapping) for group in duplicate_groups])
+
+    if constraint_name is None:
+        constraint_name = get_constraint_name(
+            ConstraintType.UNIQUE.value, table_name, columns[0]
+        )
+    _preparer = engine.dialect.identifier_preparer
+    prepared_table_name = _preparer.format_table(table)
+    prepared_index_name = _preparer.quote(constraint_name)
+    prepared_columns = ', '.join(_preparer.format_column(table.c[col]) for col in columns)
+    create_index_stmt = (
+        f"CREATE UNIQUE INDEX CONCURRENTLY {prepared_index_name}"
+        f" ON {prepared_table_name} ({prepared_columns})"
+    )
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            execute_statement(engine, DDL(create_index_stmt), conn)
+    except DBAPIError as e:
+        # If the name is taken, the index isn't ours to drop.
+        if not isinstance(e.orig, DuplicateTable):
+            _drop_index_concurrently(engine, schema, constraint_name)
+        raise
+    except BaseException:
+        _drop_index_concurrently(engine, schema, constraint_name)
+        raise
+
+    add_constraint_stmt = (
+        f"ALTER TABLE {prepared_table_name} ADD CONSTRAINT {prepared_index_name}"
+        f" UNIQUE USING INDEX {prepared_index_name}"
+    )
+    try:
+        with engine.begin() as conn:
+            execute_statement(engine, DDL(add_constraint_stmt), conn)
+    except BaseException:
+        _drop_index_concurrently(engine, schema, constraint_name)
+        raise
+
+
+def _drop_index_concurrently(engine, schema, index_name):
+    """
+    Drops an index left behind by a failed (or interrupted) concurrent
+    build, or one that couldn't be attached as a constraint.
+    """
+    _preparer = engine.dialect.identifier_preparer
+    drop_index_stmt = (
+        f"DROP INDEX CONCURRENTLY IF EXISTS"
+        f" {_preparer.quote_schema(schema)}.{_preparer.quote(index_name)}"
+    )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        execute_statement(engine, DDL(drop_index_stmt), conn)
+
+
 def copy_constraint(table, engine, constraint, from_column, to_column):
     constraint_type = get_constraint_type_from_char(constraint.contype)
     if constraint_type == ConstraintType.UNIQUE.value:
@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine
 from db import types
+from db.admission import AdmittedQueuePool, get_database_key
 
 
 def get_connection_string(username, password, hostname, database, port='5432'):
@@ -25,7 +26,12 @@ def create_future_engine(
         username, password, hostname, database, port
     )
     kwargs.update(future=True)
-    return create_engine(conn_str, *args, **kwargs)
+    kwargs.setdefault("poolclass", AdmittedQueuePool)
+    engine = create_engine(conn_str, *args, **kwargs)
+    # Connections hold a query slot on the database (see db.admission)
+    if isinstance(engine.pool, AdmittedQueuePool):
+        engine.pool.database_key = get_database_key(engine)
+    return engine
 
 
 def _add_custom_types_to_engine(engine):
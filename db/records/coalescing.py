@@ -0,0 +1,147 @@
+"""
+Coalescing of identical record queries.
+
+Concurrent identical reads (same table, compiled SQL, parameters, and
+query options) share a single execution: the first caller runs the query,
+and the others wait for its result.  Results are then kept for a short
+time, so that identical reads arriving just after also share them.
+
+Tables are identified by their oid, so a table that is dropped and
+recreated under the same name doesn't share results with the old one.
+The results of a table are dropped by `invalidate_table_results`, which
+should be called after writing to the table.  Since the cache lives in
+this process, writes made elsewhere are only seen once the results
+expire, unless the table's data version is part of the key (see
+`execute_coalesced`).
+"""
+import threading
+import time
+
+# In seconds
+DEFAULT_RESULT_TTL = 2
+DEFAULT_MAX_RESULTS = 256
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class QueryCoalescer:
+    def __init__(self, result_ttl=DEFAULT_RESULT_TTL, max_results=DEFAULT_MAX_RESULTS):
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self._lock = threading.Lock()
+        self._calls = {}
+        # Maps keys to (expiry time, result), in insertion order
+        self._results = {}
+        # Bumped by each invalidation, so that reads started before a write
+        # neither share nor cache results with reads started after it
+        self._generations = {}
+
+    def _get_cached_result(self, key, now):
+        cached = self._results.get(key)
+        if cached is None:
+            return False, None
+        expires_at, result = cached
+        if expires_at <= now:
+            del self._results[key]
+            return False, None
+        return True, result
+
+    def _cache_result(self, key, result, now):
+        if self.result_ttl <= 0 or self.max_results <= 0:
+            return
+        self._results[key] = (now + self.result_ttl, result)
+        if len(self._results) > self.max_results:
+            for cached_key in [k for k, (e, _) in self._results.items() if e <= now]:
+                del self._results[cached_key]
+        while len(self._results) > self.max_results:
+            del self._results[next(iter(self._results))]
+
+    def execute(self, table_key, query_key, run_query):
+        """
+        Returns the result of `run_query()`, sharing it with the identical
+        queries (by `query_key`) on the same table (by `table_key`).
+        """
+        with self._lock:
+            key = (table_key, self._generations.get(table_key, 0), query_key)
+            found, result = self._get_cached_result(key, time.monotonic())
+            if found:
+                return result
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = run_query()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and key[1] == self._generations.get(table_key, 0):
+                    self._cache_result(key, call.result, time.monotonic())
+            call.done.set()
+        return call.result
+
+    def invalidate(self, table_key):
+        with self._lock:
+            self._generations[table_key] = self._generations.get(table_key, 0) + 1
+            for key in [k for k in self._results if k[0] == table_key]:
+                del self._results[key]
+
+
+_coalescer = QueryCoalescer()
+
+
+def configure_coalescing(**coalescer_options):
+    """
+    Replaces the coalescer with one using the given options (see
+    `QueryCoalescer`).
+    """
+    global _coalescer
+    _coalescer = QueryCoalescer(**coalescer_options)
+
+
+def _get_table_key(engine, table_oid):
+    url = engine.url
+    return (f"{url.host}:{url.port}/{url.database}", table_oid)
+
+
+def _get_query_key(engine, query, query_options=None):
+    compiled = query.compile(dialect=engine.dialect)
+    return (
+        str(compiled),
+        repr(sorted(compiled.params.items())),
+        # Queries only share an execution (and so its timeouts, errors and
+        # query tag) with queries run with the same options.
+        repr(sorted((query_options or {}).items())),
+    )
+
+
+def execute_coalesced(engine, table_oid, query, run_query, query_options=None, data_version=None):
+    """
+    Runs `run_query()` (which should execute `query` with `query_options` on
+    the table), coalescing it with identical queries.  If the data version
+    of the table is given, it's part of the key, so that a result is never
+    shared with a query made after the table's data changed.
+    """
+    return _coalescer.execute(
+        _get_table_key(engine, table_oid),
+        (data_version,) + _get_query_key(engine, query, query_options),
+        run_query,
+    )
+
+
+def invalidate_table_results(engine, table_oid):
+    _coalescer.invalidate(_get_table_key(engine, table_oid))
@@ -8,3 +8,11 @@ class BadGroupFormat(Exception):
 
 class GroupFieldNotFound(FieldNotFound):
     pass
+
+
+class BadProjectionFormat(Exception):
+    pass
+
+
+class ProjectionFieldNotFound(FieldNotFound):
+    pass
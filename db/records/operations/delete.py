@@ -1,10 +1,13 @@
 from sqlalchemy import delete
 
+from db.admission import admit
 from db.tables.utils import get_primary_key_column
+from db.utils import set_local_query_options
 
 
-def delete_record(table, engine, id_value):
+def delete_record(table, engine, id_value, query_options=None):
     primary_key_column = get_primary_key_column(table)
     query = delete(table).where(primary_key_column == id_value)
-    with engine.begin() as conn:
+    with admit(engine), engine.begin() as conn:
+        set_local_query_options(conn, **(query_options or {}))
         return conn.execute(query)
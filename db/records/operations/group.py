@@ -1,9 +1,10 @@
 from sqlalchemy import select, Column, func
 
+from db.admission import admit
 from db.records.exceptions import BadGroupFormat, GroupFieldNotFound
 from db.records.operations.select import get_query, apply_filters
 from db.records.utils import create_col_objects
-from db.utils import execute_query
+from db.utils import execute_query, set_local_query_options
 
 
 def append_distinct_tuples_to_filter(distinct_tuples):
@@ -18,7 +19,8 @@ def append_distinct_tuples_to_filter(distinct_tuples):
 
 
 def get_distinct_tuple_values(
-        column_list, engine, table=None, limit=None, offset=None, output_table=None
+        column_list, engine, table=None, limit=None, offset=None, output_table=None,
+        query_options=None,
 ):
     """
     Returns distinct tuples from a given list of columns.
@@ -48,21 +50,26 @@ def get_distinct_tuple_values(
         .limit(limit)
         .offset(offset)
     )
-    result = execute_query(engine, query)
+    with admit(engine), engine.begin() as conn:
+        set_local_query_options(conn, **(query_options or {}))
+        result = execute_query(engine, query, conn)
     if output_table is not None:
         column_objects = [output_table.columns[col.name] for col in column_objects]
     return [tuple(zip(column_objects, row)) for row in result]
 
 
 def _get_filtered_group_by_count_query(
-        table, engine, group_by, limit, offset, order_by, filters, count_query
+        table, engine, group_by, limit, offset, order_by, filters, count_query,
+        query_options=None,
 ):
     # Get the list of groups that we should count.
     # We're considering limit and offset here so that we only count relevant groups
     relevant_subtable_query = get_query(table, limit, offset, order_by, filters)
     relevant_subtable_cte = relevant_subtable_query.cte()
     cte_columns = create_col_objects(relevant_subtable_cte, group_by)
-    distinct_tuples = get_distinct_tuple_values(cte_columns, engine, output_table=table)
+    distinct_tuples = get_distinct_tuple_values(
+        cte_columns, engine, output_table=table, query_options=query_options
+    )
     if distinct_tuples:
         limited_filters = [
             {
@@ -78,7 +85,10 @@ def _get_filtered_group_by_count_query(
     return filtered_count_query
 
 
-def get_group_counts(table, engine, group_by, limit=None, offset=None, order_by=[], filters=[]):
+def get_group_counts(
+        table, engine, group_by, limit=None, offset=None, order_by=[], filters=[],
+        query_options=None,
+):
     """
     Returns counts by specified groupings
 
@@ -94,6 +104,8 @@ def get_group_counts(table, engine, group_by, limit=None, offset=None, order_by=
         filters:  list of dictionaries, where each dictionary has a 'field' and 'op'
                   field, in addition to an 'value' field if appropriate.
                   See: https://github.com/centerofci/sqlalchemy-filters#filters-format
+        query_options: dict of options for the transaction running the query,
+                  see `db.utils.set_local_query_options`.
     """
     if type(group_by) not in (tuple, list):
         raise BadGroupFormat(f"Group spec {group_by} must be list or tuple.")
@@ -112,10 +124,13 @@ def get_group_counts(table, engine, group_by, limit=None, offset=None, order_by=
     if filters is not None:
         count_query = apply_filters(count_query, filters)
     filtered_count_query = _get_filtered_group_by_count_query(
-        table, engine, group_by, limit, offset, order_by, filters, count_query
+        table, engine, group_by, limit, offset, order_by, filters, count_query,
+        query_options=query_options,
     )
     if filtered_count_query is not None:
-        records = execute_query(engine, filtered_count_query)
+        with admit(engine), engine.begin() as conn:
+            set_local_query_options(conn, **(query_options or {}))
+            records = execute_query(engine, filtered_count_query, conn)
         # Last field is the count, preceding fields are the group by fields
         counts = {(*record[:-1],): record[-1] for record in records}
     else:
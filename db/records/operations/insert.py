@@ -1,20 +1,27 @@
 import tempfile
 
 from psycopg2 import sql
+from sqlalchemy import Column, MetaData, String, Table, select
 
+from db import constants
+from db.admission import admit
 from db.encoding_utils import get_sql_compatible_encoding
 from db.records.operations.select import get_record
+from db.types.operations.cast import get_column_cast_expression
+from db.utils import set_local_query_options
 
 READ_SIZE = 20000
+TEMP_CSV_TABLE_NAME = f"{constants.MATHESAR_PREFIX}temp_csv_table"
 
 
-def insert_record_or_records(table, engine, record_data):
+def insert_record_or_records(table, engine, record_data, query_options=None):
     """
     record_data can be a dictionary, tuple, or list of dictionaries or tuples.
     if record_data is a list, it creates multiple records.
     """
     id_value = None
-    with engine.begin() as connection:
+    with admit(engine), engine.begin() as connection:
+        set_local_query_options(connection, **(query_options or {}))
         result = connection.execute(table.insert(), record_data)
         # If there was only a single record created, return the record.
         if result.rowcount == 1:
@@ -22,53 +29,101 @@ def insert_record_or_records(table, engine, record_data):
             connection.commit()
             id_value = result.inserted_primary_key[0]
             if id_value is not None:
-                return get_record(table, engine, id_value)
+                return get_record(table, engine, id_value, query_options)
     # Do not return any records if multiple rows were added.
     return None
 
 
+def _copy_csv_into_relation(
+        conn, relation_parts, csv_file, column_names, header,
+        delimiter=None, escape=None, quote=None, encoding=None
+):
+    cursor = conn.connection.cursor()
+    # We should convert our entire query to sql.SQL class in order to keep its original header's name
+    # When we call sql.Indentifier which will return a Identifier class (based on sql.Composable)
+    # instead of a String. So we have to convert our punctuations to sql.Composable using sql.SQL
+    relation = sql.SQL(".").join(
+        sql.Identifier(part) for part in relation_parts
+    )
+    formatted_columns = sql.SQL(",").join(
+        sql.Identifier(column_name) for column_name in column_names
+    )
+    conversion_encoding, sql_encoding = get_sql_compatible_encoding(encoding)
+    copy_sql = sql.SQL(
+        "COPY {relation} ({formatted_columns}) FROM STDIN CSV {header} {delimiter} {escape} {quote} {encoding}"
+    ).format(
+        relation=relation,
+        formatted_columns=formatted_columns,
+        # If HEADER is not None, we'll pass its value to our entire SQL query
+        header=sql.SQL("HEADER" if header else ""),
+        # If DELIMITER is not None, we'll pass its value to our entire SQL query
+        delimiter=sql.SQL(f"DELIMITER E'{delimiter}'" if delimiter else ""),
+        # If ESCAPE is not None, we'll pass its value to our entire SQL query
+        escape=sql.SQL(f"ESCAPE '{escape}'" if escape else ""),
+        quote=sql.SQL(
+            ("QUOTE ''''" if quote == "'" else f"QUOTE '{quote}'")
+            if quote
+            else ""
+        ),
+        encoding=sql.SQL(f"ENCODING '{sql_encoding}'" if sql_encoding else ""),
+    )
+    if conversion_encoding == encoding:
+        cursor.copy_expert(copy_sql, csv_file)
+    else:
+        # File needs to be converted to compatible database supported encoding
+        with tempfile.SpooledTemporaryFile(mode='wb+', encoding=conversion_encoding) as temp_file:
+            while True:
+                # TODO: Raise an exception instead of silently replacing the characters
+                contents = csv_file.read(READ_SIZE).encode(conversion_encoding, "replace")
+                if not contents:
+                    break
+                temp_file.write(contents)
+            temp_file.seek(0)
+            cursor.copy_expert(copy_sql, temp_file)
+
+
 def insert_records_from_csv(table, engine, csv_filename, column_names, header, delimiter=None, escape=None, quote=None, encoding=None):
     with open(csv_filename, "r", encoding=encoding) as csv_file:
-        with engine.begin() as conn:
-            cursor = conn.connection.cursor()
-            # We should convert our entire query to sql.SQL class in order to keep its original header's name
-            # When we call sql.Indentifier which will return a Identifier class (based on sql.Composable)
-            # instead of a String. So we have to convert our punctuations to sql.Composable using sql.SQL
-            relation = sql.SQL(".").join(
-                sql.Identifier(part) for part in (table.schema, table.name)
+        with admit(engine), engine.begin() as conn:
+            _copy_csv_into_relation(
+                conn, (table.schema, table.name), csv_file, column_names, header,
+                delimiter=delimiter, escape=escape, quote=quote, encoding=encoding
             )
-            formatted_columns = sql.SQL(",").join(
-                sql.Identifier(column_name) for column_name in column_names
+
+
+def insert_records_from_csv_with_casts(table, engine, csv_filename, column_names, header, delimiter=None, escape=None, quote=None, encoding=None):
+    """
+    Loads a CSV file into a table whose columns may have non-textual types.
+
+    The file is copied into a temporary all-text table, which is then
+    inserted into the given table in a single statement, using the Mathesar
+    cast_to_<type> functions to cast each column to its type in the given
+    table.  This way, values are cast with the same semantics used when
+    altering column types, rather than with the type input functions used
+    by a direct COPY.  The temporary table is dropped on commit.
+    """
+    temp_table = Table(
+        TEMP_CSV_TABLE_NAME,
+        MetaData(),
+        *[Column(column_name, String) for column_name in column_names],
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+    cast_columns = [
+        get_column_cast_expression(
+            temp_table.columns[column_name],
+            table.columns[column_name].type.__class__().compile(dialect=engine.dialect),
+            engine,
+        )
+        for column_name in column_names
+    ]
+    with open(csv_filename, "r", encoding=encoding) as csv_file:
+        with admit(engine), engine.begin() as conn:
+            temp_table.create(conn)
+            _copy_csv_into_relation(
+                conn, (temp_table.name,), csv_file, column_names, header,
+                delimiter=delimiter, escape=escape, quote=quote, encoding=encoding
             )
-            conversion_encoding, sql_encoding = get_sql_compatible_encoding(encoding)
-            copy_sql = sql.SQL(
-                "COPY {relation} ({formatted_columns}) FROM STDIN CSV {header} {delimiter} {escape} {quote} {encoding}"
-            ).format(
-                relation=relation,
-                formatted_columns=formatted_columns,
-                # If HEADER is not None, we'll pass its value to our entire SQL query
-                header=sql.SQL("HEADER" if header else ""),
-                # If DELIMITER is not None, we'll pass its value to our entire SQL query
-                delimiter=sql.SQL(f"DELIMITER E'{delimiter}'" if delimiter else ""),
-                # If ESCAPE is not None, we'll pass its value to our entire SQL query
-                escape=sql.SQL(f"ESCAPE '{escape}'" if escape else ""),
-                quote=sql.SQL(
-                    ("QUOTE ''''" if quote == "'" else f"QUOTE '{quote}'")
-                    if quote
-                    else ""
-                ),
-                encoding=sql.SQL(f"ENCODING '{sql_encoding}'" if sql_encoding else ""),
+            conn.execute(
+                table.insert().from_select(column_names, select(*cast_columns))
             )
-            if conversion_encoding == encoding:
-                cursor.copy_expert(copy_sql, csv_file)
-            else:
-                # File needs to be converted to compatible database supported encoding
-                with tempfile.SpooledTemporaryFile(mode='wb+', encoding=conversion_encoding) as temp_file:
-                    while True:
-                        # TODO: Raise an exception instead of silently replacing the characters
-                        contents = csv_file.read(READ_SIZE).encode(conversion_encoding, "replace")
-                        if not contents:
-                            break
-                        temp_file.write(contents)
-                    temp_file.seek(0)
-                    cursor.copy_expert(copy_sql, temp_file)
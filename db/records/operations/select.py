@@ -1,14 +1,20 @@
-from sqlalchemy import select, func, true, and_
+from sqlalchemy import Enum, LargeBinary, String, select, func, true, and_
 from sqlalchemy_filters import apply_filters, apply_sort
 from sqlalchemy_filters.exceptions import BadFilterFormat, FilterFieldNotFound
 
+from db.admission import admit
 from db.columns.base import MathesarColumn
+from db.records.coalescing import execute_coalesced
+from db.records.exceptions import BadProjectionFormat, ProjectionFieldNotFound
+from db.tables.operations.select import get_oid_from_table
 from db.tables.utils import get_primary_key_column
-from db.types.operations.cast import get_column_cast_expression
-from db.utils import execute_query
+from db.types.operations.cast import get_column_cast_expression, get_column_try_cast_expression
+from db.utils import execute_query, set_local_query_options
 
 
 DUPLICATE_LABEL = "_is_dupe"
+DUPLICATE_COUNT_LABEL = "_dupe_count"
+CAST_FAILURE_COUNT_LABEL = "_cast_failure_count"
 CONJUNCTIONS = ("and", "or", "not")
 
 
@@ -43,6 +49,29 @@ def _create_query_with_duplicate_filter(table, duplicate_columns, cols=None):
     return query
 
 
+def get_duplicate_groups(table, engine, duplicate_columns, limit=None):
+    """
+    Returns the groups of values of the given columns that appear in more
+    than one row, along with the number of rows in each group (labeled
+    with DUPLICATE_COUNT_LABEL).  Unlike the get_duplicates filter, this
+    doesn't return the rows themselves, so it needs only a single grouped
+    scan of the table.  Groups containing NULLs are skipped, since they
+    don't conflict in a unique constraint.
+    """
+    for col in duplicate_columns:
+        if col not in table.c:
+            raise FilterFieldNotFound(f"Table {table.name} has no column `{col}`.")
+    table_duplicate_columns = [table.c[col] for col in duplicate_columns]
+    query = (
+        select(*table_duplicate_columns, func.count().label(DUPLICATE_COUNT_LABEL))
+        .where(and_(*[c.isnot(None) for c in table_duplicate_columns]))
+        .group_by(*table_duplicate_columns)
+        .having(func.count() > 1)
+        .limit(limit)
+    )
+    return execute_query(engine, query)
+
+
 def _get_duplicate_data_columns(table, filters):
     try:
         duplicate_ops = [f for f in filters if f.get("op") == "get_duplicates"]
@@ -64,6 +93,60 @@ def _get_duplicate_data_columns(table, filters):
         return None, filters
 
 
+def get_projected_columns(table, columns):
+    """
+    Returns the columns of the table to select for the given list of column
+    names, which always include the primary key columns.  The columns are
+    kept in table order.  With no list, all the columns are selected.
+    """
+    if columns is None:
+        return list(table.c)
+    if not isinstance(columns, list) or not all(isinstance(col, str) for col in columns):
+        raise BadProjectionFormat("columns must be a list of column names")
+    for col in columns:
+        if col not in table.c:
+            raise ProjectionFieldNotFound(f"Table {table.name} has no column `{col}`.")
+    return [col for col in table.c if col.name in columns or col.primary_key]
+
+
+def _is_previewed_column(col):
+    # Enums subclass String, but left() and char_length() don't take them
+    return isinstance(col.type, (String, LargeBinary)) and not isinstance(col.type, Enum)
+
+
+def get_preview_column_names(table, columns=None):
+    """
+    Returns the names of the text and binary columns among the projected
+    columns, whose full lengths get_records returns after the projected
+    columns when given a preview_length, in that order.
+    """
+    return [col.name for col in get_projected_columns(table, columns) if _is_previewed_column(col)]
+
+
+def _get_preview_columns(cols, preview_length):
+    """
+    Replaces the text and binary columns with their first preview_length
+    characters (or bytes), and appends their full lengths after all the
+    other columns.  The lengths have anonymous labels, so they can only be
+    told apart from the columns by their position.
+    """
+    preview_cols = []
+    length_cols = []
+    for col in cols:
+        if not _is_previewed_column(col):
+            preview_cols.append(col)
+            continue
+        if isinstance(col.type, String):
+            preview_cols.append(func.left(col, preview_length).label(col.name))
+            length = func.char_length(col)
+        else:
+            # left() only works on text in Postgres 13
+            preview_cols.append(func.substring(col, 1, preview_length).label(col.name))
+            length = func.octet_length(col)
+        length_cols.append(length.label(None))
+    return preview_cols + length_cols
+
+
 def get_query(table, limit, offset, order_by, filters, cols=None):
     duplicate_columns, filters = _get_duplicate_data_columns(table, filters)
     if duplicate_columns:
@@ -79,16 +162,38 @@ def get_query(table, limit, offset, order_by, filters, cols=None):
     return query
 
 
-def get_record(table, engine, id_value):
+def _execute_records_query(
+        table, engine, query, query_options=None, coalesce=False, table_oid=None,
+        data_version=None,
+):
+    def run_query():
+        with admit(engine), engine.begin() as conn:
+            set_local_query_options(conn, **(query_options or {}))
+            return execute_query(engine, query, conn)
+    if coalesce:
+        if table_oid is None:
+            table_oid = get_oid_from_table(table.name, table.schema, engine)
+        return execute_coalesced(
+            engine, table_oid, query, run_query, query_options, data_version
+        )
+    return run_query()
+
+
+def get_record(table, engine, id_value, query_options=None, columns=None):
     primary_key_column = get_primary_key_column(table)
-    query = select(table).where(primary_key_column == id_value)
-    result = execute_query(engine, query)
+    cols = get_projected_columns(table, columns)
+    query = select(*cols).where(primary_key_column == id_value)
+    with admit(engine), engine.begin() as conn:
+        set_local_query_options(conn, **(query_options or {}))
+        result = execute_query(engine, query, conn)
     assert len(result) <= 1
     return result[0] if result else None
 
 
 def get_records(
         table, engine, limit=None, offset=None, order_by=[], filters=[],
+        query_options=None, coalesce=False, table_oid=None, data_version=None,
+        columns=None, preview_length=None,
 ):
     """
     Returns records from a table.
@@ -104,6 +209,21 @@ def get_records(
         filters:  list of dictionaries, where each dictionary has a 'field' and 'op'
                   field, in addition to an 'value' field if appropriate.
                   See: https://github.com/centerofci/sqlalchemy-filters#filters-format
+        query_options: dict of options for the transaction running the query,
+                  see `db.utils.set_local_query_options`.
+        coalesce: bool, whether to share the result with identical queries,
+                  see `db.records.coalescing`.
+        table_oid: int, the oid of the table, which keys the coalesced
+                  results.  Looked up if not given.
+        data_version: the data version of the table (see
+                  `db.tables.operations.data_version`), if known.  Results
+                  are only shared with queries made at the same version.
+        columns:  list of column names to return, along with the primary key
+                  columns.  All the columns are returned by default.
+        preview_length: int, if given, text and binary values are cut to this
+                  many characters (or bytes), and the full length of each of
+                  these columns is returned after all the columns, in the
+                  order given by get_preview_column_names.
     """
     if not order_by:
         # Set default ordering if none was requested
@@ -116,15 +236,25 @@ def get_records(
             order_by = [{'field': col, 'direction': 'asc'}
                         for col in table.columns]
 
-    query = get_query(table, limit, offset, order_by, filters)
-    return execute_query(engine, query)
+    cols = get_projected_columns(table, columns)
+    if preview_length is not None:
+        cols = _get_preview_columns(cols, preview_length)
+    query = get_query(table, limit, offset, order_by, filters, cols)
+    return _execute_records_query(
+        table, engine, query, query_options, coalesce, table_oid, data_version
+    )
 
 
-def get_count(table, engine, filters=[]):
+def get_count(
+        table, engine, filters=[], query_options=None, coalesce=False, table_oid=None,
+        data_version=None,
+):
     col_name = "_count"
     cols = [func.count().label(col_name)]
     query = get_query(table, None, None, None, filters, cols)
-    return execute_query(engine, query)[0][col_name]
+    return _execute_records_query(
+        table, engine, query, query_options, coalesce, table_oid, data_version
+    )[0][col_name]
 
 
 def get_column_cast_records(engine, table, column_definitions, num_records=20):
@@ -141,6 +271,41 @@ def get_column_cast_records(engine, table, column_definitions, num_records=20):
         for column, col_def in zip(table.columns, column_definitions)
     ]
     sel = select(cast_expression_list).limit(num_records)
-    with engine.begin() as conn:
+    with admit(engine), engine.begin() as conn:
         result = conn.execute(sel)
     return result.fetchall()
+
+
+def get_column_cast_failures(
+        engine, table, column_name, target_type_str, num_records=20, sample_percent=None
+):
+    """
+    Scans the table once, and gives the number of non-null values in the
+    column that can't be cast to the target type, along with up to
+    num_records of the rows holding them (as dicts), in primary key order.
+
+    If sample_percent is given, only a TABLESAMPLE BERNOULLI sample of that
+    percentage of the table is scanned, so the count only covers the sample.
+    """
+    if sample_percent is None:
+        from_table = table
+    else:
+        from_table = table.tablesample(func.bernoulli(sample_percent))
+    column = from_table.columns[column_name]
+    try_cast_expr = get_column_try_cast_expression(column, target_type_str, engine)
+    primary_key_column = from_table.columns[get_primary_key_column(table).name]
+    # The window count is taken over all failing rows before the limit
+    # applies, so a single query gives both the count and the rows.
+    query = (
+        select(*from_table.columns, func.count().over().label(CAST_FAILURE_COUNT_LABEL))
+        .where(and_(column.isnot(None), try_cast_expr.is_(None)))
+        .order_by(primary_key_column)
+        .limit(num_records)
+    )
+    result = execute_query(engine, query)
+    count = result[0][CAST_FAILURE_COUNT_LABEL] if result else 0
+    records = [
+        {col.name: record[col.name] for col in from_table.columns}
+        for record in result
+    ]
+    return count, records
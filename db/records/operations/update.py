@@ -1,11 +1,14 @@
+from db.admission import admit
 from db.records.operations.select import get_record
 from db.tables.utils import get_primary_key_column
+from db.utils import set_local_query_options
 
 
-def update_record(table, engine, id_value, record_data):
+def update_record(table, engine, id_value, record_data, query_options=None):
     primary_key_column = get_primary_key_column(table)
-    with engine.begin() as connection:
+    with admit(engine), engine.begin() as connection:
+        set_local_query_options(connection, **(query_options or {}))
         connection.execute(
             table.update().where(primary_key_column == id_value).values(record_data)
         )
-    return get_record(table, engine, id_value)
+    return get_record(table, engine, id_value, query_options)
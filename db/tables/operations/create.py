@@ -4,6 +4,8 @@ from sqlalchemy.schema import DDLElement
 
 from db.columns.utils import init_mathesar_table_column_list_with_defaults
 from db.schemas.operations.create import create_schema
+from db.types import base
+from db.types.operations.cast import get_supported_alter_column_types
 
 
 def create_mathesar_table(name, schema, columns, engine, metadata=None):
@@ -39,15 +41,40 @@ def create_string_column_table(name, schema, column_names, engine):
     return table
 
 
+def create_typed_column_table(name, schema, column_names, column_types, engine):
+    """
+    This method creates a Postgres table in the specified schema, with
+    column types given by the column_types dict, which maps column names
+    to Mathesar type strings (e.g., those found in TYPE_INFERENCE_DAG).
+    Columns without a (supported) type are created with String type.
+    """
+    supported_types = get_supported_alter_column_types(engine)
+    columns_ = []
+    for column_name in column_names:
+        type_str = column_types.get(column_name, base.STRING)
+        # base.STRING maps to the Postgres NAME type, which we don't want
+        # for user data.
+        sa_type = String if type_str == base.STRING else supported_types.get(type_str, String)
+        columns_.append(Column(name=column_name, type_=sa_type))
+    table = create_mathesar_table(name, schema, columns_, engine)
+    return table
+
+
 class CreateTableAs(DDLElement):
-    def __init__(self, name, selectable):
+    def __init__(self, name, selectable, temporary=False):
         self.name = name
         self.selectable = selectable
+        # Temporary tables are dropped at the end of the transaction
+        self.temporary = temporary
 
 
 @compiler.compiles(CreateTableAs)
 def compile_create_table_as(element, compiler, **_):
-    return "CREATE TABLE %s AS (%s)" % (
+    if element.temporary:
+        create_table = "CREATE TEMPORARY TABLE %s ON COMMIT DROP AS (%s)"
+    else:
+        create_table = "CREATE TABLE %s AS (%s)"
+    return create_table % (
         element.name,
         compiler.sql_compiler.process(element.selectable, literal_binds=True),
     )
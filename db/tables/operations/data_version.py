@@ -0,0 +1,186 @@
+"""
+Per-table data versions.
+
+The data version of a table is a counter kept for it in a table in the
+Mathesar types schema.  A statement-level trigger notes every INSERT,
+UPDATE, DELETE, or TRUNCATE on the table, including writes made outside of
+Mathesar, and the counter of each table a transaction wrote to is bumped
+once, by a deferred constraint trigger, when the transaction commits.
+Mathesar also bumps it itself after changing the columns of a table, since
+DDL doesn't fire the trigger.
+
+Since the counter is bumped in the writing transaction, a new version
+becomes visible together with the data it stands for; a reader never sees
+a new version with the old rows.  Readers should read the version before
+the rows, so that a version is never paired with older data than its own.
+The counter row is only locked from the commit of a writing transaction
+until it ends, so concurrent writers to a table are only serialized for
+that moment.
+
+The objects, and the trigger of a given table, are created on demand by
+`ensure_data_version_trigger`.  Tables that Mathesar can't add the trigger
+to (since only their owner can) have no data version.
+"""
+from psycopg2.errors import LockNotAvailable
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from db.types import base
+from db.utils import execute_statement, set_local_query_options
+
+VERSIONS_TABLE_NAME = "table_data_versions"
+WRITES_TABLE_NAME = "table_data_writes"
+RECORD_WRITE_FUNCTION_NAME = "record_table_data_write"
+APPLY_WRITES_FUNCTION_NAME = "apply_table_data_writes"
+APPLY_WRITES_TRIGGER_NAME = "mathesar_apply_data_writes"
+TRIGGER_NAME = "mathesar_data_version"
+# Prefix of the transaction-local setting that marks a table as written to
+WRITE_SETTING_PREFIX = "mathesar.data_write_"
+# Arbitrary key for the advisory lock that serializes creating the objects
+DATA_VERSION_LOCK_KEY = 5_346_179
+
+
+def _get_trigger_exists_sql(table_oid):
+    return (
+        f"EXISTS (SELECT 1 FROM pg_trigger"
+        f" WHERE tgrelid = {int(table_oid)} AND tgname = '{TRIGGER_NAME}')"
+    )
+
+
+def _get_create_data_version_objects_sql():
+    versions_table = base.get_qualified_name(VERSIONS_TABLE_NAME)
+    writes_table = base.get_qualified_name(WRITES_TABLE_NAME)
+    record_function = base.get_qualified_name(RECORD_WRITE_FUNCTION_NAME)
+    apply_function = base.get_qualified_name(APPLY_WRITES_FUNCTION_NAME)
+    return f"""
+    CREATE SCHEMA IF NOT EXISTS {base.preparer.quote_schema(base.SCHEMA)};
+    CREATE TABLE {versions_table} (
+      table_oid oid PRIMARY KEY,
+      version bigint NOT NULL DEFAULT 0
+    );
+    -- Rows only live until the end of the transaction that inserted them
+    CREATE UNLOGGED TABLE {writes_table} (table_oid oid NOT NULL);
+    CREATE FUNCTION {apply_function}() RETURNS trigger AS $apply$
+    BEGIN
+      UPDATE {versions_table} SET version = version + 1 WHERE table_oid = NEW.table_oid;
+      DELETE FROM {writes_table} WHERE table_oid = NEW.table_oid;
+      RETURN NULL;
+    END;
+    $apply$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog, pg_temp;
+    CREATE CONSTRAINT TRIGGER {APPLY_WRITES_TRIGGER_NAME} AFTER INSERT ON {writes_table}
+      DEFERRABLE INITIALLY DEFERRED
+      FOR EACH ROW EXECUTE FUNCTION {apply_function}();
+    CREATE FUNCTION {record_function}() RETURNS trigger AS $record$
+    DECLARE
+      write_setting text := '{WRITE_SETTING_PREFIX}' || TG_RELID;
+    BEGIN
+      -- Each transaction bumps the version of a table once, at commit
+      IF current_setting(write_setting, true) IS DISTINCT FROM 'on' THEN
+        PERFORM set_config(write_setting, 'on', true);
+        INSERT INTO {writes_table} (table_oid) VALUES (TG_RELID);
+      END IF;
+      RETURN NULL;
+    END;
+    $record$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = pg_catalog, pg_temp;
+    """
+
+
+def _get_ensure_data_version_trigger_sql(table_oid):
+    versions_table = base.get_qualified_name(VERSIONS_TABLE_NAME)
+    record_function = base.get_qualified_name(RECORD_WRITE_FUNCTION_NAME)
+    trigger_exists = _get_trigger_exists_sql(table_oid)
+    return f"""
+    DO $ensure_data_version$
+    BEGIN
+      IF NOT {trigger_exists} THEN
+        -- Checked again once we hold the lock, since another transaction
+        -- may have created the trigger in the meantime.
+        PERFORM pg_advisory_xact_lock({DATA_VERSION_LOCK_KEY});
+        IF to_regclass('{versions_table}') IS NULL THEN
+          {_get_create_data_version_objects_sql()}
+        END IF;
+        IF EXISTS (SELECT 1 FROM pg_class WHERE oid = {int(table_oid)})
+            AND NOT {trigger_exists} THEN
+          -- A table with a reused oid must not get the versions of the
+          -- dropped one, so an existing counter is bumped.
+          INSERT INTO {versions_table} (table_oid) VALUES ({int(table_oid)})
+          ON CONFLICT (table_oid) DO UPDATE SET version = {versions_table}.version + 1;
+          EXECUTE format(
+            'CREATE TRIGGER {TRIGGER_NAME} AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %s'
+            ' FOR EACH STATEMENT EXECUTE FUNCTION {record_function}()',
+            {int(table_oid)}::regclass
+          );
+        END IF;
+      END IF;
+    EXCEPTION
+      WHEN insufficient_privilege THEN
+        -- Only the owner of a table can add the trigger.  Without it, the
+        -- table has no data version.
+        NULL;
+      WHEN duplicate_object THEN
+        -- Created concurrently by a caller that didn't take the lock
+        NULL;
+    END;
+    $ensure_data_version$;
+    """
+
+
+def ensure_data_version_trigger(table_oid, engine, connection_to_use=None):
+    """
+    Makes sure that the data version of the table is tracked, creating the
+    objects and the trigger if they're missing (and allowed).  Returns
+    whether the table has the trigger.  The objects are created under an
+    advisory lock, so that concurrent callers don't race to create them.
+    """
+    execute_statement(
+        engine, text(_get_ensure_data_version_trigger_sql(table_oid)), connection_to_use
+    )
+    return execute_statement(
+        engine, text(f"SELECT {_get_trigger_exists_sql(table_oid)}"), connection_to_use
+    ).scalar()
+
+
+def get_data_version(table_oid, engine, query_options=None):
+    """
+    Gives the current (committed) data version of the table, or None if it
+    isn't tracked.  A table that hasn't been written to since its trigger
+    was created is at version 0.
+
+    The query options (see `db.utils.set_local_query_options`) also apply
+    to creating the trigger, which locks the table.  If the lock can't be
+    taken in time, the table is treated as untracked for now.
+    """
+    versions_table = base.get_qualified_name(VERSIONS_TABLE_NAME)
+    try:
+        with engine.begin() as conn:
+            set_local_query_options(conn, **(query_options or {}))
+            if not ensure_data_version_trigger(table_oid, engine, conn):
+                return None
+            version = execute_statement(
+                engine,
+                text(f"SELECT version FROM {versions_table} WHERE table_oid = {int(table_oid)}"),
+                conn,
+            ).scalar()
+            return version or 0
+    except OperationalError as e:
+        if isinstance(e.orig, LockNotAvailable):
+            return None
+        raise
+
+
+def bump_data_version(table_oid, engine):
+    """
+    Bumps the data version of the table, for changes that don't fire its
+    trigger (e.g., to its columns).
+    """
+    versions_table = base.get_qualified_name(VERSIONS_TABLE_NAME)
+    with engine.begin() as conn:
+        if ensure_data_version_trigger(table_oid, engine, conn):
+            execute_statement(
+                engine,
+                text(
+                    f"UPDATE {versions_table} SET version = version + 1"
+                    f" WHERE table_oid = {int(table_oid)}"
+                ),
+                conn,
+            )
@@ -0,0 +1,78 @@
+"""
+Cost estimates for the structural operations on tables and columns.
+
+The operations that accept a `dry_run` argument return one of these
+estimates instead of changing anything.  The row and byte estimates come
+from the Postgres planner (via EXPLAIN, so the statement isn't run), and
+are only as good as the table statistics.
+"""
+from sqlalchemy import func, select
+from sqlalchemy.ext import compiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from db.utils import execute_statement
+
+# Table lock levels, as named in the Postgres docs
+ACCESS_SHARE = "ACCESS SHARE"
+ROW_EXCLUSIVE = "ROW EXCLUSIVE"
+ACCESS_EXCLUSIVE = "ACCESS EXCLUSIVE"
+
+ROWS = "rows"
+BYTES = "bytes"
+REWRITE = "rewrite"
+LOCK = "lock"
+TABLE_SIZE = "table_size"
+
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiler.compiles(Explain, "postgresql")
+def compile_explain(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+def get_query_estimate(engine, query, connection_to_use=None):
+    """
+    Returns the (rows, bytes) that the planner expects the SELECT query to
+    produce, without running it.
+    """
+    plan = execute_statement(
+        engine, Explain(query), connection_to_use
+    ).scalar()[0]["Plan"]
+    rows = int(plan["Plan Rows"])
+    return rows, rows * int(plan["Plan Width"])
+
+
+def get_total_relation_size(table_oids, engine, connection_to_use=None):
+    """
+    Returns the size in bytes of the given tables, including their indexes
+    and TOAST data.
+    """
+    sizes = [func.pg_total_relation_size(table_oid) for table_oid in table_oids]
+    return sum(
+        execute_statement(engine, select(*sizes), connection_to_use).first()
+    )
+
+
+def get_operation_estimate(
+        engine, table_oids, query, rewrite, lock, connection_to_use=None
+):
+    """
+    Describes the cost of an operation on the given tables.  `query` selects
+    the data the operation writes, `rewrite` tells whether any of the tables
+    (or a copy of them) are written in full, and `lock` is the strongest
+    table lock the operation takes.
+    """
+    rows, bytes_ = get_query_estimate(engine, query, connection_to_use)
+    return {
+        ROWS: rows,
+        BYTES: bytes_,
+        REWRITE: rewrite,
+        LOCK: lock,
+        TABLE_SIZE: get_total_relation_size(table_oids, engine, connection_to_use),
+    }
@@ -1,28 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 
-from sqlalchemy import select
+from sqlalchemy import Column, MetaData, Table, func, literal, select
 
 from db import constants
+from db.admission import share_admission
 from db.columns.base import MathesarColumn
-from db.columns.operations.infer_types import infer_column_type
+from db.columns.operations.alter import alter_column_types_along_paths
+from db.columns.operations.infer_types import (
+    TYPE_INFERENCE_DAG, get_column_type_str, get_type_inference_path_check,
+    get_type_inference_paths, infer_column_type, walk_type_inference_dag
+)
 from db.schemas.operations.create import create_schema
 from db.tables.operations.create import CreateTableAs
-from db.tables.operations.select import reflect_table
+from db.tables.operations.select import (
+    get_estimated_row_count, get_oid_from_table, reflect_table
+)
+from db.types.operations.cast import get_supported_alter_column_types
+from db.utils import execute_query
 
 
 TEMP_SCHEMA = f"{constants.MATHESAR_PREFIX}temp_schema"
 TEMP_TABLE = f"{constants.MATHESAR_PREFIX}temp_table_%s"
+SAMPLE_TABLE = f"{constants.MATHESAR_PREFIX}sample_table"
+# Each worker holds one connection at a time, so this should stay within
+# the size of the engine's connection pool (5 + 10 overflow by default).
+PARALLEL_INFERENCE_MAX_WORKERS = 8
+SAMPLE_METHODS = ("system", "bernoulli")
+DEFAULT_SAMPLE_SIZE = 10000
 
 
-def update_table_column_types(schema, table_name, engine):
-    table = reflect_table(table_name, schema, engine)
+def _get_inferable_column_names(table):
     # we only want to infer (modify) the type of non-default columns
-    inferable_column_names = (
+    return [
         col.name for col in table.columns
         if not MathesarColumn.from_column(col).is_default
         and not col.primary_key
         and not col.foreign_keys
-    )
+    ]
+
+
+def update_table_column_types(
+        schema, table_name, engine, parallel=False,
+        max_workers=PARALLEL_INFERENCE_MAX_WORKERS,
+):
+    """
+    Infers the types of the inferable columns of a table, and alters the
+    columns to those types.
+
+    If parallel is True, the inference path of each column is instead found
+    concurrently on its own connection (from a pool of max_workers threads),
+    using the try_cast_to_<type> functions rather than by altering the
+    table.  The columns are then altered along their paths, all of them in
+    a single ALTER TABLE for each step, so the table is rewritten once per
+    step instead of once per type tried for each column.
+    """
+    table = reflect_table(table_name, schema, engine)
+    inferable_column_names = _get_inferable_column_names(table)
+    if parallel:
+        column_paths = _get_type_inference_paths_parallel(
+            table, inferable_column_names, engine, max_workers
+        )
+        table_oid = get_oid_from_table(table.name, table.schema, engine)
+        alter_column_types_along_paths(table_oid, column_paths, engine)
+        return
     for column_name in inferable_column_names:
         infer_column_type(
             schema,
@@ -32,6 +73,24 @@ def update_table_column_types(schema, table_name, engine):
         )
 
 
+def _get_type_inference_paths_parallel(table, column_names, engine, max_workers):
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # The workers share the caller's admission and query priority
+        get_type_inference_paths_for_columns = share_admission(
+            _get_type_inference_paths_for_columns
+        )
+        futures = {
+            column_name: executor.submit(
+                get_type_inference_paths_for_columns, table, [column_name], engine
+            )
+            for column_name in column_names
+        }
+        return {
+            column_name: future.result()[column_name]
+            for column_name, future in futures.items()
+        }
+
+
 def infer_table_column_types(schema, table_name, engine):
     table = reflect_table(table_name, schema, engine)
 
@@ -61,3 +120,151 @@ def infer_table_column_types(schema, table_name, engine):
         types = [c.type.__class__ for c in temp_table.columns]
         temp_table.drop()
         return types
+
+
+def _get_type_inference_paths_for_columns(
+        table, column_names, engine, connection_to_use=None,
+        type_inference_dag=TYPE_INFERENCE_DAG,
+):
+    """
+    Gives a dict mapping each of the given column names to the path through
+    the type_inference_dag chosen for that column, using a single scan of
+    the table.
+
+    Every path through the type_inference_dag is checked for every column
+    at once, using aggregates over the non-raising try_cast_to_<type>
+    functions.  The dag is then walked in Python, in the same way as
+    infer_column_type does, using those results.
+    """
+    column_checks = {}
+    checks = []
+    for column_name in column_names:
+        column = table.columns[column_name]
+        column_type_str = get_column_type_str(column, engine)
+        paths = get_type_inference_paths(
+            column_type_str, type_inference_dag=type_inference_dag
+        )
+        column_checks[column_name] = (column_type_str, paths, len(checks))
+        checks.extend(
+            get_type_inference_path_check(column, path, engine) for path in paths
+        )
+
+    if checks:
+        results = execute_query(
+            engine, select(*checks).select_from(table), connection_to_use
+        )[0]
+    else:
+        results = []
+
+    column_paths = {}
+    for column_name, (column_type_str, paths, offset) in column_checks.items():
+        path_is_valid = {
+            path: results[offset + i] for i, path in enumerate(paths)
+        }
+        column_paths[column_name] = walk_type_inference_dag(
+            column_type_str, path_is_valid, type_inference_dag=type_inference_dag
+        )
+    return column_paths
+
+
+def _get_types_from_type_inference_paths(table, column_paths, engine):
+    supported_types = get_supported_alter_column_types(engine)
+    return [
+        supported_types[column_paths[col.name][-1]]
+        if column_paths.get(col.name) else col.type.__class__
+        for col in table.columns
+    ]
+
+
+def infer_table_column_types_single_scan(
+        schema, table_name, engine, type_inference_dag=TYPE_INFERENCE_DAG
+):
+    """
+    Infers the column types of a table with a single scan of the table,
+    without copying or altering it.  Returns the same list of types as
+    infer_table_column_types.
+    """
+    table = reflect_table(table_name, schema, engine)
+    column_paths = _get_type_inference_paths_for_columns(
+        table, _get_inferable_column_names(table), engine,
+        type_inference_dag=type_inference_dag,
+    )
+    return _get_types_from_type_inference_paths(table, column_paths, engine)
+
+
+def _get_sample_selectable(table, engine, sample_size, sample_method, seed):
+    if sample_method is None:
+        return select(table).limit(sample_size)
+    if sample_method not in SAMPLE_METHODS:
+        raise ValueError(f"sample_method must be one of {SAMPLE_METHODS}")
+    # TABLESAMPLE takes a percentage, so we aim for sample_size rows based
+    # on the planner's estimate of the table size.
+    row_estimate = get_estimated_row_count(table.name, table.schema, engine)
+    if row_estimate is None or row_estimate <= sample_size:
+        percentage = 100
+    else:
+        percentage = 100 * sample_size / row_estimate
+    sample = table.tablesample(
+        getattr(func, sample_method)(percentage),
+        seed=literal(seed) if seed is not None else None,
+    )
+    return select(sample).limit(sample_size)
+
+
+def infer_table_column_types_from_sample(
+        schema, table_name, engine, sample_size=DEFAULT_SAMPLE_SIZE,
+        sample_method=None, seed=None, verify=True,
+        type_inference_dag=TYPE_INFERENCE_DAG,
+):
+    """
+    Infers the column types of a table from a sample of its rows, so that
+    the cost doesn't depend on the size of the table.  Returns the same
+    list of types as infer_table_column_types.
+
+    Args:
+        sample_size:   maximum number of rows in the sample.
+        sample_method: None to take the first sample_size rows, or one
+                       of SAMPLE_METHODS to use TABLESAMPLE with that
+                       method.
+        seed:          seed for TABLESAMPLE, to make the sample
+                       repeatable.  Ignored if sample_method is None.
+        verify:        whether to check the chosen types against the full
+                       table.  Only the chosen cast path is checked for
+                       each column whose type would change; any column
+                       that fails the check is inferred again using the
+                       full table.
+    """
+    table = reflect_table(table_name, schema, engine)
+    column_names = _get_inferable_column_names(table)
+    sample = _get_sample_selectable(table, engine, sample_size, sample_method, seed)
+    sample_table = Table(
+        SAMPLE_TABLE,
+        MetaData(),
+        *[Column(col.name, col.type) for col in table.columns],
+    )
+    with engine.begin() as conn:
+        # The sample table is dropped at the end of this transaction
+        conn.execute(CreateTableAs(SAMPLE_TABLE, sample, temporary=True))
+        column_paths = _get_type_inference_paths_for_columns(
+            sample_table, column_names, engine, connection_to_use=conn,
+            type_inference_dag=type_inference_dag,
+        )
+
+    chosen_paths = {name: path for name, path in column_paths.items() if path}
+    if verify and chosen_paths:
+        checks = [
+            get_type_inference_path_check(table.columns[name], path, engine)
+            for name, path in chosen_paths.items()
+        ]
+        results = execute_query(engine, select(*checks).select_from(table))[0]
+        failed_column_names = [
+            name for name, is_valid in zip(chosen_paths, results) if not is_valid
+        ]
+        if failed_column_names:
+            column_paths.update(
+                _get_type_inference_paths_for_columns(
+                    table, failed_column_names, engine,
+                    type_inference_dag=type_inference_dag,
+                )
+            )
+    return _get_types_from_type_inference_paths(table, column_paths, engine)
@@ -2,13 +2,17 @@ from sqlalchemy import select
 
 from db.columns.base import MathesarColumn
 from db.tables.operations.create import create_mathesar_table
-from db.tables.operations.select import reflect_table
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, ACCESS_SHARE, get_operation_estimate
+from db.tables.operations.select import get_oid_from_table, reflect_table
 
 
-def merge_tables(table_name_one, table_name_two, merged_table_name, schema, engine, drop_original_tables=False):
+def merge_tables(table_name_one, table_name_two, merged_table_name, schema, engine, drop_original_tables=False, dry_run=False):
     """
     This specifically undoes the `extract_columns_from_table` (up to
     unique rows).  It may not work in other contexts (yet).
+
+    If `dry_run` is set, nothing is changed, and an estimate of the cost of
+    the merge is returned instead (see `get_operation_estimate`).
     """
     table_one = reflect_table(table_name_one, schema, engine)
     table_two = reflect_table(
@@ -25,13 +29,24 @@ def merge_tables(table_name_one, table_name_two, merged_table_name, schema, engi
         if col not in referencing_columns
     ]
     merged_columns = [col for col in merged_columns_all if not col.is_default]
+    merge_sel = select(merged_columns, distinct=True).select_from(merge_join)
+    if dry_run:
+        return get_operation_estimate(
+            engine,
+            [
+                get_oid_from_table(table_name_one, schema, engine),
+                get_oid_from_table(table_name_two, schema, engine),
+            ],
+            merge_sel,
+            rewrite=True,
+            lock=ACCESS_EXCLUSIVE if drop_original_tables else ACCESS_SHARE,
+        )
     with engine.begin() as conn:
         merged_table = create_mathesar_table(
             merged_table_name, schema, merged_columns, engine,
         )
         insert_stmt = merged_table.insert().from_select(
-            [col.name for col in merged_columns],
-            select(merged_columns, distinct=True).select_from(merge_join)
+            [col.name for col in merged_columns], merge_sel
         )
         conn.execute(insert_stmt)
 
@@ -1,8 +1,13 @@
+from sqlalchemy import DDL, Column, String, cast, distinct, func, select
+from sqlalchemy.schema import CreateColumn
+
 from db.columns.base import MathesarColumn
 from db import constants
 from db.tables.operations.split import extract_columns_from_table
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, get_operation_estimate
 from db.tables.operations.merge import merge_tables
-from db.tables.operations.select import reflect_table
+from db.tables.operations.select import get_oid_from_table, reflect_table
+from db.utils import execute_statement
 
 
 def _find_table_relationship(table_one, table_two):
@@ -53,7 +58,132 @@ def _get_column_moving_extraction_args(relationship, target_table, target_table_
     return extracted_table_name, remainder_table_name, extraction_columns
 
 
-def move_columns_between_related_tables(source_table_name, target_table_name, column_names, schema, engine):
+def _get_relationship_join_columns(relationship):
+    """
+    Returns the (referencing, referenced) columns of the single-column
+    foreign key relating the tables.
+    """
+    fkey_constraint = [
+        fkey_constraint for fkey_constraint in relationship["referencing"].foreign_key_constraints
+        if fkey_constraint.referred_table == relationship["referenced"]
+    ][0]
+    fkey_element = fkey_constraint.elements[0]
+    return fkey_element.parent, fkey_element.column
+
+
+def _is_functionally_dependent(referencing_column, moving_columns, engine):
+    """
+    Checks whether all rows of the referencing table that reference the same
+    row hold the same values in the moving columns, i.e., whether the values
+    can be moved to the referenced table without splitting its rows.
+    """
+    # Casting the row to text makes NULLs distinct from other values.
+    moving_values = cast(func.row(*moving_columns), String)
+    sel = (
+        select(referencing_column)
+        .where(referencing_column.isnot(None))
+        .group_by(referencing_column)
+        .having(func.count(distinct(moving_values)) > 1)
+        .limit(1)
+    )
+    return execute_statement(engine, sel).first() is None
+
+
+def _move_columns_in_place(source_table, target_table, moving_columns, relationship, engine):
+    """
+    Moves the columns by adding them to the target table, filling them with
+    an UPDATE ... FROM the join with the source table, and dropping them
+    from the source table, all in one transaction.  Neither table is
+    rewritten, and ids are kept.
+    """
+    _preparer = engine.dialect.identifier_preparer
+    referencing_column, referenced_column = _get_relationship_join_columns(relationship)
+    if relationship["referencing"] == target_table:
+        target_join_column, source_join_column = referencing_column, referenced_column
+    else:
+        target_join_column, source_join_column = referenced_column, referencing_column
+
+    prepared_source_name = _preparer.format_table(source_table)
+    prepared_target_name = _preparer.format_table(target_table)
+    add_actions = [
+        f"ADD COLUMN {CreateColumn(Column(col.name, col.type)).compile(dialect=engine.dialect)}"
+        for col in moving_columns
+    ]
+    set_clauses = [
+        f"{_preparer.format_column(col)} = {prepared_source_name}.{_preparer.format_column(col)}"
+        for col in moving_columns
+    ]
+    drop_actions = [f"DROP COLUMN {_preparer.format_column(col)}" for col in moving_columns]
+    move_stmt = f"""
+    ALTER TABLE {prepared_target_name} {', '.join(add_actions)};
+    UPDATE {prepared_target_name} SET {', '.join(set_clauses)}
+      FROM {prepared_source_name}
+      WHERE {prepared_target_name}.{_preparer.format_column(target_join_column)}
+        = {prepared_source_name}.{_preparer.format_column(source_join_column)};
+    ALTER TABLE {prepared_source_name} {', '.join(drop_actions)};
+    """
+    with engine.begin() as conn:
+        execute_statement(engine, DDL(move_stmt), conn)
+
+
+def move_columns_between_related_tables(source_table_name, target_table_name, column_names, schema, engine, dry_run=False):
+    """
+    Moves columns between two tables related by a foreign key.
+
+    Where possible, the columns are moved in place, so that the cost scales
+    with the moved data rather than the size of the tables.  This is the
+    case when moving columns into the referencing table, and when moving
+    columns into the referenced table if every row of the referenced table
+    gets a single value from the rows referencing it.  Otherwise, the rows
+    of the referenced table have to be split, so the tables are merged and
+    re-split.
+
+    Returns the (referenced, referencing) tables after the move.  If
+    `dry_run` is set, nothing is changed, and an estimate of the cost of the
+    move is returned instead (see `get_operation_estimate`).
+    """
+    source_table = reflect_table(source_table_name, schema, engine)
+    target_table = reflect_table(
+        target_table_name, schema, engine, metadata=source_table.metadata
+    )
+    relationship = _find_table_relationship(source_table, target_table)
+    moving_columns = [source_table.columns[n] for n in column_names]
+    assert _check_columns(relationship, source_table, moving_columns)
+    in_place = (
+        relationship["referencing"] == target_table
+        or _is_functionally_dependent(
+            _get_relationship_join_columns(relationship)[0], moving_columns, engine
+        )
+    )
+    if dry_run:
+        # In place, the moved values are written to the joined rows of the
+        # target table.  Otherwise, the joined rows are merged and re-split.
+        if in_place:
+            moved_columns = moving_columns
+        else:
+            moved_columns = list(source_table.columns) + list(target_table.columns)
+        return get_operation_estimate(
+            engine,
+            [
+                get_oid_from_table(source_table_name, schema, engine),
+                get_oid_from_table(target_table_name, schema, engine),
+            ],
+            select(*moved_columns).select_from(source_table.join(target_table)),
+            rewrite=not in_place,
+            lock=ACCESS_EXCLUSIVE,
+        )
+    if in_place:
+        _move_columns_in_place(source_table, target_table, moving_columns, relationship, engine)
+        return (
+            reflect_table(relationship["referenced"].name, schema, engine),
+            reflect_table(relationship["referencing"].name, schema, engine),
+        )
+    return _move_columns_by_merging(
+        source_table_name, target_table_name, column_names, schema, engine
+    )
+
+
+def _move_columns_by_merging(source_table_name, target_table_name, column_names, schema, engine):
     TEMP_MERGED_TABLE_NAME = f"{constants.MATHESAR_PREFIX}_temp_merge_table"
     source_table = reflect_table(source_table_name, schema, engine)
     target_table = reflect_table(
@@ -1,6 +1,7 @@
 import warnings
 
-from sqlalchemy import Table, MetaData, select, join, inspect, and_
+from sqlalchemy import Table, MetaData, select, join, inspect, and_, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from db.utils import execute_statement
 
@@ -55,3 +56,70 @@ def get_table_oids_from_schema(schema_oid, engine):
 def get_oid_from_table(name, schema, engine):
     inspector = inspect(engine)
     return inspector.get_table_oid(name, schema=schema)
+
+
+def get_estimated_row_count(name, schema, engine, connection_to_use=None):
+    """
+    Gives the planner's estimate of the number of rows in the table, which
+    is much cheaper than counting them.  The estimate is -1 (or 0) if the
+    table has never been vacuumed or analyzed.
+    """
+    metadata = MetaData()
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Did not recognize type")
+        pg_class = Table("pg_class", metadata, autoload_with=engine)
+    sel = (
+        select(pg_class.c.reltuples)
+        .where(pg_class.c.oid == get_oid_from_table(name, schema, engine))
+    )
+    result = execute_statement(engine, sel, connection_to_use)
+    return result.scalar()
+
+
+def get_table_version(oid, engine, connection_to_use=None):
+    """
+    Gives a tuple that changes whenever the contents or the columns of the
+    table change, without reading the table itself.
+
+    The contents part comes from the cumulative insert, update, and delete
+    counters in pg_stat_user_tables, and the columns part from the attnums
+    and types of the table's columns in pg_attribute.  Note that the
+    statistics counters are only updated when a transaction ends, and may
+    lag behind it by a moment, so callers should also invalidate anything
+    derived from the version when they change the table themselves.
+    """
+    metadata = MetaData()
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Did not recognize type")
+        pg_stat_user_tables = Table("pg_stat_user_tables", metadata, autoload_with=engine)
+        pg_attribute = Table("pg_attribute", metadata, autoload_with=engine)
+    stat_sel = (
+        select(
+            pg_stat_user_tables.c.n_tup_ins,
+            pg_stat_user_tables.c.n_tup_upd,
+            pg_stat_user_tables.c.n_tup_del,
+        )
+        .where(pg_stat_user_tables.c.relid == oid)
+    )
+    attribute_sel = (
+        select(
+            func.array_agg(
+                aggregate_order_by(
+                    func.concat(pg_attribute.c.attnum, ':', pg_attribute.c.atttypid),
+                    pg_attribute.c.attnum,
+                )
+            )
+        )
+        .where(
+            and_(
+                pg_attribute.c.attrelid == oid,
+                pg_attribute.c.attnum > 0,
+                pg_attribute.c.attisdropped.is_(False),
+            )
+        )
+    )
+    stat_row = execute_statement(engine, stat_sel, connection_to_use).first()
+    attributes = execute_statement(engine, attribute_sel, connection_to_use).scalar()
+    return tuple(stat_row or ()) + tuple(attributes or ())
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, func, select, ForeignKey, literal, exists
+from sqlalchemy import Column, TEXT, and_, cast, func, select, ForeignKey, literal, exists
 
 from db import constants
 from db.columns.base import MathesarColumn
 from db.columns.defaults import ID_TYPE
 from db.tables.operations.create import create_mathesar_table
-from db.tables.operations.select import reflect_table
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, ACCESS_SHARE, get_operation_estimate
+from db.tables.operations.select import get_oid_from_table, reflect_table
+from db.utils import execute_statement
+
+RANK_SPLIT = "rank"
+HASH_SPLIT = "hash"
+SPLIT_STRATEGIES = (RANK_SPLIT, HASH_SPLIT)
 
 
 def _split_column_list(columns_, extracted_column_names):
@@ -85,7 +91,78 @@ def _create_split_insert_stmt(old_table, extracted_table, extracted_columns, rem
     return split_ins
 
 
-def extract_columns_from_table(old_table_name, extracted_column_names, extracted_table_name, remainder_table_name, schema, engine, drop_original_table=False):
+def _get_split_key_expr(columns):
+    # A fixed-size digest of the text form of the row of extracted values,
+    # to hash join on.  Equal digests don't guarantee equal values, so the
+    # values are compared as well.
+    return func.md5(cast(func.row(*columns), TEXT))
+
+
+def _split_with_hash(conn, engine, old_table, extracted_table, extracted_columns, remainder_table, remainder_columns, remainder_fk_name):
+    """
+    Splits the old table into the extracted and remainder tables without
+    sorting it.
+
+    The distinct tuples of extracted values are found by grouping (which
+    Postgres can do with a hash aggregate), and only those are inserted
+    into the extracted table, so the ids drawn from its sequence stay
+    dense.  The remainder is then mapped to those ids with a hash join on a
+    digest of the extracted values, and the values themselves (matching
+    NULLs) are compared to resolve any digest collisions.
+    """
+    extracted_column_names = [col.name for col in extracted_columns]
+    remainder_column_names = [col.name for col in remainder_columns]
+    old_extracted_columns = [old_table.columns[n] for n in extracted_column_names]
+    new_extracted_columns = [extracted_table.columns[n] for n in extracted_column_names]
+    old_key_expr = _get_split_key_expr(old_extracted_columns)
+
+    # Grouping on the digest as well keeps values that are equal but print
+    # differently (e.g., 1.0 and 1.00 as NUMERIC) apart, so that each row
+    # matches exactly one tuple below.
+    extract_ins = extracted_table.insert().from_select(
+        extracted_column_names,
+        select(*old_extracted_columns).group_by(*old_extracted_columns, old_key_expr),
+    )
+    execute_statement(engine, extract_ins, conn)
+
+    remainder_sel = select(
+        extracted_table.columns[constants.ID],
+        *[old_table.columns[n] for n in remainder_column_names],
+    ).select_from(
+        old_table.join(
+            extracted_table,
+            and_(
+                _get_split_key_expr(new_extracted_columns) == old_key_expr,
+                *[
+                    new_col.is_not_distinct_from(old_col)
+                    for new_col, old_col in zip(new_extracted_columns, old_extracted_columns)
+                ],
+            ),
+        )
+    ).distinct()
+    remainder_ins = remainder_table.insert().from_select(
+        [remainder_fk_name] + remainder_column_names, remainder_sel
+    )
+    execute_statement(engine, remainder_ins, conn)
+
+
+def extract_columns_from_table(old_table_name, extracted_column_names, extracted_table_name, remainder_table_name, schema, engine, drop_original_table=False, split_strategy=RANK_SPLIT, dry_run=False):
+    """
+    Splits a table into an extracted table holding each distinct tuple of
+    the given columns, and a remainder table holding the rest of the
+    columns, along with a foreign key to the extracted table.
+
+    With the RANK_SPLIT strategy, extracted ids are assigned by ranking
+    the tuples, which sorts the whole table.  The HASH_SPLIT strategy
+    avoids the sort (see `_split_with_hash`); ids are then assigned in no
+    particular order, and values that are equal but print differently
+    (e.g., 1.0 and 1.00 as NUMERIC) are treated as distinct.
+
+    If `dry_run` is set, nothing is changed, and an estimate of the cost of
+    the split is returned instead (see `get_operation_estimate`).
+    """
+    if split_strategy not in SPLIT_STRATEGIES:
+        raise ValueError(f'split_strategy must be one of {SPLIT_STRATEGIES}')
     old_table = reflect_table(old_table_name, schema, engine)
     old_columns = (MathesarColumn.from_column(col) for col in old_table.columns)
     old_non_default_columns = [
@@ -94,6 +171,15 @@ def extract_columns_from_table(old_table_name, extracted_column_names, extracted
     extracted_columns, remainder_columns = _split_column_list(
         old_non_default_columns, extracted_column_names,
     )
+    if dry_run:
+        # Every row of the original table is copied into the new tables
+        return get_operation_estimate(
+            engine,
+            [get_oid_from_table(old_table_name, schema, engine)],
+            select(*[old_table.c[col.name] for col in old_non_default_columns]),
+            rewrite=True,
+            lock=ACCESS_EXCLUSIVE if drop_original_table else ACCESS_SHARE,
+        )
     with engine.begin() as conn:
         extracted_table, remainder_table, remainder_fk = _create_split_tables(
             extracted_table_name,
@@ -103,15 +189,27 @@ def extract_columns_from_table(old_table_name, extracted_column_names, extracted
             schema,
             engine,
         )
-        split_ins = _create_split_insert_stmt(
-            old_table,
-            extracted_table,
-            extracted_columns,
-            remainder_table,
-            remainder_columns,
-            remainder_fk,
-        )
-        conn.execute(split_ins)
+        if split_strategy == HASH_SPLIT:
+            _split_with_hash(
+                conn,
+                engine,
+                old_table,
+                extracted_table,
+                extracted_columns,
+                remainder_table,
+                remainder_columns,
+                remainder_fk,
+            )
+        else:
+            split_ins = _create_split_insert_stmt(
+                old_table,
+                extracted_table,
+                extracted_columns,
+                remainder_table,
+                remainder_columns,
+                remainder_fk,
+            )
+            conn.execute(split_ins)
     if drop_original_table:
         old_table.drop()
 
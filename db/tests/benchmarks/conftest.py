@@ -0,0 +1,42 @@
+"""
+Benchmarks are skipped unless MATHESAR_BENCHMARK_ROWS is set to the number
+of rows they should use, e.g.:
+
+    MATHESAR_BENCHMARK_ROWS=5000000 pytest -s db/tests/benchmarks
+"""
+import os
+from time import perf_counter
+
+import pytest
+
+from db.tests.types import fixtures
+
+
+engine_with_types = fixtures.engine_with_types
+temporary_testing_schema = fixtures.temporary_testing_schema
+engine_email_type = fixtures.engine_email_type
+
+BENCHMARK_ROWS_ENV = "MATHESAR_BENCHMARK_ROWS"
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get(BENCHMARK_ROWS_ENV):
+        return
+    skip_benchmark = pytest.mark.skip(reason=f"{BENCHMARK_ROWS_ENV} is not set")
+    for item in items:
+        if "benchmarks" in item.nodeid:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture
+def benchmark_rows():
+    return int(os.environ[BENCHMARK_ROWS_ENV])
+
+
+@pytest.fixture
+def timer():
+    def _time(func, *args, **kwargs):
+        start = perf_counter()
+        result = func(*args, **kwargs)
+        return result, perf_counter() - start
+    return _time
@@ -0,0 +1,45 @@
+from sqlalchemy import text
+
+from db.types.base import SCHEMA
+
+
+def _create_benchmark_table(engine, schema, rows):
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE TABLE {schema}.cast_benchmark (col VARCHAR)"))
+        conn.execute(
+            text(
+                f"INSERT INTO {schema}.cast_benchmark"
+                f" SELECT i::varchar FROM generate_series(1, {rows}) AS i"
+            )
+        )
+        conn.execute(text(f"ANALYZE {schema}.cast_benchmark"))
+
+
+def _run_cast_query(engine, schema, max_workers):
+    with engine.begin() as conn:
+        conn.execute(text(f"SET LOCAL max_parallel_workers_per_gather = {max_workers}"))
+        query = (
+            f"SELECT count(*) FROM {schema}.cast_benchmark"
+            f" WHERE {SCHEMA}.cast_to_numeric(col) > 0"
+        )
+        plan = "\n".join(
+            row[0] for row in conn.execute(text(f"EXPLAIN {query}")).fetchall()
+        )
+        conn.execute(text(query))
+    return plan
+
+
+def test_cast_benchmark_parallel_plan(engine_email_type, benchmark_rows, timer):
+    engine, schema = engine_email_type
+    _create_benchmark_table(engine, schema, benchmark_rows)
+
+    serial_plan, serial_time = timer(_run_cast_query, engine, schema, 0)
+    parallel_plan, parallel_time = timer(_run_cast_query, engine, schema, 4)
+
+    print(
+        f"\ncast_to_numeric over {benchmark_rows} rows:"
+        f" serial {serial_time:.2f}s, parallel {parallel_time:.2f}s"
+    )
+    print(parallel_plan)
+    assert "Gather" not in serial_plan
+    assert "Gather" in parallel_plan
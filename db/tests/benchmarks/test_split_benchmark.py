@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import func, select, text
+
+from db.tables.operations.split import SPLIT_STRATEGIES, extract_columns_from_table
+
+
+def _create_benchmark_table(engine, schema, rows):
+    # About one distinct (customer, email) tuple per 100 rows
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+        CREATE TABLE {schema}.split_benchmark (
+            id SERIAL PRIMARY KEY, customer VARCHAR, email VARCHAR, amount NUMERIC, note VARCHAR
+        )
+        """))
+        conn.execute(
+            text(
+                f"INSERT INTO {schema}.split_benchmark (customer, email, amount, note)"
+                f" SELECT 'customer ' || (i % {max(rows // 100, 1)}),"
+                f" 'customer' || (i % {max(rows // 100, 1)}) || '@example.com',"
+                f" i / 100.0, md5(i::text)"
+                f" FROM generate_series(1, {rows}) AS i"
+            )
+        )
+        conn.execute(text(f"ANALYZE {schema}.split_benchmark"))
+
+
+@pytest.mark.parametrize("split_strategy", SPLIT_STRATEGIES)
+def test_split_benchmark(engine_email_type, benchmark_rows, timer, split_strategy):
+    engine, schema = engine_email_type
+    _create_benchmark_table(engine, schema, benchmark_rows)
+
+    (extracted, remainder, _), split_time = timer(
+        extract_columns_from_table,
+        "split_benchmark",
+        ["customer", "email"],
+        "customers",
+        "orders",
+        schema,
+        engine,
+        split_strategy=split_strategy,
+    )
+
+    with engine.begin() as conn:
+        extracted_count = conn.execute(select(func.count()).select_from(extracted)).scalar()
+        remainder_count = conn.execute(select(func.count()).select_from(remainder)).scalar()
+    print(
+        f"\n{split_strategy} split over {benchmark_rows} rows: {split_time:.2f}s"
+        f" ({extracted_count} extracted, {remainder_count} remainder rows)"
+    )
+    assert extracted_count == max(benchmark_rows // 100, 1)
+    assert remainder_count == benchmark_rows
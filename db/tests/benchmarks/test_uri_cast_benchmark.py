@@ -0,0 +1,89 @@
+from sqlalchemy import text
+
+from db.types import uri
+from db.types.operations.cast import get_cast_function_name
+
+
+def _create_benchmark_table(engine, schema, rows):
+    # Values without a scheme fail the domain check, so every value goes
+    # through the TLD lookup in cast_to_uri.
+    tlds = ["com", "org", "net", "io", "museum", "xn--p1ai"]
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE TABLE {schema}.uri_cast_benchmark (col VARCHAR)"))
+        conn.execute(
+            text(
+                f"INSERT INTO {schema}.uri_cast_benchmark"
+                f" SELECT 'www.example' || i || '.'"
+                f" || (ARRAY{tlds})[1 + i % {len(tlds)}] || '/path?q=' || i"
+                f" FROM generate_series(1, {rows}) AS i"
+            )
+        )
+        conn.execute(text(f"ANALYZE {schema}.uri_cast_benchmark"))
+
+
+def _run_cast_query(engine, schema):
+    with engine.begin() as conn:
+        return conn.execute(
+            text(
+                f"SELECT count({get_cast_function_name(uri.DB_TYPE)}(col))"
+                f" FROM {schema}.uri_cast_benchmark"
+            )
+        ).scalar()
+
+
+def test_uri_cast_benchmark(engine_email_type, benchmark_rows, timer):
+    engine, schema = engine_email_type
+    _create_benchmark_table(engine, schema, benchmark_rows)
+
+    cast_count, cast_time = timer(_run_cast_query, engine, schema)
+
+    print(
+        f"\ncast_to_uri over {benchmark_rows} rows: {cast_time:.2f}s"
+        f" ({benchmark_rows / cast_time:,.0f} rows/s)"
+    )
+    assert cast_count == benchmark_rows
+
+
+def _create_tld_lookup_functions(engine, schema):
+    # The two ways of checking a TLD, called once per value from PL/pgSQL,
+    # as cast_to_uri does.
+    lookups = {
+        "table": f"EXISTS (SELECT 1 FROM {uri.QUALIFIED_TLDS} WHERE tld = $1)",
+        "array": f"$1 = ANY({uri.get_top_level_domains_array_sql()})",
+    }
+    with engine.begin() as conn:
+        for name, lookup in lookups.items():
+            conn.execute(text(
+                f"CREATE FUNCTION {schema}.tld_lookup_{name}(text) RETURNS boolean AS $$"
+                f" BEGIN RETURN {lookup}; END;"
+                f" $$ LANGUAGE plpgsql STABLE"
+            ))
+    return list(lookups)
+
+
+def _run_tld_lookup_query(engine, schema, lookup_name):
+    with engine.begin() as conn:
+        return conn.execute(
+            text(
+                f"SELECT count(*) FROM {schema}.uri_cast_benchmark"
+                f" WHERE {schema}.tld_lookup_{lookup_name}(split_part(split_part(col, '/', 1), '.', 3))"
+            )
+        ).scalar()
+
+
+def test_tld_lookup_benchmark(engine_email_type, benchmark_rows, timer):
+    engine, schema = engine_email_type
+    _create_benchmark_table(engine, schema, benchmark_rows)
+    lookup_names = _create_tld_lookup_functions(engine, schema)
+    with engine.begin() as conn:
+        server_version = conn.execute(text("SHOW server_version")).scalar()
+
+    counts = []
+    for lookup_name in lookup_names:
+        count, lookup_time = timer(_run_tld_lookup_query, engine, schema, lookup_name)
+        counts.append(count)
+        print(
+            f"\nTLD {lookup_name} lookup over {benchmark_rows} rows on Postgres"
+            f" {server_version}: {lookup_time:.2f}s ({benchmark_rows / lookup_time:,.0f} rows/s)"
+        )
+    assert counts == [benchmark_rows] * len(lookup_names)
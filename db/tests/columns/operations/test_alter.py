@@ -2,15 +2,17 @@ from unittest.mock import patch
 
 from psycopg2.errors import NotNullViolation
 import pytest
-from sqlalchemy import String, Integer, Column, select, Table, MetaData, VARCHAR
+from sqlalchemy import String, Integer, Column, select, Table, MetaData, VARCHAR, event, text
 from sqlalchemy.exc import IntegrityError
 
 from db import constants
 from db.columns.operations import alter as alter_operations
+from db.columns.exceptions import OnlineAlterCancelledError
 from db.columns.operations.alter import alter_column, batch_update_columns, change_column_nullable, rename_column, retype_column, set_column_default
 from db.columns.operations.select import get_column_default, get_column_index_from_name
 from db.columns.utils import get_mathesar_column_with_engine
 from db.tables.operations.create import create_mathesar_table
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, LOCK, REWRITE, ROWS, TABLE_SIZE
 from db.tables.operations.select import get_oid_from_table, reflect_table
 from db.tables.operations.split import extract_columns_from_table
 from db.tests.columns.utils import create_test_table, column_test_dict, get_default
@@ -528,3 +530,233 @@ def test_batch_update_column_all_operations(engine_email_type):
         new_column_type = get_db_type_name(updated_table.columns[index].type, engine_email_type)
         assert new_column_type == column_data[index]['plain_type']
         assert updated_table.columns[index].name == column_data[index]['name']
+
+
+def test_batch_update_column_types_single_alter(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_pizza_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+
+    column_data = _get_pizza_column_data()
+    column_data[0]['plain_type'] = 'INTEGER'
+    column_data[2]['plain_type'] = 'BOOLEAN'
+    column_data[3]['plain_type'] = 'NUMERIC'
+
+    statements = []
+
+    def _record_statement(conn, cursor, statement, *_):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', _record_statement)
+    try:
+        batch_update_columns(table_oid, engine, column_data)
+    finally:
+        event.remove(engine, 'before_cursor_execute', _record_statement)
+
+    alter_statements = [s for s in statements if s.strip().startswith('ALTER TABLE')]
+    assert len(alter_statements) == 1
+    updated_table = reflect_table(table.name, schema, engine)
+    for index, column in enumerate(updated_table.columns):
+        assert get_db_type_name(column.type, engine) == column_data[index]['plain_type']
+
+
+def test_batch_update_column_types_casts_defaults(engine_email_type):
+    engine, schema = engine_email_type
+    table_name = 'Pizza Defaults'
+    cols = [
+        Column('Checkbox', String, server_default='true'),
+        Column('Rating', String, server_default='4.0'),
+    ]
+    table = create_test_table(table_name, cols, [('false', '3.5')], schema, engine)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+
+    column_data = [
+        {'name': 'Checkbox', 'plain_type': 'BOOLEAN'},
+        {'name': 'Rating', 'plain_type': 'NUMERIC'},
+    ]
+    batch_update_columns(table_oid, engine, column_data)
+
+    assert get_column_default(table_oid, 0, engine) is True
+    assert get_column_default(table_oid, 1, engine) == 4
+
+
+def _create_online_alter_table(engine, schema):
+    table_name = 'Online Alter'
+    cols = [
+        Column('id', Integer, primary_key=True),
+        Column('Rating', String, server_default='4.0', nullable=False),
+    ]
+    insert_data = [(i, f'{i}.5') for i in range(1, 6)]
+    return create_test_table(table_name, cols, insert_data, schema, engine)
+
+
+def test_alter_column_type_online(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    progress = []
+
+    new_index = alter_operations.alter_column_type_online(
+        table_oid, 1, engine, 'NUMERIC', batch_size=2,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert new_index == 1
+    updated_table = reflect_table(table.name, schema, engine)
+    assert [col.name for col in updated_table.columns] == ['id', 'Rating']
+    assert get_db_type_name(updated_table.columns[1].type, engine) == 'NUMERIC'
+    assert updated_table.columns[1].nullable is False
+    assert get_column_default(table_oid, 1, engine) == 4
+    with engine.begin() as conn:
+        rows = conn.execute(select(updated_table).order_by(updated_table.c.id)).fetchall()
+    assert [row[1] for row in rows] == [i + 0.5 for i in range(1, 6)]
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+
+
+def test_alter_column_type_online_moves_column(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    with engine.begin() as conn:
+        conn.execute(text(f'ALTER TABLE "{schema}"."{table.name}" ADD COLUMN "Notes" TEXT'))
+
+    new_index = alter_operations.alter_column_type_online(table_oid, 1, engine, 'NUMERIC')
+
+    assert new_index == 2
+    updated_table = reflect_table(table.name, schema, engine)
+    assert [col.name for col in updated_table.columns] == ['id', 'Notes', 'Rating']
+    assert updated_table.columns[2].nullable is False
+    assert [c.name for c in updated_table.constraints if c.name and 'shadow' in c.name] == []
+
+
+def test_alter_column_online(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    with engine.begin() as conn:
+        conn.execute(text(f'ALTER TABLE "{schema}"."{table.name}" ADD COLUMN "Notes" TEXT'))
+
+    column = alter_operations.alter_column(
+        engine, table_oid, 1, {'plain_type': 'NUMERIC', 'name': 'Score'},
+        online=True, batch_size=2,
+    )
+
+    assert column.name == 'Score'
+    assert column.column_index == 2
+    assert get_db_type_name(column.type, engine) == 'NUMERIC'
+    updated_table = reflect_table(table.name, schema, engine)
+    assert [col.name for col in updated_table.columns] == ['id', 'Notes', 'Score']
+
+
+def test_alter_column_type_online_cancel(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    batches = []
+
+    def _is_cancelled():
+        batches.append(True)
+        return len(batches) > 1
+
+    with pytest.raises(OnlineAlterCancelledError):
+        alter_operations.alter_column_type_online(
+            table_oid, 1, engine, 'NUMERIC', batch_size=2, is_cancelled=_is_cancelled,
+        )
+
+    updated_table = reflect_table(table.name, schema, engine)
+    assert [col.name for col in updated_table.columns] == ['id', 'Rating']
+    assert get_db_type_name(updated_table.columns[1].type, engine) == 'VARCHAR'
+
+
+def test_alter_column_type_online_bad_data(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    with engine.begin() as conn:
+        conn.execute(table.insert().values((6, 'not a number')))
+
+    with pytest.raises(Exception):
+        alter_operations.alter_column_type_online(table_oid, 1, engine, 'NUMERIC')
+
+    updated_table = reflect_table(table.name, schema, engine)
+    assert [col.name for col in updated_table.columns] == ['id', 'Rating']
+    assert get_db_type_name(updated_table.columns[1].type, engine) == 'VARCHAR'
+
+
+def test_alter_column_dry_run_retype(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    with engine.begin() as conn:
+        conn.execute(text(f'ANALYZE "{schema}"."{table.name}"'))
+
+    estimate = alter_column(engine, table_oid, 1, {'plain_type': 'NUMERIC'}, dry_run=True)
+
+    assert estimate[ROWS] == 5
+    assert estimate[REWRITE] is True
+    assert estimate[LOCK] == ACCESS_EXCLUSIVE
+    assert estimate[TABLE_SIZE] > 0
+    updated_table = reflect_table(table.name, schema, engine)
+    assert get_db_type_name(updated_table.columns[1].type, engine) == 'VARCHAR'
+
+
+def _create_varchar_alter_table(engine, schema):
+    table_name = 'Varchar Alter'
+    cols = [
+        Column('id', Integer, primary_key=True),
+        Column('Name', VARCHAR(10)),
+    ]
+    insert_data = [(i, f'name {i}') for i in range(1, 6)]
+    return create_test_table(table_name, cols, insert_data, schema, engine)
+
+
+def _get_relfilenode(table_oid, engine):
+    with engine.begin() as conn:
+        return conn.execute(
+            text(f"SELECT relfilenode FROM pg_class WHERE oid = {table_oid}")
+        ).scalar()
+
+
+@pytest.mark.parametrize(
+    'column_data', [
+        {'plain_type': 'TEXT'},
+        {'plain_type': 'VARCHAR', 'type_options': {'length': 20}},
+    ]
+)
+def test_alter_column_binary_coercible_no_rewrite(engine_email_type, column_data):
+    engine, schema = engine_email_type
+    table = _create_varchar_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    relfilenode = _get_relfilenode(table_oid, engine)
+
+    estimate = alter_column(engine, table_oid, 1, column_data, dry_run=True)
+    assert estimate[REWRITE] is False
+
+    alter_column(engine, table_oid, 1, column_data)
+    assert _get_relfilenode(table_oid, engine) == relfilenode
+    updated_table = reflect_table(table.name, schema, engine)
+    assert get_db_type_name(updated_table.columns[1].type, engine) == column_data['plain_type']
+
+
+def test_alter_column_narrowing_varchar_rewrites(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_varchar_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+
+    column_data = {'plain_type': 'VARCHAR', 'type_options': {'length': 8}}
+    estimate = alter_column(engine, table_oid, 1, column_data, dry_run=True)
+
+    assert estimate[REWRITE] is True
+
+
+def test_alter_column_dry_run_rename(engine_email_type):
+    engine, schema = engine_email_type
+    table = _create_online_alter_table(engine, schema)
+    table_oid = get_oid_from_table(table.name, schema, engine)
+
+    estimate = alter_column(engine, table_oid, 1, {'name': 'Score'}, dry_run=True)
+
+    assert estimate[REWRITE] is False
+    assert estimate[LOCK] == ACCESS_EXCLUSIVE
+    updated_table = reflect_table(table.name, schema, engine)
+    assert [col.name for col in updated_table.columns] == ['id', 'Rating']
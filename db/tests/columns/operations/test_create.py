@@ -1,8 +1,12 @@
 import pytest
-from sqlalchemy import Integer, Column, Table, MetaData, Numeric, UniqueConstraint
+from sqlalchemy import Integer, Column, Table, MetaData, Numeric, UniqueConstraint, text
+from sqlalchemy.exc import ProgrammingError
 
-from db.columns.operations.create import create_column, duplicate_column
+from db.columns.operations.create import (
+    batch_create_columns, copy_column_data_batched, create_column, duplicate_column
+)
 from db.columns.operations.select import get_column_default, get_column_index_from_name
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, LOCK, REWRITE
 from db.tables.operations.select import get_oid_from_table, reflect_table_from_oid
 from db.constraints.operations.select import get_column_constraints
 from db.tests.columns.utils import create_test_table
@@ -106,6 +110,52 @@ def test_create_column(engine_email_type, target_type):
     assert created_col.type.compile(engine.dialect) == input_output_type_map[target_type]
 
 
+def test_batch_create_columns(engine_email_type):
+    engine, schema = engine_email_type
+    table_name = "atablebatch"
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column("original_column", Integer),
+    )
+    table.create()
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    column_data_list = [
+        {"name": "numeric_column", "type": "NUMERIC", "type_options": {"precision": 5, "scale": 2}},
+        {"name": "email_column", "type": "MATHESAR_TYPES.EMAIL", "nullable": False},
+        {"name": "default_column", "type": "INTEGER", "default": 3},
+    ]
+    created_cols = batch_create_columns(engine, table_oid, column_data_list)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    assert len(altered_table.columns) == 4
+    assert [col.name for col in created_cols] == [
+        column_data["name"] for column_data in column_data_list
+    ]
+    assert created_cols[0].type.compile(engine.dialect) == "NUMERIC(5, 2)"
+    assert created_cols[1].nullable is False
+    assert get_column_default(table_oid, 3, engine) == 3
+
+
+def test_batch_create_columns_is_atomic(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "atablebatchatomic"
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column("original_column", Integer),
+    )
+    table.create()
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    column_data_list = [
+        {"name": "new_column", "type": "INTEGER"},
+        {"name": "original_column", "type": "INTEGER"},
+    ]
+    with pytest.raises(ProgrammingError):
+        batch_create_columns(engine, table_oid, column_data_list)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    assert [col.name for col in altered_table.columns] == ["original_column"]
+
+
 @pytest.mark.parametrize("target_type", ["NUMERIC", "DECIMAL"])
 def test_create_column_options(engine_email_type, target_type):
     engine, schema = engine_email_type
@@ -315,3 +365,112 @@ def test_duplicate_column_default(engine_with_schema, copy_data, copy_constraint
         assert default == expt_default
     else:
         assert default is None
+
+
+def _create_duplicate_batch_table(engine, schema, values):
+    table_name = "abatchtable"
+    cols = [
+        Column("id", Integer, primary_key=True),
+        Column("columtoduplicate", Numeric),
+    ]
+    insert_data = [(index, value) for index, value in enumerate(values, start=1)]
+    create_test_table(table_name, cols, insert_data, schema, engine)
+    return get_oid_from_table(table_name, schema, engine)
+
+
+def _check_duplicate_batch_data(table_oid, engine):
+    table = reflect_table_from_oid(table_oid, engine)
+    with engine.begin() as conn:
+        rows = conn.execute(table.select()).fetchall()
+    assert all([row[1] == row[2] for row in rows])
+
+
+def test_duplicate_column_batched(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_oid = _create_duplicate_batch_table(engine, schema, [1, 2, None, 4, 5])
+    progress = []
+    duplicate_column(
+        table_oid, 1, engine, "duplicated_column", batch_size=2,
+        progress_callback=lambda *args: progress.append(args),
+    )
+    assert progress == [(2, 5, 2), (4, 5, 4), (5, 5, 5)]
+    _check_duplicate_batch_data(table_oid, engine)
+
+
+def test_copy_column_data_batched_resume(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_oid = _create_duplicate_batch_table(engine, schema, [1, 2, 3, 4, 5])
+    duplicate_column(table_oid, 1, engine, "duplicated_column", copy_data=False)
+    last_key = copy_column_data_batched(table_oid, 1, 2, engine, 2, start_after=3)
+    assert last_key == 5
+    table = reflect_table_from_oid(table_oid, engine)
+    with engine.begin() as conn:
+        rows = conn.execute(table.select().order_by(table.c.id)).fetchall()
+    assert [row[2] for row in rows] == [None, None, None, 4, 5]
+
+
+def _analyze_table(table_oid, engine):
+    table = reflect_table_from_oid(table_oid, engine)
+    with engine.begin() as conn:
+        conn.execute(text(f"ANALYZE {engine.dialect.identifier_preparer.format_table(table)}"))
+
+
+def _get_missing_value(table_oid, column_name, engine):
+    with engine.begin() as conn:
+        return conn.execute(
+            text("SELECT attmissingval::text FROM pg_attribute WHERE attrelid = :oid AND attname = :name"),
+            {"oid": table_oid, "name": column_name},
+        ).scalar()
+
+
+@pytest.mark.parametrize(
+    "values,missing_value", [([7] * 3, "{7}"), ([7] * 20, "{7}"), ([None] * 3, None)]
+)
+def test_duplicate_constant_column_no_update(engine_with_schema, monkeypatch, values, missing_value):
+    engine, schema = engine_with_schema
+    table_oid = _create_duplicate_batch_table(engine, schema, values)
+    _analyze_table(table_oid, engine)
+
+    def _fail_update(*args, **kwargs):
+        raise AssertionError("The constant column was copied with an UPDATE")
+    monkeypatch.setattr("db.columns.operations.create._duplicate_column_data", _fail_update)
+    monkeypatch.setattr("db.columns.operations.create.copy_column_data_batched", _fail_update)
+    duplicate_column(table_oid, 1, engine, "duplicated_column")
+
+    # The values come from the catalog, rather than from the rows
+    assert _get_missing_value(table_oid, "duplicated_column", engine) == missing_value
+    _check_duplicate_batch_data(table_oid, engine)
+    assert get_column_default(table_oid, 2, engine) is None
+
+
+@pytest.mark.parametrize("values,analyze", [([7, 7, 7], False), ([1, 2, 3], True)])
+def test_duplicate_column_skips_constant_scan(engine_with_schema, monkeypatch, values, analyze):
+    engine, schema = engine_with_schema
+    table_oid = _create_duplicate_batch_table(engine, schema, values)
+    if analyze:
+        _analyze_table(table_oid, engine)
+
+    def _fail_scan(*args, **kwargs):
+        raise AssertionError("The constant check scanned the table")
+    monkeypatch.setattr(
+        "db.columns.operations.create._get_constant_column_value", _fail_scan
+    )
+    duplicate_column(table_oid, 1, engine, "duplicated_column")
+    _check_duplicate_batch_data(table_oid, engine)
+
+
+def test_duplicate_column_dry_run(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "atable"
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column("Filler", Numeric)
+    )
+    table.create()
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    estimate = duplicate_column(table_oid, 0, engine, "duplicated_column", dry_run=True)
+    assert estimate[REWRITE] is False
+    assert estimate[LOCK] == ACCESS_EXCLUSIVE
+    table = reflect_table_from_oid(table_oid, engine)
+    assert "duplicated_column" not in table.c
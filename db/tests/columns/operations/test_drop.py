@@ -1,6 +1,6 @@
 from sqlalchemy import String, Integer, Column, Table, MetaData
 
-from db.columns.operations.drop import drop_column
+from db.columns.operations.drop import batch_drop_columns, drop_column
 from db.tables.operations.select import get_oid_from_table, reflect_table_from_oid
 from db.tests.types import fixtures
 
@@ -28,3 +28,20 @@ def test_drop_column_correct_column(engine_with_schema):
     assert len(altered_table.columns) == 1
     assert nontarget_column_name in altered_table.columns
     assert target_column_name not in altered_table.columns
+
+
+def test_batch_drop_columns(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "atablebatch"
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column("first_column", Integer),
+        Column("second_column", String),
+        Column("third_column", String),
+    )
+    table.create()
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    batch_drop_columns(table_oid, [0, 2], engine)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    assert [col.name for col in altered_table.columns] == ["second_column"]
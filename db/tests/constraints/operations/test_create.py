@@ -1,8 +1,11 @@
 import pytest
-from sqlalchemy import String, Integer, Column, Table, MetaData
+from sqlalchemy import String, Integer, Column, Table, MetaData, UniqueConstraint, text
 from sqlalchemy.exc import ProgrammingError
 
-from db.constraints.operations.create import create_unique_constraint
+from db.constraints.exceptions import DuplicateValuesError
+from db.constraints.operations.create import (
+    create_unique_constraint, create_unique_constraint_concurrently
+)
 from db.tables.operations.select import get_oid_from_table, reflect_table_from_oid
 from db.tests.constraints import utils as test_utils
 
@@ -101,3 +104,111 @@ def test_create_unique_constraint_with_duplicate_name(engine_with_schema):
     test_utils.assert_primary_key_and_unique_present(altered_table)
     with pytest.raises(ProgrammingError):
         create_unique_constraint(table.name, schema, engine, [unique_column_names[1]], constraint_name)
+
+
+def test_create_unique_constraint_concurrently(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "orders_concurrent"
+    unique_column_names = ['product_name', 'customer_name']
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column('order_id', Integer, primary_key=True),
+        Column(unique_column_names[0], String),
+        Column(unique_column_names[1], String),
+    )
+    table.create()
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {'order_id': 1, 'product_name': 'a', 'customer_name': 'x'},
+            {'order_id': 2, 'product_name': 'a', 'customer_name': 'y'},
+            {'order_id': 3, 'product_name': None, 'customer_name': 'y'},
+            {'order_id': 4, 'product_name': None, 'customer_name': 'y'},
+        ])
+    table_oid = get_oid_from_table(table_name, schema, engine)
+
+    create_unique_constraint_concurrently(table.name, schema, engine, unique_column_names)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    test_utils.assert_primary_key_and_unique_present(altered_table)
+
+    unique_constraint = test_utils.get_first_unique_constraint(altered_table)
+    assert unique_constraint.name == f'{table_name}_{unique_column_names[0]}_key'
+    assert set([column.name for column in unique_constraint.columns]) == set(unique_column_names)
+
+
+def test_create_unique_constraint_concurrently_duplicates(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "orders_concurrent_dupes"
+    unique_column_name = 'product_name'
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column('order_id', Integer, primary_key=True),
+        Column(unique_column_name, String),
+    )
+    table.create()
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {'order_id': 1, 'product_name': 'a'},
+            {'order_id': 2, 'product_name': 'a'},
+            {'order_id': 3, 'product_name': 'b'},
+        ])
+
+    with pytest.raises(DuplicateValuesError) as e:
+        create_unique_constraint_concurrently(table.name, schema, engine, [unique_column_name])
+    assert e.value.duplicate_groups == [{'product_name': 'a', '_dupe_count': 2}]
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    assert len(altered_table.indexes) == 0
+    test_utils.assert_only_primary_key_present(altered_table)
+
+
+def _create_concurrent_cleanup_table(engine, schema):
+    table = Table(
+        "orders_concurrent_cleanup",
+        MetaData(bind=engine, schema=schema),
+        Column('order_id', Integer, primary_key=True),
+        Column('product_name', String),
+        Column('customer_name', String),
+    )
+    table.create()
+    return table
+
+
+def test_create_unique_constraint_concurrently_name_taken(engine_with_schema):
+    engine, schema = engine_with_schema
+    table = _create_concurrent_cleanup_table(engine, schema)
+    constraint_name = 'orders_unique'
+    create_unique_constraint(table.name, schema, engine, ['product_name'], constraint_name)
+
+    with pytest.raises(ProgrammingError):
+        create_unique_constraint_concurrently(
+            table.name, schema, engine, ['customer_name'], constraint_name
+        )
+    # The existing index with that name is left alone
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    unique_constraint = test_utils.get_first_unique_constraint(altered_table)
+    assert unique_constraint.name == constraint_name
+    assert [column.name for column in unique_constraint.columns] == ['product_name']
+
+
+def test_create_unique_constraint_concurrently_attach_fails(engine_with_schema):
+    engine, schema = engine_with_schema
+    table = _create_concurrent_cleanup_table(engine, schema)
+    constraint_name = 'orders_check'
+    with engine.begin() as conn:
+        conn.execute(text(
+            f'ALTER TABLE "{schema}"."{table.name}"'
+            f' ADD CONSTRAINT {constraint_name} CHECK (order_id > 0)'
+        ))
+
+    # The index builds, but a check constraint already has its name
+    with pytest.raises(ProgrammingError):
+        create_unique_constraint_concurrently(
+            table.name, schema, engine, ['product_name'], constraint_name
+        )
+    table_oid = get_oid_from_table(table.name, schema, engine)
+    altered_table = reflect_table_from_oid(table_oid, engine)
+    assert len(altered_table.indexes) == 0
+    assert not any(isinstance(c, UniqueConstraint) for c in altered_table.constraints)
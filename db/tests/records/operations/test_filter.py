@@ -5,7 +5,7 @@ from collections import Counter
 
 from sqlalchemy_filters.exceptions import BadFilterFormat, FilterFieldNotFound
 
-from db.records.operations.select import get_records
+from db.records.operations.select import DUPLICATE_COUNT_LABEL, get_duplicate_groups, get_records
 
 
 def test_get_records_filters_using_col_str_names(roster_table_obj):
@@ -92,6 +92,30 @@ def test_get_records_filters_duplicates(roster_table_obj):
     assert all_counter == got_counter
 
 
+def test_get_duplicate_groups(roster_table_obj):
+    roster, engine = roster_table_obj
+    dupe_cols = ["Grade", "Subject"]
+
+    full_record_list = get_records(roster, engine)
+    duplicate_groups = get_duplicate_groups(roster, engine, dupe_cols)
+
+    all_counter = Counter(
+        tuple(r[c] for c in dupe_cols) for r in full_record_list
+        if all(r[c] is not None for c in dupe_cols)
+    )
+    all_counter = {k: v for k, v in all_counter.items() if v > 1}
+    got_counter = {
+        tuple(g[c] for c in dupe_cols): g[DUPLICATE_COUNT_LABEL] for g in duplicate_groups
+    }
+    assert all_counter == got_counter
+
+
+def test_get_duplicate_groups_limit(roster_table_obj):
+    roster, engine = roster_table_obj
+    duplicate_groups = get_duplicate_groups(roster, engine, ["Subject"], limit=1)
+    assert len(duplicate_groups) == 1
+
+
 def _like(x, v):
     return re.match(v.replace("%", ".*"), x) is not None
 
@@ -1,9 +1,14 @@
 from decimal import Decimal
 
-from sqlalchemy import Column
+import pytest
+from sqlalchemy import Column, Enum, Integer, LargeBinary, MetaData, Table
 from sqlalchemy import String
 
-from db.records.operations.select import get_records, get_column_cast_records
+from db.records.exceptions import BadProjectionFormat, ProjectionFieldNotFound
+from db.records.operations.select import (
+    get_record, get_records, get_column_cast_records, get_column_cast_failures,
+    get_preview_column_names,
+)
 from db.tables.operations.create import create_mathesar_table
 from db.tests.types import fixtures
 
@@ -32,6 +37,104 @@ def test_get_records_gets_limited_offset_records(roster_table_obj):
     assert len(offset_records) == 10 and offset_records[0] == base_records[5]
 
 
+def test_get_records_projects_columns(roster_table_obj):
+    roster, engine = roster_table_obj
+    base_records = get_records(roster, engine, limit=10)
+    record_list = get_records(roster, engine, limit=10, columns=["Grade", "Student Name"])
+    # The primary key is always included, and columns stay in table order
+    assert list(record_list[0].keys()) == [
+        col.name for col in roster.columns
+        if col.name in ["Grade", "Student Name"] or col.primary_key
+    ]
+    assert [r["Grade"] for r in record_list] == [r["Grade"] for r in base_records]
+
+
+def test_get_records_projection_filters_unselected_columns(roster_table_obj):
+    roster, engine = roster_table_obj
+    filter_list = [{"field": "Subject", "op": "==", "value": "Math"}]
+    order_list = [
+        {"field": "Student Name", "direction": "desc"}, {"field": "id", "direction": "asc"}
+    ]
+    base_records = get_records(roster, engine, filters=filter_list, order_by=order_list)
+    record_list = get_records(
+        roster, engine, filters=filter_list, order_by=order_list, columns=["Grade"]
+    )
+    assert [r["Grade"] for r in record_list] == [r["Grade"] for r in base_records]
+    assert "Subject" not in record_list[0].keys()
+
+
+def test_get_records_projection_with_duplicates(roster_table_obj):
+    roster, engine = roster_table_obj
+    filter_list = [{"field": "", "op": "get_duplicates", "value": ["Grade", "Subject"]}]
+    base_records = get_records(roster, engine, filters=filter_list)
+    record_list = get_records(roster, engine, filters=filter_list, columns=["Grade"])
+    assert len(record_list) == len(base_records)
+    assert "Subject" not in record_list[0].keys()
+
+
+@pytest.mark.parametrize("columns,exception", [
+    (["Not a column"], ProjectionFieldNotFound),
+    ("Grade", BadProjectionFormat),
+    ([1], BadProjectionFormat),
+])
+def test_get_records_projection_exceptions(roster_table_obj, columns, exception):
+    roster, engine = roster_table_obj
+    with pytest.raises(exception):
+        get_records(roster, engine, columns=columns)
+
+
+def test_get_record_projects_columns(roster_table_obj):
+    roster, engine = roster_table_obj
+    base_record = get_records(roster, engine, limit=1)[0]
+    record = get_record(roster, engine, base_record["id"], columns=["Grade"])
+    assert list(record.keys()) == ["id", "Grade"]
+    assert record["Grade"] == base_record["Grade"]
+
+
+def test_get_records_previews_text_columns(roster_table_obj):
+    roster, engine = roster_table_obj
+    base_records = get_records(roster, engine, limit=10)
+    record_list = get_records(roster, engine, limit=10, preview_length=3)
+    preview_column_names = get_preview_column_names(roster)
+    assert "Student Name" in preview_column_names
+    assert "Grade" not in preview_column_names
+    column_count = len(roster.columns)
+    for record, base_record in zip(record_list, base_records):
+        assert record["Student Name"] == base_record["Student Name"][:3]
+        assert record["Grade"] == base_record["Grade"]
+        # The lengths come after all the columns, in the order of their names
+        lengths = dict(zip(preview_column_names, record[column_count:]))
+        assert lengths["Student Name"] == len(base_record["Student Name"])
+        assert len(record) == column_count + len(preview_column_names)
+    assert list(record_list[0].keys())[:column_count] == list(roster.columns.keys())
+
+
+def test_get_records_previews_binary_not_enum_columns(engine_with_schema):
+    engine, schema = engine_with_schema
+    table = Table(
+        "preview_table",
+        MetaData(bind=engine, schema=schema),
+        Column("id", Integer, primary_key=True),
+        Column("mood", Enum("happy", "grumpy", name="mood", schema=schema)),
+        Column("data", LargeBinary),
+    )
+    table.create()
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [
+            {"id": 1, "mood": "grumpy", "data": b"\x00\x01\x02\x03\x04"},
+            {"id": 2, "mood": "happy", "data": None},
+        ])
+
+    record_list = get_records(table, engine, preview_length=3)
+
+    assert get_preview_column_names(table) == ["data"]
+    assert [record["mood"] for record in record_list] == ["grumpy", "happy"]
+    assert bytes(record_list[0]["data"]) == b"\x00\x01\x02"
+    assert record_list[0][len(table.columns)] == 5
+    assert record_list[1]["data"] is None
+    assert record_list[1][len(table.columns)] is None
+
+
 def test_get_column_cast_records(engine_email_type):
     COL1 = "col1"
     COL2 = "col2"
@@ -92,3 +195,36 @@ def test_get_column_cast_records_options(engine_email_type):
             type(record[COL1 + "_mod"]) == str
             and type(record[COL2 + "_mod"]) == Decimal
         )
+
+
+def test_get_column_cast_failures(engine_email_type):
+    COL1 = "col1"
+    engine, schema = engine_email_type
+    table_name = "table_with_columns"
+    table = create_mathesar_table(
+        table_name, schema, [Column(COL1, String)], engine
+    )
+    ins = table.insert().values(
+        [{COL1: '1'}, {COL1: 'two'}, {COL1: None}, {COL1: 'four'}, {COL1: '5'}]
+    )
+    with engine.begin() as conn:
+        conn.execute(ins)
+    count, records = get_column_cast_failures(engine, table, COL1, "NUMERIC", num_records=1)
+    assert count == 2
+    assert records == [{"id": 2, COL1: 'two'}]
+
+
+def test_get_column_cast_failures_none(engine_email_type):
+    COL1 = "col1"
+    engine, schema = engine_email_type
+    table_name = "table_with_columns"
+    table = create_mathesar_table(
+        table_name, schema, [Column(COL1, String)], engine
+    )
+    with engine.begin() as conn:
+        conn.execute(table.insert().values([{COL1: '1'}, {COL1: None}]))
+    count, records = get_column_cast_failures(
+        engine, table, COL1, "NUMERIC", sample_percent=100
+    )
+    assert count == 0
+    assert records == []
@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select
+
+from db.records import coalescing
+from db.records.coalescing import QueryCoalescer
+
+
+def test_query_coalescer_shares_concurrent_execution():
+    coalescer = QueryCoalescer(result_ttl=0)
+    started = threading.Event()
+    release = threading.Event()
+    executions = []
+
+    def run_query():
+        executions.append(1)
+        started.set()
+        release.wait(5)
+        return ["result"]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(coalescer.execute("t", "q", run_query)))
+        for _ in range(5)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(executions) == 1
+    assert results == [["result"]] * 5
+
+
+def test_query_coalescer_caches_until_invalidated():
+    coalescer = QueryCoalescer(result_ttl=60)
+    executions = []
+
+    def run_query():
+        executions.append(1)
+        return len(executions)
+
+    assert coalescer.execute("t", "q", run_query) == 1
+    assert coalescer.execute("t", "q", run_query) == 1
+    assert coalescer.execute("t", "other q", run_query) == 2
+    coalescer.invalidate("t")
+    assert coalescer.execute("t", "q", run_query) == 3
+
+
+def test_query_coalescer_result_expires():
+    coalescer = QueryCoalescer(result_ttl=0.01)
+    executions = []
+
+    def run_query():
+        executions.append(1)
+        return len(executions)
+
+    assert coalescer.execute("t", "q", run_query) == 1
+    time.sleep(0.02)
+    assert coalescer.execute("t", "q", run_query) == 2
+
+
+def test_query_coalescer_max_results():
+    coalescer = QueryCoalescer(result_ttl=60, max_results=2)
+    for query_key in ["a", "b", "c"]:
+        coalescer.execute("t", query_key, lambda: query_key)
+    assert coalescer.execute("t", "a", lambda: "new a") == "new a"
+    assert coalescer.execute("t", "c", lambda: "new c") == "c"
+
+
+def test_query_coalescer_does_not_cache_across_invalidation():
+    coalescer = QueryCoalescer(result_ttl=60)
+
+    def run_query():
+        # A write lands while the read is running
+        coalescer.invalidate("t")
+        return "stale"
+
+    assert coalescer.execute("t", "q", run_query) == "stale"
+    assert coalescer.execute("t", "q", lambda: "fresh") == "fresh"
+
+
+def test_query_coalescer_shares_errors():
+    coalescer = QueryCoalescer(result_ttl=60)
+
+    def run_query():
+        raise ValueError("bad query")
+
+    with pytest.raises(ValueError):
+        coalescer.execute("t", "q", run_query)
+    assert coalescer.execute("t", "q", lambda: "ok") == "ok"
+
+
+def test_execute_coalesced_keys_on_params():
+    coalescing.configure_coalescing(result_ttl=60)
+    engine = create_engine("postgresql://user@localhost:5432/coalescing_test", future=True)
+    sa_table = Table("t", MetaData(), Column("id", Integer), schema="s")
+    table_oid = 1234
+    try:
+        one = coalescing.execute_coalesced(
+            engine, table_oid, select(sa_table).where(sa_table.c.id == 1), lambda: "one"
+        )
+        two = coalescing.execute_coalesced(
+            engine, table_oid, select(sa_table).where(sa_table.c.id == 2), lambda: "two"
+        )
+        again = coalescing.execute_coalesced(
+            engine, table_oid, select(sa_table).where(sa_table.c.id == 1), lambda: "again"
+        )
+        assert (one, two, again) == ("one", "two", "one")
+        coalescing.invalidate_table_results(engine, table_oid)
+        assert coalescing.execute_coalesced(
+            engine, table_oid, select(sa_table).where(sa_table.c.id == 1), lambda: "again"
+        ) == "again"
+    finally:
+        coalescing.configure_coalescing()
+
+
+def test_execute_coalesced_keys_on_table_oid_options_and_version():
+    coalescing.configure_coalescing(result_ttl=60)
+    engine = create_engine("postgresql://user@localhost:5432/coalescing_test", future=True)
+    sa_table = Table("t", MetaData(), Column("id", Integer), schema="s")
+    query = select(sa_table)
+    try:
+        assert coalescing.execute_coalesced(engine, 1, query, lambda: "old table") == "old table"
+        # The same table name, recreated with another oid
+        assert coalescing.execute_coalesced(engine, 2, query, lambda: "new table") == "new table"
+        assert coalescing.execute_coalesced(
+            engine, 2, query, lambda: "tagged", query_options={"query_tag": "abc"}
+        ) == "tagged"
+        assert coalescing.execute_coalesced(
+            engine, 2, query, lambda: "next version", data_version=5
+        ) == "next version"
+        assert coalescing.execute_coalesced(engine, 2, query, lambda: "again") == "new table"
+    finally:
+        coalescing.configure_coalescing()
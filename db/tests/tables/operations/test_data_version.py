@@ -0,0 +1,111 @@
+from sqlalchemy import Column, Integer, MetaData, Table, select, text
+
+from db.tables.operations.data_version import (
+    TRIGGER_NAME, bump_data_version, ensure_data_version_trigger, get_data_version
+)
+from db.tables.operations.select import get_oid_from_table
+from db.tests.types import fixtures
+
+
+engine_with_types = fixtures.engine_with_types
+temporary_testing_schema = fixtures.temporary_testing_schema
+engine_email_type = fixtures.engine_email_type
+
+
+def _create_versioned_table(engine, schema):
+    table = Table(
+        "versioned", MetaData(bind=engine, schema=schema),
+        Column("id", Integer, primary_key=True),
+        Column("value", Integer),
+    )
+    table.create()
+    return table, get_oid_from_table(table.name, schema, engine)
+
+
+def test_data_version_bumped_by_writes(engine_email_type):
+    engine, schema = engine_email_type
+    table, table_oid = _create_versioned_table(engine, schema)
+    assert get_data_version(table_oid, engine) == 0
+
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [{"id": 1, "value": 1}, {"id": 2, "value": 2}])
+    assert get_data_version(table_oid, engine) == 1
+    # A transaction bumps the version once, however many writes it makes
+    with engine.begin() as conn:
+        conn.execute(table.update().values(value=3))
+        conn.execute(table.delete().where(table.c.id == 1))
+    assert get_data_version(table_oid, engine) == 2
+    with engine.begin() as conn:
+        conn.execute(text(f'TRUNCATE "{schema}"."{table.name}"'))
+    assert get_data_version(table_oid, engine) == 3
+
+
+def test_data_version_bumped_at_commit(engine_email_type):
+    engine, schema = engine_email_type
+    table, table_oid = _create_versioned_table(engine, schema)
+    get_data_version(table_oid, engine)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        conn.execute(table.insert(), {"id": 1, "value": 1})
+        # The uncommitted write isn't visible, and neither is its version
+        assert get_data_version(table_oid, engine) == 0
+        trans.commit()
+    assert get_data_version(table_oid, engine) == 1
+
+
+def test_data_version_not_bumped_by_rollback(engine_email_type):
+    engine, schema = engine_email_type
+    table, table_oid = _create_versioned_table(engine, schema)
+    get_data_version(table_oid, engine)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        conn.execute(table.insert(), {"id": 1, "value": 1})
+        trans.rollback()
+    assert get_data_version(table_oid, engine) == 0
+
+
+def test_data_version_not_bumped_by_reads(engine_email_type):
+    engine, schema = engine_email_type
+    table, table_oid = _create_versioned_table(engine, schema)
+    get_data_version(table_oid, engine)
+    with engine.begin() as conn:
+        conn.execute(select(table))
+    assert get_data_version(table_oid, engine) == 0
+
+
+def test_bump_data_version(engine_email_type):
+    engine, schema = engine_email_type
+    _, table_oid = _create_versioned_table(engine, schema)
+    bump_data_version(table_oid, engine)
+    bump_data_version(table_oid, engine)
+    assert get_data_version(table_oid, engine) == 2
+
+
+def test_ensure_data_version_trigger_idempotent(engine_email_type):
+    engine, schema = engine_email_type
+    _, table_oid = _create_versioned_table(engine, schema)
+    ensure_data_version_trigger(table_oid, engine)
+    ensure_data_version_trigger(table_oid, engine)
+    with engine.begin() as conn:
+        trigger_count = conn.execute(
+            text("SELECT count(*) FROM pg_trigger WHERE tgrelid = :oid AND tgname = :name"),
+            {"oid": table_oid, "name": TRIGGER_NAME},
+        ).scalar()
+    assert trigger_count == 1
+
+
+def test_data_version_does_not_serialize_writers(engine_email_type):
+    engine, schema = engine_email_type
+    table, table_oid = _create_versioned_table(engine, schema)
+    get_data_version(table_oid, engine)
+    with engine.connect() as conn_1, engine.connect() as conn_2:
+        trans_1 = conn_1.begin()
+        conn_1.execute(table.insert(), {"id": 1, "value": 1})
+        trans_2 = conn_2.begin()
+        # This would time out if the first (uncommitted) write held a lock
+        # needed to bump the version.
+        conn_2.execute(text("SET LOCAL lock_timeout = 1000"))
+        conn_2.execute(table.insert(), {"id": 2, "value": 2})
+        trans_2.commit()
+        trans_1.commit()
+    assert get_data_version(table_oid, engine) == 2
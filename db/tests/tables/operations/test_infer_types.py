@@ -3,11 +3,13 @@ from unittest.mock import call, patch
 from sqlalchemy import Column, MetaData, Table, select
 from sqlalchemy import BOOLEAN, Numeric, NUMERIC, String, VARCHAR, DATE
 
-from db.columns.operations.infer_types import infer_column_type
+from db.columns.operations.infer_types import infer_column_type, infer_column_type_from_values
 from db.tables.operations import infer_types as infer_operations
 from db.tables.operations.create import create_mathesar_table
+from db.tables.operations.select import reflect_table
 from db.tests.types import fixtures
-from db.types import email, uri, datetime
+from db.types import base, email, uri, datetime
+from db.types.operations.cast import get_supported_alter_column_types
 
 
 # We need to set these variables when the file loads, or pytest can't
@@ -52,6 +54,12 @@ type_data_list = [
 ]
 
 
+def _get_python_inference_type(type_str, engine):
+    if type_str == base.STRING:
+        return VARCHAR
+    return get_supported_alter_column_types(engine)[type_str]
+
+
 def create_test_table(engine, schema, table_name, column_name, column_type, values):
     metadata = MetaData(bind=engine)
     input_table = Table(
@@ -119,6 +127,76 @@ def test_table_inference(engine_email_type, type_, value_list, expect_type):
     assert original_table == new_table
 
 
+@pytest.mark.parametrize("type_,value_list,expect_type", type_data_list)
+def test_table_inference_single_scan(engine_email_type, type_, value_list, expect_type):
+    engine, schema = engine_email_type
+    TEST_TABLE = "test_table"
+    TEST_COLUMN = "test_column"
+    input_table = create_test_table(
+        engine, schema, TEST_TABLE, TEST_COLUMN, type_, value_list
+    )
+
+    with engine.begin() as conn:
+        results = conn.execute(select(input_table))
+    original_table = results.fetchall()
+
+    inferred_types = infer_operations.infer_table_column_types_single_scan(
+        schema,
+        TEST_TABLE,
+        engine
+    )
+    assert inferred_types == [expect_type]
+
+    with engine.begin() as conn:
+        results = conn.execute(select(input_table))
+    new_table = results.fetchall()
+    assert original_table == new_table
+
+
+@pytest.mark.parametrize("sample_method", [None] + list(infer_operations.SAMPLE_METHODS))
+@pytest.mark.parametrize("type_,value_list,expect_type", type_data_list)
+def test_table_inference_from_sample(
+        engine_email_type, type_, value_list, expect_type, sample_method
+):
+    engine, schema = engine_email_type
+    TEST_TABLE = "test_table"
+    TEST_COLUMN = "test_column"
+    create_test_table(engine, schema, TEST_TABLE, TEST_COLUMN, type_, value_list)
+
+    inferred_types = infer_operations.infer_table_column_types_from_sample(
+        schema, TEST_TABLE, engine, sample_method=sample_method, seed=1,
+    )
+    assert inferred_types == [expect_type]
+
+
+@pytest.mark.parametrize("verify,expect_type", [(True, VARCHAR), (False, NUMERIC)])
+def test_table_inference_from_sample_verify(engine_email_type, verify, expect_type):
+    engine, schema = engine_email_type
+    TEST_TABLE = "test_table"
+    TEST_COLUMN = "test_column"
+    values = ["2", "1", "5", "cat"]
+    create_test_table(engine, schema, TEST_TABLE, TEST_COLUMN, String, values)
+
+    inferred_types = infer_operations.infer_table_column_types_from_sample(
+        schema, TEST_TABLE, engine, sample_size=3, verify=verify,
+    )
+    assert inferred_types == [expect_type]
+
+
+@pytest.mark.parametrize(
+    "type_,value_list,expect_type",
+    [type_data for type_data in type_data_list if type_data[0] == String]
+)
+def test_python_type_inference_matches_db(engine_email_type, type_, value_list, expect_type):
+    engine, _ = engine_email_type
+    type_str = infer_column_type_from_values(value_list)
+    assert _get_python_inference_type(type_str, engine) == expect_type
+
+
+def test_python_type_inference_ignores_empty_values():
+    assert infer_column_type_from_values(["1", "", None, "2"]) == base.PostgresType.NUMERIC.value
+
+
 def test_table_inference_drop_temp(engine_email_type):
     engine, schema = engine_email_type
     TEST_TABLE = "test_table"
@@ -200,6 +278,28 @@ def test_update_table_column_types_infers_non_default_types(engine_with_schema):
     mock_infer.assert_has_calls(expect_calls)
 
 
+def test_update_table_column_types_parallel(engine_email_type):
+    engine, schema = engine_email_type
+    table_name = "table_with_columns"
+    values = ["a", "t", "2", "2000-01-12", "23:12", "alice@example.com"]
+    expect_types = [VARCHAR, BOOLEAN, NUMERIC, DATE, datetime.TIME_WITHOUT_TIME_ZONE, email.Email]
+    table = Table(
+        table_name,
+        MetaData(bind=engine),
+        *[Column(f"col_{i}", String) for i in range(len(values))],
+        schema=schema
+    )
+    table.create()
+    with engine.begin() as conn:
+        conn.execute(table.insert().values(values))
+
+    infer_operations.update_table_column_types(
+        schema, table_name, engine, parallel=True, max_workers=3
+    )
+    updated_table = reflect_table(table_name, schema, engine)
+    assert [col.type.__class__ for col in updated_table.columns] == expect_types
+
+
 def test_update_table_column_types_skips_pkey_columns(engine_with_schema):
     column_list = [Column("checkcol", String, primary_key=True)]
     engine, schema = engine_with_schema
@@ -1,6 +1,7 @@
 from sqlalchemy import MetaData, select
 
 from db.columns.defaults import DEFAULT_COLUMNS
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, LOCK, REWRITE, TABLE_SIZE
 from db.tables.operations.merge import merge_tables
 
 
@@ -108,3 +109,23 @@ def test_merge_columns_returns_original_data_ext_rem(extracted_remainder_roster)
         expect_tuples = conn.execute(expect_tuple_sel).fetchall()
         actual_tuples = conn.execute(actual_tuple_sel).fetchall()
     assert sorted(expect_tuples) == sorted(actual_tuples)
+
+
+def test_merge_tables_dry_run(extracted_remainder_roster):
+    extracted, remainder, _, engine, schema = extracted_remainder_roster
+    estimate = merge_tables(
+        remainder.name,
+        extracted.name,
+        "Merged Roster",
+        schema,
+        engine,
+        drop_original_tables=True,
+        dry_run=True,
+    )
+    assert estimate[REWRITE] is True
+    assert estimate[LOCK] == ACCESS_EXCLUSIVE
+    assert estimate[TABLE_SIZE] > 0
+    metadata = MetaData(bind=engine, schema=schema)
+    metadata.reflect()
+    assert f"{schema}.Merged Roster" not in metadata.tables
+    assert f"{schema}.{extracted.name}" in metadata.tables
@@ -1,5 +1,8 @@
-from sqlalchemy import MetaData
+from unittest.mock import patch
 
+from sqlalchemy import MetaData, select
+
+from db.tables.operations import move_columns
 from db.tables.operations.move_columns import move_columns_between_related_tables
 
 
@@ -57,3 +60,50 @@ def test_move_columns_moves_column_from_rem_to_ext(extracted_remainder_roster):
     actual_remainder_cols = [col.name for col in new_remainder.columns]
     assert sorted(actual_extracted_cols) == sorted(expect_extracted_cols)
     assert sorted(actual_remainder_cols) == sorted(expect_remainder_cols)
+
+
+def _get_rows_by_id(table, engine):
+    with engine.begin() as conn:
+        return {row["id"]: row for row in conn.execute(select(table)).mappings()}
+
+
+def test_move_columns_to_referencing_in_place(extracted_remainder_roster, roster_extracted_cols):
+    extracted, remainder, _, engine, schema = extracted_remainder_roster
+    moving_col = roster_extracted_cols[0]
+    fkey_col = [col for col in remainder.columns if col.foreign_keys][0].name
+    extracted_rows = _get_rows_by_id(extracted, engine)
+    remainder_rows = _get_rows_by_id(remainder, engine)
+
+    new_extracted, new_remainder = move_columns_between_related_tables(
+        extracted.name, remainder.name, [moving_col], schema, engine,
+    )
+
+    # ids are kept, and each row gets the value of the row it referenced
+    new_remainder_rows = _get_rows_by_id(new_remainder, engine)
+    assert new_remainder_rows.keys() == remainder_rows.keys()
+    for id_, row in new_remainder_rows.items():
+        assert row[moving_col] == extracted_rows[row[fkey_col]][moving_col]
+    assert _get_rows_by_id(new_extracted, engine).keys() == extracted_rows.keys()
+    assert moving_col not in new_extracted.columns
+
+
+def test_move_columns_to_referenced_in_place(extracted_remainder_roster, roster_extracted_cols):
+    extracted, remainder, _, engine, schema = extracted_remainder_roster
+    moving_col = roster_extracted_cols[1]
+    moved_extracted, _ = move_columns_between_related_tables(
+        extracted.name, remainder.name, [moving_col], schema, engine,
+    )
+    extracted_rows = _get_rows_by_id(moved_extracted, engine)
+
+    # The moved column is determined by the referenced row, so it can be
+    # moved back without splitting any rows.
+    with patch.object(move_columns, "_move_columns_by_merging") as mock_merge:
+        new_extracted, _ = move_columns_between_related_tables(
+            remainder.name, extracted.name, [moving_col], schema, engine,
+        )
+    mock_merge.assert_not_called()
+    new_extracted_rows = _get_rows_by_id(new_extracted, engine)
+    assert new_extracted_rows.keys() == extracted_rows.keys()
+    assert all(
+        new_extracted_rows[id_][moving_col] is not None for id_ in new_extracted_rows
+    )
@@ -1,8 +1,10 @@
-from sqlalchemy import MetaData, select
+import pytest
+from sqlalchemy import MetaData, func, select, table, text
 
 from db import constants
 from db.columns.defaults import DEFAULT_COLUMNS
-from db.tables.operations.split import extract_columns_from_table
+from db.tables.operations.estimate import ACCESS_EXCLUSIVE, BYTES, LOCK, REWRITE, ROWS, TABLE_SIZE
+from db.tables.operations.split import SPLIT_STRATEGIES, extract_columns_from_table
 
 
 def test_extract_columns_from_table_creates_tables(engine_with_roster, roster_table_name, teachers_table_name, roster_no_teachers_table_name, roster_extracted_cols):
@@ -118,3 +120,119 @@ def test_extract_columns_leaves_correct_data(extracted_remainder_roster, roster_
         expect_tuples = conn.execute(expect_tuple_sel).fetchall()
         actual_tuples = conn.execute(actual_tuple_sel).fetchall()
     assert sorted(expect_tuples) == sorted(actual_tuples)
+
+
+@pytest.mark.parametrize("split_strategy", SPLIT_STRATEGIES)
+def test_extract_columns_split_strategy_rejoins_to_original(
+        engine_with_roster, roster_table_name, roster_extracted_cols, roster_fkey_col, split_strategy
+):
+    engine, schema = engine_with_roster
+    extracted, remainder, _ = extract_columns_from_table(
+        roster_table_name,
+        roster_extracted_cols,
+        "Teachers",
+        "Roster without Teachers",
+        schema,
+        engine,
+        split_strategy=split_strategy,
+    )
+    metadata = MetaData(bind=engine, schema=schema)
+    metadata.reflect()
+    roster = metadata.tables[f"{schema}.{roster_table_name}"]
+    extracted = metadata.tables[f"{schema}.{extracted.name}"]
+    remainder = metadata.tables[f"{schema}.{remainder.name}"]
+    assert sorted(col.name for col in extracted.columns) == sorted([constants.ID] + roster_extracted_cols)
+
+    column_names = [
+        col.name for col in roster.columns if col.name not in DEFAULT_COLUMNS
+    ]
+    expect_tuple_sel = select([roster.columns[name] for name in column_names])
+    joined = remainder.join(extracted, remainder.columns[roster_fkey_col] == extracted.columns[constants.ID])
+    actual_tuple_sel = select(
+        [
+            extracted.columns[name] if name in roster_extracted_cols else remainder.columns[name]
+            for name in column_names
+        ]
+    ).select_from(joined)
+    with engine.begin() as conn:
+        expect_tuples = conn.execute(expect_tuple_sel).fetchall()
+        actual_tuples = conn.execute(actual_tuple_sel).fetchall()
+        extracted_count = conn.execute(select(func.count()).select_from(extracted)).scalar()
+        max_extracted_id = conn.execute(select(func.max(extracted.columns[constants.ID]))).scalar()
+        distinct_count = conn.execute(
+            select(func.count()).select_from(
+                select([roster.columns[name] for name in roster_extracted_cols]).distinct().subquery()
+            )
+        ).scalar()
+    assert sorted(expect_tuples) == sorted(actual_tuples)
+    assert extracted_count == distinct_count
+    # Ids are only drawn for the distinct tuples
+    assert max_extracted_id == extracted_count
+
+
+@pytest.mark.parametrize("split_strategy", SPLIT_STRATEGIES)
+def test_extract_columns_split_strategy_long_values(engine_with_schema, split_strategy):
+    engine, schema = engine_with_schema
+    table_name = "long_values"
+    long_value = "x" * 10000
+    with engine.begin() as conn:
+        conn.execute(text(
+            f'CREATE TABLE "{schema}"."{table_name}" (id serial PRIMARY KEY, a text, b text)'
+        ))
+        conn.execute(text(
+            f'INSERT INTO "{schema}"."{table_name}" (a, b) VALUES'
+            f" ('{long_value}', '1'), ('{long_value}', '2'), (NULL, '3'), (NULL, '4')"
+        ))
+    extracted, remainder, fkey = extract_columns_from_table(
+        table_name, ["a"], "long_values_a", "long_values_b", schema, engine,
+        split_strategy=split_strategy,
+    )
+    with engine.begin() as conn:
+        extracted_count = conn.execute(select(func.count()).select_from(extracted)).scalar()
+        remainder_fkeys = conn.execute(select(remainder.columns[fkey])).fetchall()
+    assert extracted_count == 2
+    assert len(remainder_fkeys) == 4
+    assert len(set(remainder_fkeys)) == 2
+
+
+def test_extract_columns_bad_split_strategy(engine_with_roster, roster_table_name, roster_extracted_cols):
+    engine, schema = engine_with_roster
+    with pytest.raises(ValueError):
+        extract_columns_from_table(
+            roster_table_name,
+            roster_extracted_cols,
+            "Teachers",
+            "Roster without Teachers",
+            schema,
+            engine,
+            split_strategy="bogus",
+        )
+
+
+def test_extract_columns_dry_run(engine_with_roster, roster_table_name, roster_extracted_cols):
+    engine, schema = engine_with_roster
+    with engine.begin() as conn:
+        conn.execute(text(f'ANALYZE "{schema}"."{roster_table_name}"'))
+        roster_count = conn.execute(
+            select(func.count()).select_from(table(roster_table_name, schema=schema))
+        ).scalar()
+
+    estimate = extract_columns_from_table(
+        roster_table_name,
+        roster_extracted_cols,
+        "Teachers",
+        "Roster without Teachers",
+        schema,
+        engine,
+        drop_original_table=True,
+        dry_run=True,
+    )
+
+    assert estimate[ROWS] == roster_count
+    assert estimate[BYTES] > 0
+    assert estimate[REWRITE] is True
+    assert estimate[LOCK] == ACCESS_EXCLUSIVE
+    assert estimate[TABLE_SIZE] > 0
+    metadata = MetaData(bind=engine, schema=schema)
+    metadata.reflect()
+    assert sorted(t.name for t in metadata.sorted_tables) == [roster_table_name]
@@ -0,0 +1,181 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from db import admission
+from db.admission import (
+    EXPORT, IMPORT, INTERACTIVE, AdmissionController, AdmissionRejectedError,
+    AdmittedQueuePool, admit, bypass_admission, get_admission_controller,
+    get_database_key, query_priority, share_admission,
+)
+
+
+@pytest.fixture
+def fake_engine():
+    admission.configure_admission(max_concurrent=1, max_queued=2, queue_timeout=5)
+    yield create_engine("postgresql://user@localhost:5432/admission_test", future=True)
+    admission.configure_admission()
+
+
+class _FakeDBAPIConnection:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def admitted_pool(fake_engine):
+    pool = AdmittedQueuePool(_FakeDBAPIConnection)
+    pool.database_key = get_database_key(fake_engine)
+    return pool
+
+
+def _wait_for_queued(controller, count):
+    for _ in range(100):
+        if controller.get_metrics()["queued"] == count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"Expected {count} queued queries")
+
+
+def test_admission_controller_admits_by_priority():
+    controller = AdmissionController("test", max_concurrent=1, max_queued=10)
+    controller.acquire()
+    admitted = []
+
+    def run(priority):
+        controller.acquire(priority)
+        admitted.append(priority)
+        controller.release()
+
+    threads = []
+    for priority in [EXPORT, IMPORT, INTERACTIVE]:
+        thread = threading.Thread(target=run, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        _wait_for_queued(controller, len(threads))
+    assert controller.get_metrics()["queued_by_priority"] == {
+        INTERACTIVE: 1, admission.INFERENCE: 0, IMPORT: 1, EXPORT: 1,
+    }
+    controller.release()
+    for thread in threads:
+        thread.join()
+    assert admitted == [INTERACTIVE, IMPORT, EXPORT]
+    metrics = controller.get_metrics()
+    assert metrics["running"] == 0
+    assert metrics["admitted"] == 4
+
+
+def test_admission_controller_sheds_when_queue_full():
+    controller = AdmissionController("test", max_concurrent=1, max_queued=0)
+    controller.acquire()
+    with pytest.raises(AdmissionRejectedError):
+        controller.acquire()
+    assert controller.get_metrics()["rejected"] == 1
+    controller.release()
+    controller.acquire()
+    controller.release()
+
+
+def test_admission_controller_queue_timeout():
+    controller = AdmissionController("test", max_concurrent=1, max_queued=1, queue_timeout=0.05)
+    controller.acquire()
+    with pytest.raises(AdmissionRejectedError):
+        controller.acquire()
+    metrics = controller.get_metrics()
+    assert metrics["queued"] == 0
+    assert metrics["rejected"] == 1
+    controller.release()
+    assert controller.get_metrics()["running"] == 0
+
+
+def test_admit_is_reentrant(fake_engine):
+    controller = get_admission_controller(fake_engine)
+    with admit(fake_engine):
+        with admit(fake_engine):
+            assert controller.get_metrics()["running"] == 1
+    assert controller.get_metrics()["running"] == 0
+
+
+def test_admit_uses_query_priority(fake_engine):
+    controller = get_admission_controller(fake_engine)
+    controller.acquire()
+    thread_errors = []
+
+    def run():
+        try:
+            with query_priority(EXPORT), admit(fake_engine):
+                pass
+        except Exception as e:
+            thread_errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    _wait_for_queued(controller, 1)
+    assert controller.get_metrics()["queued_by_priority"][EXPORT] == 1
+    controller.release()
+    thread.join()
+    assert thread_errors == []
+
+
+def test_query_priority_bad_priority():
+    with pytest.raises(ValueError):
+        with query_priority("bogus"):
+            pass
+
+
+def test_admitted_pool_holds_slot_until_checkin(fake_engine, admitted_pool):
+    controller = get_admission_controller(fake_engine)
+    connection = admitted_pool.connect()
+    assert controller.get_metrics()["running"] == 1
+    # Connections of a thread that holds a slot share it
+    with admit(fake_engine):
+        other_connection = admitted_pool.connect()
+        other_connection.close()
+    assert controller.get_metrics()["running"] == 1
+    connection.close()
+    assert controller.get_metrics()["running"] == 0
+    assert controller.get_metrics()["admitted"] == 1
+
+
+def test_admitted_pool_sheds_connections(fake_engine, admitted_pool):
+    admission.configure_admission(max_concurrent=1, max_queued=0)
+    controller = get_admission_controller(fake_engine)
+    controller.acquire()
+    with pytest.raises(AdmissionRejectedError):
+        admitted_pool.connect()
+    # The connection isn't checked out before the query is admitted
+    assert admitted_pool.checkedout() == 0
+    controller.release()
+
+
+def test_share_admission(fake_engine, admitted_pool):
+    controller = get_admission_controller(fake_engine)
+    worker_priorities = []
+
+    def run():
+        worker_priorities.append(admission._get_current_priority())
+        connection = admitted_pool.connect()
+        connection.close()
+
+    with query_priority(EXPORT), admit(fake_engine):
+        thread = threading.Thread(target=share_admission(run))
+        thread.start()
+        thread.join()
+        assert controller.get_metrics()["admitted"] == 1
+    assert worker_priorities == [EXPORT]
+    assert controller.get_metrics()["running"] == 0
+
+
+def test_bypass_admission(fake_engine, admitted_pool):
+    controller = get_admission_controller(fake_engine)
+    controller.acquire()
+    with bypass_admission(fake_engine):
+        connection = admitted_pool.connect()
+        connection.close()
+    assert controller.get_metrics()["admitted"] == 1
+    controller.release()
@@ -1,6 +1,13 @@
-from sqlalchemy import MetaData, Column, String, Table
+import threading
+import time
+
+from psycopg2.errors import QueryCanceled
+import pytest
+from sqlalchemy import MetaData, Column, String, Table, func, select, text
+from sqlalchemy.exc import OperationalError
 
 from db.columns.utils import get_enriched_column_table
+from db.utils import QUERY_TAG_PREFIX, cancel_tagged_queries, set_local_query_options
 
 
 def test_get_enriched_column_table(engine):
@@ -15,3 +22,52 @@ def test_get_enriched_column_table_no_engine():
     table = Table("testtable", MetaData(), Column(abc, String), Column('def', String))
     enriched_table = get_enriched_column_table(table)
     assert enriched_table.columns[abc].engine is None
+
+
+def test_set_local_query_options_statement_timeout(engine):
+    with pytest.raises(OperationalError) as exc_info:
+        with engine.begin() as conn:
+            set_local_query_options(conn, statement_timeout=10)
+            conn.execute(select(func.pg_sleep(1)))
+    assert isinstance(exc_info.value.orig, QueryCanceled)
+
+
+def test_set_local_query_options_scoped_to_transaction(engine):
+    with engine.connect() as conn:
+        with conn.begin():
+            set_local_query_options(conn, statement_timeout=1234, query_tag="abc")
+            assert conn.execute(text("SHOW statement_timeout")).scalar() == "1234ms"
+            assert conn.execute(text("SHOW application_name")).scalar() == f"{QUERY_TAG_PREFIX}abc"
+        with conn.begin():
+            assert conn.execute(text("SHOW statement_timeout")).scalar() != "1234ms"
+
+
+def test_set_local_query_options_bad_tag(engine):
+    with engine.begin() as conn:
+        with pytest.raises(ValueError):
+            set_local_query_options(conn, query_tag="'; DROP TABLE x; --")
+
+
+def test_cancel_tagged_queries(engine):
+    errors = []
+
+    def run_tagged_query():
+        try:
+            with engine.begin() as conn:
+                set_local_query_options(conn, query_tag="to-cancel")
+                conn.execute(select(func.pg_sleep(30)))
+        except OperationalError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run_tagged_query)
+    thread.start()
+    cancelled = 0
+    for _ in range(50):
+        cancelled = cancel_tagged_queries(engine, "to-cancel")
+        if cancelled:
+            break
+        time.sleep(0.1)
+    thread.join(timeout=10)
+    assert cancelled == 1
+    assert len(errors) == 1 and isinstance(errors[0].orig, QueryCanceled)
+    assert cancel_tagged_queries(engine, "to-cancel") == 0
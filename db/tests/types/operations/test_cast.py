@@ -4,7 +4,9 @@ from decimal import Decimal
 import pytest
 from psycopg2.tz import FixedOffsetTimezone
 from psycopg2.errors import InvalidParameterValue
-from sqlalchemy import Table, Column, MetaData, select, cast
+from sqlalchemy import Table, Column, MetaData, select, cast, text
+from sqlalchemy.sql import quoted_name
+from sqlalchemy.sql.functions import Function
 from sqlalchemy import String, Numeric
 from sqlalchemy.exc import DataError
 
@@ -13,9 +15,9 @@ from db.columns.operations.select import get_column_default
 from db.columns.operations.alter import alter_column_type
 from db.tables.operations.select import get_oid_from_table
 from db.tests.types import fixtures
-from db.types import money, datetime
+from db.types import money, datetime, uri
 from db.types.operations import cast as cast_operations
-from db.types.base import PostgresType, MathesarCustomType, get_qualified_name, get_available_types
+from db.types.base import PostgresType, MathesarCustomType, SCHEMA, get_qualified_name, get_available_types
 
 
 # We need to set these variables when the file loads, or pytest can't
@@ -947,6 +949,36 @@ def test_alter_column_type_raises_on_bad_column_data(
             )
 
 
+def _get_try_cast_value(engine, source_type, target_type, value):
+    available_types = get_available_types(engine)
+    try_cast_function = Function(
+        quoted_name(cast_operations.get_try_cast_function_name(target_type), False),
+        cast(value, available_types[source_type]),
+    )
+    with engine.begin() as conn:
+        return conn.execute(select(try_cast_function)).scalar()
+
+
+@pytest.mark.parametrize(
+    "source_type,target_type,in_val,out_val", type_test_data_gen_list
+)
+def test_try_cast_casts_good_data(
+        engine_email_type, source_type, target_type, in_val, out_val
+):
+    engine, _ = engine_email_type
+    assert _get_try_cast_value(engine, source_type, target_type, in_val) is not None
+
+
+@pytest.mark.parametrize(
+    "type_,target_type,value", type_test_bad_data_gen_list
+)
+def test_try_cast_returns_null_on_bad_data(
+        engine_email_type, type_, target_type, value,
+):
+    engine, _ = engine_email_type
+    assert _get_try_cast_value(engine, type_, target_type, value) is None
+
+
 def test_alter_column_type_raises_on_bad_parameters(
         engine_email_type,
 ):
@@ -1051,3 +1083,93 @@ def test_get_full_cast_map(engine_with_types, source_type, expect_target_types):
     actual_cast_map = cast_operations.get_full_cast_map(engine_with_types)
     actual_target_types = actual_cast_map[source_type]
     assert sorted(actual_target_types) == sorted(expect_target_types)
+
+
+def _get_mathesar_cast_function_labels(engine):
+    query = text(
+        """
+        SELECT p.proname, p.provolatile, p.proparallel, p.prosrc
+        FROM pg_proc p JOIN pg_namespace n ON p.pronamespace = n.oid
+        WHERE n.nspname = :schema AND p.proname LIKE '%cast_to_%'
+        """
+    )
+    with engine.begin() as conn:
+        return conn.execute(query, {"schema": SCHEMA}).fetchall()
+
+
+def test_cast_functions_volatility_and_parallel_labels(engine_email_type):
+    engine, _ = engine_email_type
+    function_labels = _get_mathesar_cast_function_labels(engine)
+    assert function_labels
+    for name, volatility, parallel, source in function_labels:
+        # No cast function should be left VOLATILE (the default)
+        assert volatility in ('i', 's')
+        if cast_operations.EXCEPTION_BLOCK_REGEX.search(source):
+            assert parallel == 'u'
+        else:
+            assert parallel == 's'
+
+
+@pytest.mark.parametrize(
+    "argument_type,target_type,expect_volatility",
+    [
+        (cast_operations.VARCHAR, cast_operations.NUMERIC, cast_operations.IMMUTABLE),
+        (cast_operations.NUMERIC, cast_operations.BOOLEAN, cast_operations.IMMUTABLE),
+        (cast_operations.DATE, cast_operations.DATE, cast_operations.IMMUTABLE),
+        (cast_operations.VARCHAR, cast_operations.DATE, cast_operations.STABLE),
+        (cast_operations.DATE, cast_operations.VARCHAR, cast_operations.STABLE),
+        (cast_operations.VARCHAR, uri.DB_TYPE, cast_operations.STABLE),
+    ]
+)
+def test_get_cast_function_volatility(argument_type, target_type, expect_volatility):
+    volatility = cast_operations.get_cast_function_volatility(argument_type, target_type)
+    assert volatility == expect_volatility
+
+
+def test_cast_functions_allow_parallel_plans(engine_email_type):
+    engine, schema = engine_email_type
+    table = Table(
+        "parallel_cast_table",
+        MetaData(bind=engine),
+        Column("col", String),
+        schema=schema
+    )
+    table.create()
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [{"col": str(i)} for i in range(1000)])
+    with engine.begin() as conn:
+        # Make parallel plans look cheap, so that the planner picks one
+        # whenever the functions allow it.
+        for setting in [
+                "parallel_setup_cost = 0",
+                "parallel_tuple_cost = 0",
+                "min_parallel_table_scan_size = 0",
+                "max_parallel_workers_per_gather = 2",
+        ]:
+            conn.execute(text(f"SET LOCAL {setting}"))
+        plan = conn.execute(
+            text(
+                f"""
+                EXPLAIN SELECT count(*) FROM {schema}.{table.name}
+                WHERE {SCHEMA}.cast_to_numeric(col) > 500
+                """
+            )
+        ).fetchall()
+    assert "Gather" in "\n".join(row[0] for row in plan)
+
+
+def test_cast_functions_allow_expression_indexes(engine_email_type):
+    engine, schema = engine_email_type
+    table = Table(
+        "indexed_cast_table",
+        MetaData(bind=engine),
+        Column("col", String),
+        schema=schema
+    )
+    table.create()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"CREATE INDEX ON {schema}.{table.name} ({SCHEMA}.cast_to_numeric(col))"
+            )
+        )
@@ -1,6 +1,11 @@
+from unittest.mock import patch
+
+import pytest
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import DropSchema
 from db.types import install
-from db.types import base
+from db.types import base, email, uri
 
 
 def test_create_type_schema(engine):
@@ -16,3 +21,76 @@ def test_create_type_schema_when_exists(engine):
     # already exists when it's run.
     install.create_type_schema(engine)
     install.create_type_schema(engine)
+
+
+@pytest.fixture
+def installed_engine(engine):
+    install.install_mathesar_on_database(engine)
+    yield engine
+    with engine.begin() as conn:
+        conn.execute(DropSchema(base.SCHEMA, cascade=True, if_exists=True))
+
+
+def test_install_records_version(installed_engine):
+    installed_version = install.get_installed_version(installed_engine)
+    assert installed_version == install.get_install_version(installed_engine)
+
+
+def test_install_skips_when_current(installed_engine):
+    with patch.object(install.uri, "load_tld_lookup_table") as mock_load:
+        install.install_mathesar_on_database(installed_engine)
+    mock_load.assert_not_called()
+
+
+def test_install_reinstalls_when_outdated(installed_engine):
+    with installed_engine.begin() as conn:
+        conn.execute(text(
+            f"UPDATE {base.get_qualified_name(install.VERSION_TABLE_NAME)}"
+            f" SET version='outdated'"
+        ))
+    install.install_mathesar_on_database(installed_engine)
+    installed_version = install.get_installed_version(installed_engine)
+    assert installed_version == install.get_install_version(installed_engine)
+    with installed_engine.begin() as conn:
+        tld_count = conn.execute(
+            text(f"SELECT count(*) FROM {uri.QUALIFIED_TLDS}")
+        ).scalar()
+    assert tld_count == len(uri.get_top_level_domains())
+
+
+def test_install_keeps_dependent_columns(installed_engine):
+    with installed_engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE public.install_test (email_col {email.DB_TYPE});"
+            f"INSERT INTO public.install_test VALUES ('alice@example.com');"
+        ))
+    install.install_mathesar_on_database(installed_engine, force=True)
+    with installed_engine.begin() as conn:
+        value = conn.execute(text("SELECT email_col FROM public.install_test")).scalar()
+        conn.execute(text("DROP TABLE public.install_test"))
+    assert value == "alice@example.com"
+
+
+def test_install_replaces_domain_checks(installed_engine):
+    with installed_engine.begin() as conn:
+        conn.execute(text(
+            f"ALTER DOMAIN {email.DB_TYPE}"
+            f" DROP CONSTRAINT {base.DOMAIN_CHECK_CONSTRAINT_NAME};"
+            f"ALTER DOMAIN {email.DB_TYPE} ADD CONSTRAINT outdated_check CHECK (true);"
+            f"CREATE TABLE public.install_test (email_col {email.DB_TYPE});"
+            f"INSERT INTO public.install_test VALUES ('not an email');"
+        ))
+    install.install_mathesar_on_database(installed_engine, force=True)
+    with installed_engine.begin() as conn:
+        check_names = conn.execute(text(
+            f"SELECT conname FROM pg_constraint WHERE contypid = '{email.DB_TYPE}'::regtype"
+        )).scalars().all()
+        # Existing values aren't checked against the new constraint
+        value = conn.execute(text("SELECT email_col FROM public.install_test")).scalar()
+    assert check_names == [base.DOMAIN_CHECK_CONSTRAINT_NAME]
+    assert value == "not an email"
+    with pytest.raises(IntegrityError):
+        with installed_engine.begin() as conn:
+            conn.execute(text("INSERT INTO public.install_test VALUES ('still not an email')"))
+    with installed_engine.begin() as conn:
+        conn.execute(text("DROP TABLE public.install_test"))
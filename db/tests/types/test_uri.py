@@ -206,3 +206,23 @@ def test_uri_type_domain_rejects_malformed_uris(engine_email_type, test_str):
         with engine.begin() as conn:
             conn.execute(text(f"SELECT '{test_str}'::{uri.DB_TYPE}"))
         assert type(e.orig) == CheckViolation
+
+
+@pytest.mark.parametrize(
+    "tld,expect_is_tld", [("com", True), ("org", True), ("xn--p1ai", True), ("notatld", False)]
+)
+def test_is_top_level_domain(engine_email_type, tld, expect_is_tld):
+    engine, _ = engine_email_type
+    with engine.begin() as conn:
+        res = conn.execute(text(f"SELECT {uri.QUALIFIED_IS_TLD_FUNCTION}('{tld}')"))
+    assert res.fetchone()[0] is expect_is_tld
+
+
+def test_is_top_level_domain_matches_lookup_table(engine_email_type):
+    engine, _ = engine_email_type
+    with engine.begin() as conn:
+        res = conn.execute(text(
+            f"SELECT count(*) FROM {uri.QUALIFIED_TLDS}"
+            f" WHERE NOT {uri.QUALIFIED_IS_TLD_FUNCTION}(tld)"
+        ))
+    assert res.fetchone()[0] == 0
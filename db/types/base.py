@@ -73,6 +73,8 @@ class MathesarCustomType(Enum):
 
 
 SCHEMA = f"{constants.MATHESAR_PREFIX}types"
+# Name of the check constraint of the domains installed by Mathesar
+DOMAIN_CHECK_CONSTRAINT_NAME = f"{constants.MATHESAR_PREFIX}check"
 # Since we want to have our identifiers quoted appropriately for use in
 # PostgreSQL, we want to use the postgres dialect preparer to set this up.
 preparer = create_engine("postgresql://").dialect.identifier_preparer
@@ -92,3 +94,49 @@ def get_db_type_name(sa_type, engine):
     if db_type == USER_DEFINED_STR:
         db_type = sa_type().compile(engine.dialect)
     return db_type
+
+
+def get_create_type_if_missing_sql(qualified_type_name, create_type_sql):
+    """
+    Wraps the SQL creating a type (or domain) so that it does nothing if the
+    type already exists.  We can't drop and recreate types on every install,
+    since columns may depend on them.
+    """
+    return f"""
+    DO $install_type$
+    BEGIN
+      IF to_regtype('{qualified_type_name}') IS NULL THEN
+        {create_type_sql}
+      END IF;
+    END $install_type$;
+    """
+
+
+def get_create_or_replace_domain_sql(qualified_domain_name, base_type_name, check_sql):
+    """
+    Returns SQL creating a domain with the given check, or, if the domain
+    already exists, replacing its check constraints with the given one.
+    The replaced check is added as NOT VALID, so that existing values
+    aren't scanned; it applies to new and updated values only.
+    """
+    constraint_name = preparer.quote(DOMAIN_CHECK_CONSTRAINT_NAME)
+    return f"""
+    DO $install_domain$
+    DECLARE
+      check_name name;
+    BEGIN
+      IF to_regtype('{qualified_domain_name}') IS NULL THEN
+        CREATE DOMAIN {qualified_domain_name} AS {base_type_name}
+          CONSTRAINT {constraint_name} CHECK ({check_sql});
+      ELSE
+        FOR check_name IN
+          SELECT conname FROM pg_constraint
+          WHERE contypid = to_regtype('{qualified_domain_name}') AND contype = 'c'
+        LOOP
+          EXECUTE format('ALTER DOMAIN %s DROP CONSTRAINT %I', '{qualified_domain_name}', check_name);
+        END LOOP;
+        ALTER DOMAIN {qualified_domain_name}
+          ADD CONSTRAINT {constraint_name} CHECK ({check_sql}) NOT VALID;
+      END IF;
+    END $install_domain$;
+    """
@@ -45,33 +45,32 @@ class email_local_part(GenericFunction):
     identifier = EMAIL_LOCAL_PART
 
 
-def install(engine):
+def get_install_sql():
     # We'll use postgres domains to check that a given string conforms to what
     # an email should look like.  We also create some DB-level functions to
     # split out the different parts of an email address for grouping.
-    drop_domain_query = f"""
-    DROP DOMAIN IF EXISTS {DB_TYPE};
-    """
-    create_domain_query = f"""
-    CREATE DOMAIN {DB_TYPE} AS text CHECK (value ~ {EMAIL_REGEX_STR});
-    """
+    create_domain_query = base.get_create_or_replace_domain_sql(
+        DB_TYPE, "text", f"value ~ {EMAIL_REGEX_STR}",
+    )
     create_email_domain_name_query = f"""
     CREATE OR REPLACE FUNCTION {QUALIFIED_EMAIL_DOMAIN_NAME}({DB_TYPE})
     RETURNS text AS $$
         SELECT split_part($1, '@', 2);
     $$
-    LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
+    LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
     """
     create_email_local_part_query = f"""
     CREATE OR REPLACE FUNCTION {QUALIFIED_EMAIL_LOCAL_PART}({DB_TYPE})
     RETURNS text AS $$
         SELECT split_part($1, '@', 1);
     $$
-    LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
+    LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
     """
+    return "\n".join(
+        [create_domain_query, create_email_domain_name_query, create_email_local_part_query]
+    )
+
+
+def install(engine):
     with engine.begin() as conn:
-        conn.execute(text(drop_domain_query))
-        conn.execute(text(create_domain_query))
-        conn.execute(text(create_email_domain_name_query))
-        conn.execute(text(create_email_local_part_query))
-        conn.commit()
+        conn.execute(text(get_install_sql()))
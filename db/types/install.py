@@ -1,16 +1,115 @@
-from db.types import base, email, money, uri
+import hashlib
+
+from sqlalchemy import Column, MetaData, String, Table, func, select, text
+
 from db.schemas.operations.create import create_schema
-from db.types.operations.cast import install_all_casts
+from db.types import base, email, money, uri
+from db.types.operations.cast import get_install_all_casts_sql
+
+VERSION_TABLE_NAME = "install_version"
+# Arbitrary key for the advisory lock that serializes concurrent installs
+INSTALL_LOCK_KEY = 5_346_178
 
 
 def create_type_schema(engine):
     create_schema(base.SCHEMA, engine)
 
 
-def install_mathesar_on_database(engine):
-    create_type_schema(engine)
-    email.install(engine)
-    money.install(engine)
-    uri.install(engine)
-    uri.install_tld_lookup_table(engine)
-    install_all_casts(engine)
+def _get_create_type_schema_sql():
+    return f"CREATE SCHEMA IF NOT EXISTS {base.preparer.quote_schema(base.SCHEMA)};"
+
+
+def _get_version_table():
+    return Table(
+        VERSION_TABLE_NAME,
+        MetaData(),
+        Column("version", String, primary_key=True),
+        schema=base.preparer.quote_schema(base.SCHEMA)
+    )
+
+
+def _get_create_version_table_sql():
+    return f"""
+    CREATE TABLE IF NOT EXISTS {base.get_qualified_name(VERSION_TABLE_NAME)} (
+        version {base.PostgresType.TEXT.value} PRIMARY KEY
+    );
+    """
+
+
+def get_install_sql(engine):
+    """
+    Returns a single SQL script that installs (or upgrades) the Mathesar
+    types schema, along with all types, functions, and tables in it.  The
+    script is idempotent; types are only created if they are missing,
+    domains have their checks replaced, and functions are created or
+    replaced.
+    """
+    return "\n".join(
+        [
+            _get_create_type_schema_sql(),
+            email.get_install_sql(),
+            money.get_install_sql(),
+            uri.get_install_sql(),
+            get_install_all_casts_sql(engine),
+            _get_create_version_table_sql(),
+        ]
+    )
+
+
+def get_install_version(engine, install_sql=None):
+    """
+    Returns a string identifying the objects installed by
+    `install_mathesar_on_database`.  The version changes whenever the install
+    script or the TLD lookup data changes.
+    """
+    install_sql = install_sql or get_install_sql(engine)
+    version_hash = hashlib.sha256()
+    # Some statements are generated from sets, so their order in the script
+    # isn't stable between processes.  Sorting the lines makes the version
+    # independent of that order.
+    version_hash.update("\n".join(sorted(install_sql.splitlines())).encode())
+    with open(uri.TLDS_PATH, "rb") as f:
+        version_hash.update(f.read())
+    return version_hash.hexdigest()
+
+
+def get_installed_version(engine, connection_to_use=None):
+    """
+    Returns the version recorded by the last successful install on the
+    database, or None if Mathesar hasn't been installed there.
+    """
+    if connection_to_use is None:
+        with engine.begin() as conn:
+            return get_installed_version(engine, connection_to_use=conn)
+    if not engine.dialect.has_table(
+            connection_to_use, VERSION_TABLE_NAME, schema=base.SCHEMA
+    ):
+        return None
+    version_table = _get_version_table()
+    return connection_to_use.execute(
+        select(func.max(version_table.c.version))
+    ).scalar()
+
+
+def install_mathesar_on_database(engine, force=False):
+    """
+    Installs the Mathesar types schema on the database of the given engine.
+
+    If the installed version is already current, this does nothing (unless
+    `force` is set).  Otherwise, the whole install script runs in a single
+    transaction, and the new version is recorded in the same transaction.
+    """
+    install_sql = get_install_sql(engine)
+    install_version = get_install_version(engine, install_sql=install_sql)
+    if not force and get_installed_version(engine) == install_version:
+        return
+    with engine.begin() as conn:
+        conn.execute(select(func.pg_advisory_xact_lock(INSTALL_LOCK_KEY)))
+        # Another process may have installed while we waited for the lock
+        if not force and get_installed_version(engine, conn) == install_version:
+            return
+        conn.execute(text(install_sql))
+        uri.load_tld_lookup_table(conn)
+        version_table = _get_version_table()
+        conn.execute(version_table.delete())
+        conn.execute(version_table.insert(), {"version": install_version})
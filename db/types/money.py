@@ -26,17 +26,13 @@ class Money(UserDefinedType):
         return func.to_json(col)
 
 
-def install(engine):
-
-    drop_type_query = f"""
-    DROP TYPE IF EXISTS {DB_TYPE};
-    """
+def get_install_sql():
+    return base.get_create_type_if_missing_sql(
+        DB_TYPE,
+        f"CREATE TYPE {DB_TYPE} AS ({VALUE} NUMERIC, {CURRENCY} CHAR(3));",
+    )
 
-    create_type_query = f"""
-    CREATE TYPE {DB_TYPE} AS ({VALUE} NUMERIC, {CURRENCY} CHAR(3));
-    """
 
+def install(engine):
     with engine.begin() as conn:
-        conn.execute(text(drop_type_query))
-        conn.execute(text(create_type_query))
-        conn.commit()
+        conn.execute(text(get_install_sql()))
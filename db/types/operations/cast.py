@@ -1,3 +1,5 @@
+import re
+
 from sqlalchemy import text
 from sqlalchemy.sql import quoted_name
 from sqlalchemy.sql.functions import Function
@@ -36,6 +38,24 @@ FULL_VARCHAR = base.PostgresType.CHARACTER_VARYING.value
 FULL_CHAR = base.PostgresType.CHARACTER.value
 NAME = base.PostgresType.NAME.value
 
+# The results of casts between these types and others depend on session
+# settings (DateStyle, IntervalStyle, TimeZone, and lc_monetary).
+SETTING_DEPENDENT_TYPES = frozenset([
+    DATE,
+    INTERVAL,
+    TIME_WITHOUT_TIME_ZONE,
+    TIME_WITH_TIME_ZONE,
+    base.PostgresType.MONEY.value,
+    base.PostgresType.TIMESTAMP_WITH_TIMESTAMP_ZONE.value,
+    base.PostgresType.TIMESTAMP_WITHOUT_TIMESTAMP_ZONE.value,
+])
+
+IMMUTABLE = "IMMUTABLE"
+STABLE = "STABLE"
+PARALLEL_SAFE = "PARALLEL SAFE"
+PARALLEL_UNSAFE = "PARALLEL UNSAFE"
+EXCEPTION_BLOCK_REGEX = re.compile(r"\bEXCEPTION\s+WHEN\b", re.IGNORECASE)
+
 DECIMAL_TYPES = frozenset([DECIMAL, DOUBLE_PRECISION, FLOAT, NUMERIC, REAL])
 INTEGER_TYPES = frozenset([BIGINT, INTEGER, SMALLINT])
 NUMBER_TYPES = DECIMAL_TYPES | INTEGER_TYPES
@@ -137,78 +157,68 @@ def get_column_cast_expression(column, target_type_str, engine, type_options={})
     return cast_expr
 
 
-def install_all_casts(engine):
-    create_boolean_casts(engine)
-    create_date_casts(engine)
-    create_decimal_number_casts(engine)
-    create_email_casts(engine)
-    create_integer_casts(engine)
-    create_interval_casts(engine)
-    create_datetime_casts(engine)
-    create_money_casts(engine)
-    create_textual_casts(engine)
-    create_uri_casts(engine)
-
-
-def create_boolean_casts(engine):
-    type_body_map = _get_boolean_type_body_map()
-    create_cast_functions(BOOLEAN, type_body_map, engine)
-
-
-def create_date_casts(engine):
-    type_body_map = _get_date_type_body_map()
-    create_cast_functions(DATE, type_body_map, engine)
-
-
-def create_decimal_number_casts(engine):
-    decimal_number_types = DECIMAL_TYPES
-    for type_str in decimal_number_types:
-        type_body_map = _get_decimal_number_type_body_map(target_type_str=type_str)
-        create_cast_functions(type_str, type_body_map, engine)
-
-
-def create_email_casts(engine):
-    type_body_map = _get_email_type_body_map()
-    create_cast_functions(email.DB_TYPE, type_body_map, engine)
-
-
-def create_integer_casts(engine):
-    integer_types = [BIGINT, INTEGER, SMALLINT]
-    for type_str in integer_types:
-        type_body_map = _get_integer_type_body_map(target_type_str=type_str)
-        create_cast_functions(type_str, type_body_map, engine)
-
-
-def create_interval_casts(engine):
-    type_body_map = _get_interval_type_body_map()
-    create_cast_functions(INTERVAL, type_body_map, engine)
-
-
-def create_datetime_casts(engine):
-    time_types = [TIME_WITHOUT_TIME_ZONE, TIME_WITH_TIME_ZONE]
-    for time_type in time_types:
-        type_body_map = _get_time_type_body_map(time_type)
-        create_cast_functions(time_type, type_body_map, engine)
+def get_column_try_cast_expression(column, target_type_str, engine):
+    """
+    Like get_column_cast_expression, but using the non-raising
+    try_cast_to_<type> function, so that the expression is NULL for values
+    that can't be cast instead of raising an error.  Type options are not
+    supported, since only the cast to the type itself is checked.
+    """
+    target_type = get_robust_supported_alter_column_type_map(engine).get(target_type_str)
+    if target_type is None:
+        raise UnsupportedTypeException(
+            f"Target Type '{target_type_str}' is not supported."
+        )
+    else:
+        prepared_target_type_name = target_type().compile(dialect=engine.dialect)
 
-    type_body_map = _get_date_type_body_map()
-    create_cast_functions(DATE, type_body_map, engine)
+    if prepared_target_type_name == column.type.__class__().compile(dialect=engine.dialect):
+        return column
+    qualified_function_name = get_try_cast_function_name(prepared_target_type_name)
+    return Function(quoted_name(qualified_function_name, False), column)
 
 
-def create_money_casts(engine):
-    type_body_map = _get_money_type_body_map()
-    create_cast_functions(money.DB_TYPE, type_body_map, engine)
+def install_all_casts(engine):
+    with engine.begin() as conn:
+        conn.execute(text(get_install_all_casts_sql(engine)))
 
 
-def create_textual_casts(engine):
-    textual_types = TEXT_TYPES
-    for type_str in textual_types:
-        type_body_map = _get_textual_type_body_map(engine, target_type_str=type_str)
-        create_cast_functions(type_str, type_body_map, engine)
+def get_install_all_casts_sql(engine):
+    """
+    Returns a single SQL script that creates (or replaces) every cast
+    function Mathesar uses, so that they can all be installed at once.
+    """
+    return "\n".join(
+        get_cast_functions_creation_sql(target_type, type_body_map)
+        for target_type, type_body_map in _get_cast_type_body_maps(engine)
+    )
 
 
-def create_uri_casts(engine):
-    type_body_map = _get_uri_type_body_map()
-    create_cast_functions(uri.DB_TYPE, type_body_map, engine)
+def _get_cast_type_body_maps(engine):
+    return (
+        [(BOOLEAN, _get_boolean_type_body_map())]
+        + [(DATE, _get_date_type_body_map())]
+        + [
+            (type_str, _get_decimal_number_type_body_map(target_type_str=type_str))
+            for type_str in sorted(DECIMAL_TYPES)
+        ]
+        + [(email.DB_TYPE, _get_email_type_body_map())]
+        + [
+            (type_str, _get_integer_type_body_map(target_type_str=type_str))
+            for type_str in [BIGINT, INTEGER, SMALLINT]
+        ]
+        + [(INTERVAL, _get_interval_type_body_map())]
+        + [
+            (time_type, _get_time_type_body_map(time_type))
+            for time_type in [TIME_WITHOUT_TIME_ZONE, TIME_WITH_TIME_ZONE]
+        ]
+        + [(money.DB_TYPE, _get_money_type_body_map())]
+        + [
+            (type_str, _get_textual_type_body_map(engine, target_type_str=type_str))
+            for type_str in sorted(TEXT_TYPES)
+        ]
+        + [(uri.DB_TYPE, _get_uri_type_body_map())]
+    )
 
 
 def get_full_cast_map(engine):
@@ -265,6 +275,10 @@ def create_cast_functions(target_type, type_body_map, engine):
     PL/pgSQL to use the correct function body corresponding to a given
     input (source) type.
 
+    For each cast function, we also install a non-raising variant named
+    `try_cast_to_<target_type>`, which returns NULL instead of raising
+    when the given value can't be cast.
+
     Args:
         target_type:   string corresponding to the target type of the
                        cast function.
@@ -273,24 +287,92 @@ def create_cast_functions(target_type, type_body_map, engine):
                        given source type to the target type.
         engine:        an SQLAlchemy engine.
     """
-    for type_, body in type_body_map.items():
-        query = assemble_function_creation_sql(type_, target_type, body)
-        with engine.begin() as conn:
-            conn.execute(text(query))
+    with engine.begin() as conn:
+        conn.execute(text(get_cast_functions_creation_sql(target_type, type_body_map)))
+
+
+def get_cast_functions_creation_sql(target_type, type_body_map):
+    """
+    Returns the SQL that creates the cast functions described in
+    `create_cast_functions`, without executing it.
+    """
+    return "\n".join(
+        query
+        for type_, body in type_body_map.items()
+        for query in [
+            assemble_function_creation_sql(type_, target_type, body),
+            assemble_try_cast_function_creation_sql(type_, target_type),
+        ]
+    )
+
+
+def get_cast_function_volatility(argument_type, target_type):
+    """
+    Gives the volatility label for a cast function from the argument type
+    to the target type.
+
+    Casts are IMMUTABLE unless their result depends on session settings
+    (e.g., DateStyle for dates, or TimeZone for times), in which case they
+    are STABLE.  Casts to URIs are STABLE, since before Postgres 14 they look
+    up top level domains in a table.
+    """
+    if argument_type == target_type:
+        return IMMUTABLE
+    elif (
+            argument_type in SETTING_DEPENDENT_TYPES
+            or target_type in SETTING_DEPENDENT_TYPES
+            or target_type == uri.DB_TYPE
+    ):
+        return STABLE
+    return IMMUTABLE
+
+
+def get_cast_function_parallel_safety(function_body):
+    """
+    Gives the parallel safety label for a cast function with the given body.
+
+    PL/pgSQL functions with an EXCEPTION block start a subtransaction, which
+    isn't allowed in parallel workers, so those are PARALLEL UNSAFE.  All
+    other cast functions only read from the DB, and are PARALLEL SAFE.
+    """
+    if EXCEPTION_BLOCK_REGEX.search(function_body):
+        return PARALLEL_UNSAFE
+    return PARALLEL_SAFE
 
 
 def assemble_function_creation_sql(argument_type, target_type, function_body):
     function_name = get_cast_function_name(target_type)
+    volatility = get_cast_function_volatility(argument_type, target_type)
+    parallel_safety = get_cast_function_parallel_safety(function_body)
     return f"""
     CREATE OR REPLACE FUNCTION {function_name}({argument_type})
     RETURNS {target_type}
     AS $$
     {function_body}
-    $$ LANGUAGE plpgsql;
+    $$ LANGUAGE plpgsql {volatility} {parallel_safety};
     """
 
 
-def get_cast_function_name(target_type):
+def assemble_try_cast_function_creation_sql(argument_type, target_type):
+    function_name = get_try_cast_function_name(target_type)
+    cast_function_name = get_cast_function_name(target_type)
+    volatility = get_cast_function_volatility(argument_type, target_type)
+    function_body = f"""
+    BEGIN
+      RETURN {cast_function_name}($1);
+      EXCEPTION WHEN OTHERS THEN
+        RETURN NULL;
+    END;
+    """
+    parallel_safety = get_cast_function_parallel_safety(function_body)
+    return f"""
+    CREATE OR REPLACE FUNCTION {function_name}({argument_type})
+    RETURNS {target_type}
+    AS $${function_body}$$ LANGUAGE plpgsql {volatility} {parallel_safety};
+    """
+
+
+def _get_cast_function_type_name(target_type):
     unqualified_type_name = target_type.split('.')[-1].lower()
     if '(' in unqualified_type_name:
         bare_type_name = unqualified_type_name[:unqualified_type_name.find('(')]
@@ -298,11 +380,25 @@ def get_cast_function_name(target_type):
             bare_type_name += unqualified_type_name[unqualified_type_name.find(')') + 1:]
     else:
         bare_type_name = unqualified_type_name
-    function_type_name = '_'.join(bare_type_name.split())
+    return '_'.join(bare_type_name.split())
+
+
+def get_cast_function_name(target_type):
+    function_type_name = _get_cast_function_type_name(target_type)
     bare_function_name = f"cast_to_{function_type_name}"
     return f"{base.get_qualified_name(bare_function_name)}"
 
 
+def get_try_cast_function_name(target_type):
+    """
+    Gives the name of the non-raising variant of the cast function for
+    the target type.  It returns NULL for values that can't be cast.
+    """
+    function_type_name = _get_cast_function_type_name(target_type)
+    bare_function_name = f"try_cast_to_{function_type_name}"
+    return f"{base.get_qualified_name(bare_function_name)}"
+
+
 def _get_boolean_type_body_map():
     """
     Get SQL strings that create various functions for casting different
@@ -584,7 +680,7 @@ def _get_uri_type_body_map():
               SELECT lower(('http://' || $1)::{uri.DB_TYPE}) INTO uri_res;
               SELECT (regexp_match({auth_func}(uri_res), {tld_regex}))[1]
                 INTO uri_tld;
-              IF EXISTS(SELECT 1 FROM {uri.QUALIFIED_TLDS} WHERE tld = uri_tld) THEN
+              IF {uri.QUALIFIED_IS_TLD_FUNCTION}(uri_tld) THEN
                 RETURN uri_res;
               END IF;
           {not_uri_exception_str}
@@ -0,0 +1,236 @@
+"""
+Python counterparts of (a subset of) the Mathesar `cast_to_<type>`
+functions installed by `db.types.operations.cast`.
+
+These are used to infer types from a sample of values before the values
+ever reach the database (e.g., while a data file is being parsed during
+an import).  Each cast works on a whole column of values at once, and
+raises a `PythonCastError` if any value in the column can't be cast.
+The casts are deliberately conservative: anything they accept should
+also be accepted by the corresponding DB function, since the DB is still
+the final arbiter when the data is loaded.
+"""
+import re
+from decimal import Decimal
+from functools import lru_cache
+
+from db.types import base, email, uri
+
+BOOLEAN = base.PostgresType.BOOLEAN.value
+DATE = base.PostgresType.DATE.value
+EMAIL = base.MathesarCustomType.EMAIL.value
+INTERVAL = base.PostgresType.INTERVAL.value
+NUMERIC = base.PostgresType.NUMERIC.value
+STRING = base.STRING
+TIME_WITHOUT_TIME_ZONE = base.PostgresType.TIME_WITHOUT_TIME_ZONE.value
+URI = base.MathesarCustomType.URI.value
+
+TRUE_STRINGS = frozenset(['t', 'true', '1'])
+FALSE_STRINGS = frozenset(['f', 'false', '0'])
+
+NUMERIC_REGEX = re.compile(
+    r"^\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*$|^\s*nan\s*$",
+    re.IGNORECASE,
+)
+TIME_REGEX = re.compile(
+    r"^\s*(?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?::(?P<second>\d{1,2}(?:\.\d+)?))?"
+    r"\s*(?P<meridiem>[ap]m)?"
+    r"\s*(?:[+-]\d{1,2}(?::?\d{2})?|z|utc)?\s*$",
+    re.IGNORECASE,
+)
+INTERVAL_UNITS = (
+    r"microseconds?|milliseconds?|seconds?|secs?|s|minutes?|mins?|m"
+    r"|hours?|hrs?|h|days?|d|weeks?|w|months?|mons?|years?|yrs?|y"
+    r"|decades?|centuries|century|millenniums?|millennia"
+)
+INTERVAL_REGEX = re.compile(
+    r"^(?=.*\d)\s*@?\s*"
+    rf"(?:[+-]?\d+(?:\.\d+)?\s*(?:{INTERVAL_UNITS})\s*)*"
+    r"(?:[+-]?\d{1,2}:\d{1,2}(?::\d{1,2}(?:\.\d+)?)?)?"
+    r"\s*(?:ago)?\s*$",
+    re.IGNORECASE,
+)
+ISO_INTERVAL_REGEX = re.compile(
+    r"^\s*P(?!$)(?:\d+Y)?(?:\d+M)?(?:\d+W)?(?:\d+D)?"
+    r"(?:T(?=\d)(?:\d+H)?(?:\d+M)?(?:\d+(?:\.\d+)?S)?)?\s*$",
+    re.IGNORECASE,
+)
+DATE_SEPARATOR_REGEX = re.compile(r"[-/.,\s]+")
+MONTH_NAMES = {
+    name: index + 1
+    for index, names in enumerate(
+        [
+            ("jan", "january"), ("feb", "february"), ("mar", "march"),
+            ("apr", "april"), ("may",), ("jun", "june"), ("jul", "july"),
+            ("aug", "august"), ("sep", "sept", "september"),
+            ("oct", "october"), ("nov", "november"), ("dec", "december"),
+        ]
+    )
+    for name in names
+}
+# The SQL regexes are written as quoted SQL string literals, so we unquote
+# them here to keep a single source of truth for the patterns.
+EMAIL_REGEX = re.compile(email.EMAIL_REGEX_STR[1:-1].replace("''", "'"))
+URI_REGEX = re.compile(uri.URI_REGEX_STR[1:-1])
+TLD_REGEX = re.compile(r"(?<=\.)(?:.(?!\.))+$")
+
+
+class PythonCastError(ValueError):
+    pass
+
+
+def cast_column_values(values, target_type_str):
+    """
+    Casts a list of (non-null) values to the Python representation of the
+    given Mathesar type string, mirroring the behavior of the matching
+    `cast_to_<type>` DB function.
+
+    Raises a `PythonCastError` as soon as a value can't be cast, and a
+    `KeyError` if there is no Python cast for the target type.
+    """
+    cast_value = _PYTHON_CAST_MAP[target_type_str]
+    return [cast_value(value) for value in values]
+
+
+def get_python_castable_types():
+    return set(_PYTHON_CAST_MAP)
+
+
+def _cast_to_boolean(value):
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, Decimal):
+        if value == 1:
+            return True
+        elif value == 0:
+            return False
+    elif isinstance(value, str):
+        if value.lower() in TRUE_STRINGS:
+            return True
+        elif value.lower() in FALSE_STRINGS:
+            return False
+    raise PythonCastError(f"{value} is not a {BOOLEAN}")
+
+
+def _cast_to_numeric(value):
+    if isinstance(value, Decimal):
+        return value
+    elif isinstance(value, str) and NUMERIC_REGEX.match(value):
+        return Decimal(value.strip())
+    raise PythonCastError(f"{value} is not a {NUMERIC}")
+
+
+def _is_valid_date(year, month, day):
+    days_in_month = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    return (
+        1 <= month <= 12
+        and 1 <= day <= days_in_month[month - 1]
+        and (
+            month != 2 or day < 29
+            or (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0))
+        )
+    )
+
+
+def _parse_date_parts(value):
+    """
+    Returns a (year, month, day) tuple for the date formats that Postgres
+    accepts with the default `DateStyle` (ISO, MDY), or None if the value
+    isn't in one of the formats we check.
+    """
+    stripped = value.strip()
+    if stripped.isdigit() and len(stripped) == 8:
+        return int(stripped[:4]), int(stripped[4:6]), int(stripped[6:])
+
+    tokens = [t for t in DATE_SEPARATOR_REGEX.split(stripped) if t]
+    if len(tokens) != 3:
+        return None
+    month_tokens = [t for t in tokens if t.lower() in MONTH_NAMES]
+    if len(month_tokens) == 1:
+        month = MONTH_NAMES[month_tokens[0].lower()]
+        numbers = [t for t in tokens if t not in month_tokens]
+        if not all(n.isdigit() for n in numbers):
+            return None
+        long_numbers = [n for n in numbers if len(n) > 2]
+        if len(long_numbers) != 1:
+            return None
+        year = int(long_numbers[0])
+        day = int([n for n in numbers if n is not long_numbers[0]][0])
+        return year, month, day
+    elif month_tokens or not all(t.isdigit() for t in tokens):
+        return None
+    elif len(tokens[0]) > 2:
+        # ISO style: year first
+        return int(tokens[0]), int(tokens[1]), int(tokens[2])
+    elif len(tokens[2]) > 2:
+        # MDY style
+        return int(tokens[2]), int(tokens[0]), int(tokens[1])
+    return None
+
+
+def _cast_to_date(value):
+    if isinstance(value, str):
+        date_parts = _parse_date_parts(value)
+        if date_parts is not None and _is_valid_date(*date_parts):
+            return value
+    raise PythonCastError(f"{value} is not a {DATE}")
+
+
+def _cast_to_time_without_time_zone(value):
+    if isinstance(value, str):
+        match = TIME_REGEX.match(value)
+        if match is not None:
+            hour, minute = int(match.group("hour")), int(match.group("minute"))
+            second = float(match.group("second") or 0)
+            max_hour = 12 if match.group("meridiem") else 24
+            if hour <= max_hour and minute < 60 and second < 61:
+                return value
+    raise PythonCastError(f"{value} is not a {TIME_WITHOUT_TIME_ZONE}")
+
+
+def _cast_to_interval(value):
+    # The DB function refuses anything that looks like a number, since a
+    # number is the more likely interpretation.
+    if isinstance(value, str) and not NUMERIC_REGEX.match(value) and value.strip():
+        if INTERVAL_REGEX.match(value) or ISO_INTERVAL_REGEX.match(value):
+            return value
+    raise PythonCastError(f"{value} is not an {INTERVAL}")
+
+
+def _cast_to_email(value):
+    if isinstance(value, str) and EMAIL_REGEX.match(value):
+        return value
+    raise PythonCastError(f"{value} is not an {EMAIL}")
+
+
+@lru_cache(maxsize=None)
+def _get_top_level_domains():
+    return frozenset(uri.get_top_level_domains())
+
+
+def _get_uri_part(value, index):
+    return URI_REGEX.match(value).group(index)
+
+
+def _cast_to_uri(value):
+    if isinstance(value, str):
+        # These indices match the ones used by the uri_<part> DB functions
+        if _get_uri_part(value, 2) is not None and _get_uri_part(value, 5) is not None:
+            return value
+        prefixed_value = ("http://" + value).lower()
+        authority = _get_uri_part(prefixed_value, 4)
+        tld_match = TLD_REGEX.search(authority) if authority else None
+        if tld_match is not None and tld_match.group(0) in _get_top_level_domains():
+            return prefixed_value
+    raise PythonCastError(f"{value} is not a {URI}")
+
+
+_PYTHON_CAST_MAP = {
+    BOOLEAN: _cast_to_boolean,
+    DATE: _cast_to_date,
+    EMAIL: _cast_to_email,
+    INTERVAL: _cast_to_interval,
+    NUMERIC: _cast_to_numeric,
+    TIME_WITHOUT_TIME_ZONE: _cast_to_time_without_time_zone,
+    URI: _cast_to_uri,
+}
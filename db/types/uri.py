@@ -17,6 +17,10 @@ TLDS_PATH = os.path.join(
 
 TLDS_TABLE_NAME = "top_level_domains"
 QUALIFIED_TLDS = base.get_qualified_name(TLDS_TABLE_NAME)
+IS_TLD_FUNCTION_NAME = "is_top_level_domain"
+QUALIFIED_IS_TLD_FUNCTION = base.get_qualified_name(IS_TLD_FUNCTION_NAME)
+# The first Postgres version that hashes `= ANY` over constant arrays
+HASHED_ARRAY_MIN_SERVER_VERSION = 140000
 
 
 class URIFunction(Enum):
@@ -66,17 +70,13 @@ globals().update(
 )
 
 
-def install(engine):
-    drop_domain_query = f"""
-    DROP DOMAIN IF EXISTS {DB_TYPE};
-    """
-
+def get_install_sql():
     create_uri_parts_query = f"""
     CREATE OR REPLACE FUNCTION {QualifiedURIFunction.PARTS.value}({base.PostgresType.TEXT.value})
     RETURNS {base.PostgresType.TEXT.value}[] AS $$
         SELECT regexp_match($1, {URI_REGEX_STR});
     $$
-    LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
+    LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
     """
     uri_parts_map = {
         QualifiedURIFunction.SCHEME.value: 2,
@@ -85,40 +85,108 @@ def install(engine):
         QualifiedURIFunction.QUERY.value: 7,
         QualifiedURIFunction.FRAGMENT.value: 9,
     }
+    create_uri_part_getter_queries = [
+        f"""
+        CREATE OR REPLACE FUNCTION {part}({base.PostgresType.TEXT.value})
+        RETURNS {base.PostgresType.TEXT.value} AS $$
+            SELECT ({QualifiedURIFunction.PARTS.value}($1))[{index}];
+        $$
+        LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
+        """
+        for part, index in uri_parts_map.items()
+    ]
+
+    create_domain_query = base.get_create_or_replace_domain_sql(
+        DB_TYPE,
+        base.PostgresType.TEXT.value,
+        f"""
+            {QualifiedURIFunction.SCHEME.value}(value) IS NOT NULL
+            AND {QualifiedURIFunction.PATH.value}(value) IS NOT NULL
+        """,
+    )
+    return "\n".join(
+        [create_uri_parts_query]
+        + create_uri_part_getter_queries
+        + [
+            create_domain_query,
+            # The table must exist before a function that reads it
+            _get_create_tld_lookup_table_sql(),
+            _get_create_is_tld_function_sql(),
+        ]
+    )
 
-    create_domain_query = f"""
-    CREATE DOMAIN {DB_TYPE} AS text CHECK (
-        {QualifiedURIFunction.SCHEME.value}(value) IS NOT NULL
-        AND {QualifiedURIFunction.PATH.value}(value) IS NOT NULL
-    );
-    """
 
+def install(engine):
     with engine.begin() as conn:
-        conn.execute(text(drop_domain_query))
-        conn.execute(text(create_uri_parts_query))
-        for part, index in uri_parts_map.items():
-            create_uri_part_getter_query = f"""
-            CREATE OR REPLACE FUNCTION {part}({base.PostgresType.TEXT.value})
-            RETURNS {base.PostgresType.TEXT.value} AS $$
-                SELECT ({QualifiedURIFunction.PARTS.value}($1))[{index}];
-            $$
-            LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT;
-            """
-            conn.execute(text(create_uri_part_getter_query))
-        conn.execute(text(create_domain_query))
-        conn.commit()
+        conn.execute(text(get_install_sql()))
 
 
-def install_tld_lookup_table(engine):
-    tlds_table = Table(
+def get_top_level_domains():
+    with open(TLDS_PATH) as f:
+        return [tld.strip().lower() for tld in f if tld[:2] != "# "]
+
+
+def get_top_level_domains_array_sql():
+    """
+    Returns the TLDs as a constant text array, in SQL.
+    """
+    tlds_array = "{" + ",".join(get_top_level_domains()) + "}"
+    return f"'{tlds_array}'::{base.PostgresType.TEXT.value}[]"
+
+
+def _get_create_is_tld_function_sql():
+    # From Postgres 14, `= ANY` over a large constant array is evaluated with
+    # a hash table built once per query, which beats a probe of the TLD
+    # table's primary key per value.  Before that, it's a linear scan of the
+    # array, so the indexed lookup is kept (see test_uri_cast_benchmark).
+    return f"""
+    DO $install_is_tld$
+    BEGIN
+      IF current_setting('server_version_num')::integer >= {HASHED_ARRAY_MIN_SERVER_VERSION} THEN
+        CREATE OR REPLACE FUNCTION {QUALIFIED_IS_TLD_FUNCTION}({base.PostgresType.TEXT.value})
+        RETURNS boolean AS $is_tld$
+            SELECT $1 = ANY({get_top_level_domains_array_sql()});
+        $is_tld$
+        LANGUAGE SQL IMMUTABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
+      ELSE
+        CREATE OR REPLACE FUNCTION {QUALIFIED_IS_TLD_FUNCTION}({base.PostgresType.TEXT.value})
+        RETURNS boolean AS $is_tld$
+            SELECT EXISTS (SELECT 1 FROM {QUALIFIED_TLDS} WHERE tld = $1);
+        $is_tld$
+        LANGUAGE SQL STABLE RETURNS NULL ON NULL INPUT PARALLEL SAFE;
+      END IF;
+    END $install_is_tld$;
+    """
+
+
+def _get_create_tld_lookup_table_sql():
+    return f"""
+    CREATE TABLE IF NOT EXISTS {QUALIFIED_TLDS} (tld {base.PostgresType.TEXT.value} PRIMARY KEY);
+    """
+
+
+def _get_tlds_table():
+    return Table(
         TLDS_TABLE_NAME,
-        MetaData(bind=engine),
+        MetaData(),
         Column("tld", String, primary_key=True),
         schema=base.preparer.quote_schema(base.SCHEMA)
     )
-    tlds_table.create()
-    with engine.begin() as conn, open(TLDS_PATH) as f:
-        conn.execute(
-            tlds_table.insert(),
-            [{"tld": tld.strip().lower()} for tld in f if tld[:2] != "# "],
-        )
+
+
+def load_tld_lookup_table(connection):
+    """
+    Replaces the contents of the TLD lookup table (which must exist) with
+    the TLDs in TLDS_PATH, using the given connection.
+    """
+    tlds_table = _get_tlds_table()
+    connection.execute(tlds_table.delete())
+    connection.execute(
+        tlds_table.insert(), [{"tld": tld} for tld in get_top_level_domains()]
+    )
+
+
+def install_tld_lookup_table(engine):
+    with engine.begin() as conn:
+        conn.execute(text(_get_create_tld_lookup_table_sql()))
+        load_tld_lookup_table(conn)
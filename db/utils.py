@@ -1,3 +1,18 @@
+import re
+
+from sqlalchemy import column, func, select, table, text
+
+from db.admission import bypass_admission
+
+STATEMENT_TIMEOUT = "statement_timeout"
+LOCK_TIMEOUT = "lock_timeout"
+QUERY_TAG = "query_tag"
+# Tagged queries are found through the application_name of their backend,
+# which is limited to 63 characters.
+QUERY_TAG_PREFIX = "mathesar-query-"
+QUERY_TAG_REGEX = re.compile(r"^[A-Za-z0-9_-]{1,40}$")
+
+
 def execute_statement(engine, statement, connection_to_use=None):
     if connection_to_use:
         return connection_to_use.execute(statement)
@@ -7,4 +22,49 @@ def execute_statement(engine, statement, connection_to_use=None):
 
 
 def execute_query(engine, query, connection_to_use=None):
-    return execute_statement(engine, query, connection_to_use=None).fetchall()
+    return execute_statement(engine, query, connection_to_use=connection_to_use).fetchall()
+
+
+def _get_query_tag_application_name(query_tag):
+    if not QUERY_TAG_REGEX.match(query_tag):
+        raise ValueError(f"Query tag {query_tag} must match {QUERY_TAG_REGEX.pattern}")
+    return f"{QUERY_TAG_PREFIX}{query_tag}"
+
+
+def set_local_query_options(connection, statement_timeout=None, lock_timeout=None, query_tag=None):
+    """
+    Sets options for the rest of the current transaction of the connection,
+    using SET LOCAL.  Timeouts are in milliseconds, and 0 disables them.
+
+    The query tag lets the queries of the transaction be cancelled from
+    another connection, using `cancel_tagged_queries`.
+    """
+    settings = []
+    if statement_timeout is not None:
+        settings.append(f"SET LOCAL {STATEMENT_TIMEOUT} = {int(statement_timeout)}")
+    if lock_timeout is not None:
+        settings.append(f"SET LOCAL {LOCK_TIMEOUT} = {int(lock_timeout)}")
+    if query_tag is not None:
+        application_name = _get_query_tag_application_name(query_tag)
+        settings.append(f"SET LOCAL application_name = '{application_name}'")
+    if settings:
+        connection.execute(text("; ".join(settings)))
+
+
+def cancel_tagged_queries(engine, query_tag):
+    """
+    Cancels the queries running with the given tag (see
+    `set_local_query_options`), and returns the number of backends that
+    were signalled.  This bypasses admission control, so that queries can
+    be cancelled while the database is overloaded.
+    """
+    activity = table(
+        "pg_stat_activity", column("pid"), column("application_name"), schema="pg_catalog"
+    )
+    query = (
+        select(func.pg_cancel_backend(activity.c.pid))
+        .where(activity.c.application_name == _get_query_tag_application_name(query_tag))
+        .where(activity.c.pid != func.pg_backend_pid())
+    )
+    with bypass_admission(engine), engine.begin() as conn:
+        return len([row for row in conn.execute(query) if row[0]])
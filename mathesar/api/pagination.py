@@ -33,40 +33,51 @@ class ColumnLimitOffsetPagination(DefaultLimitOffsetPagination):
 class TableLimitOffsetPagination(DefaultLimitOffsetPagination):
 
     def paginate_queryset(self, queryset, request, table_id,
-                          filters=[], order_by=[]):
+                          filters=[], order_by=[], query_options=None, columns=None,
+                          preview_length=None):
         self.limit = self.get_limit(request)
         if self.limit is None:
             self.limit = self.default_limit
         self.offset = self.get_offset(request)
         # TODO: Cache count value somewhere, since calculating it is expensive.
         table = get_table_or_404(pk=table_id)
-        self.count = table.sa_num_records(filters=filters)
+        self.count = table.sa_num_records(filters=filters, query_options=query_options)
         self.request = request
 
         return table.get_records(
             self.limit, self.offset, filters=filters, order_by=order_by,
+            query_options=query_options, columns=columns, preview_length=preview_length,
         )
 
 
 class TableLimitOffsetGroupPagination(TableLimitOffsetPagination):
-    def get_paginated_response(self, data):
-        return Response(OrderedDict([
+    def get_paginated_response(self, data, columns=None, truncated=None):
+        response_data = OrderedDict([
             ('count', self.count),
             ('group_count', self.group_count),
-            ('results', data)
-        ]))
+        ])
+        # Columnar results are lists of values, in the order of the columns
+        if columns is not None:
+            response_data['columns'] = columns
+        response_data['results'] = data
+        # The full lengths of the truncated values, per result
+        if truncated is not None:
+            response_data['truncated'] = truncated
+        return Response(response_data)
 
     def paginate_queryset(self, queryset, request, table_id,
-                          filters=[], order_by=[], group_count_by=[]):
+                          filters=[], order_by=[], group_count_by=[], query_options=None,
+                          columns=None, preview_length=None):
         records = super().paginate_queryset(
-            queryset, request, table_id, filters=filters, order_by=order_by
+            queryset, request, table_id, filters=filters, order_by=order_by,
+            query_options=query_options, columns=columns, preview_length=preview_length,
         )
 
         table = get_table_or_404(pk=table_id)
         if group_count_by:
             group_count = table.get_group_counts(
                 group_count_by, self.limit, self.offset,
-                filters=filters, order_by=order_by
+                filters=filters, order_by=order_by, query_options=query_options,
             )
             # Convert the tuple keys into strings so it can be converted to JSON
             group_count = [{"values": list(cols), "count": count}
@@ -79,6 +79,9 @@ class ColumnSerializer(SimpleColumnSerializer):
             'source_column',
             'copy_source_data',
             'copy_source_constraints',
+            'copy_batch_size',
+            'online',
+            'online_batch_size',
             'index',
             'valid_target_types',
             'default'
@@ -96,6 +99,11 @@ class ColumnSerializer(SimpleColumnSerializer):
     source_column = serializers.IntegerField(required=False, write_only=True)
     copy_source_data = serializers.BooleanField(default=True, write_only=True)
     copy_source_constraints = serializers.BooleanField(default=True, write_only=True)
+    copy_batch_size = serializers.IntegerField(required=False, min_value=1, write_only=True)
+
+    # Type change fields
+    online = serializers.BooleanField(required=False, write_only=True)
+    online_batch_size = serializers.IntegerField(required=False, min_value=1, write_only=True)
 
     # Read only fields
     index = serializers.IntegerField(source='column_index', read_only=True)
@@ -110,7 +118,7 @@ class ColumnSerializer(SimpleColumnSerializer):
             from_scratch_specific_fields = ['type', 'nullable', 'primary_key']
             from_dupe_required_fields = ['source_column']
             from_dupe_specific_fields = ['source_column', 'copy_source_data',
-                                         'copy_source_constraints']
+                                         'copy_source_constraints', 'copy_batch_size']
 
             # Note that we run validation on self.initial_data, as `data` has defaults
             # filled in for fields that weren't specified by the request
@@ -148,3 +156,19 @@ class ColumnSerializer(SimpleColumnSerializer):
     @property
     def validated_model_fields(self):
         return {key: self.validated_data[key] for key in self.validated_data if key in self.Meta.model_fields}
+
+
+class ColumnCastCheckSerializer(serializers.Serializer):
+    type = serializers.CharField()
+    limit = serializers.IntegerField(required=False, min_value=1, default=20)
+    sample_percent = serializers.FloatField(
+        required=False, min_value=0, max_value=100, allow_null=True, default=None
+    )
+
+
+class ColumnBatchCreateSerializer(serializers.Serializer):
+    columns = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+
+class ColumnBatchDestroySerializer(serializers.Serializer):
+    columns = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
@@ -7,7 +7,8 @@ class ConstraintSerializer(serializers.ModelSerializer):
     name = serializers.CharField(required=False)
     type = serializers.CharField()
     columns = serializers.ListField()
+    concurrently = serializers.BooleanField(default=False, write_only=True)
 
     class Meta:
         model = Constraint
-        fields = ['id', 'name', 'type', 'columns']
+        fields = ['id', 'name', 'type', 'columns', 'concurrently']
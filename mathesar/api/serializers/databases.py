@@ -1,6 +1,7 @@
 from django.urls import reverse
 from rest_framework import serializers
 
+from db.utils import QUERY_TAG_REGEX
 from mathesar.api.display_options import DISPLAY_OPTIONS_BY_TYPE_IDENTIFIER
 from mathesar.api.filters import FILTER_OPTIONS_BY_TYPE_IDENTIFIER
 from mathesar.models import Database
@@ -35,3 +36,7 @@ class TypeSerializer(serializers.Serializer):
 
     def get_display_options(self, obj):
         return DISPLAY_OPTIONS_BY_TYPE_IDENTIFIER.get(obj.get('identifier'))
+
+
+class QueryCancelSerializer(serializers.Serializer):
+    query_id = serializers.RegexField(QUERY_TAG_REGEX)
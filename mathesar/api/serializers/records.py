@@ -1,12 +1,72 @@
 from rest_framework import serializers
 
+# Formats of the records in a list response: either an object per record,
+# or a single list of column names with a list of values per record.
+OBJECTS_RECORD_FORMAT = 'objects'
+COLUMNAR_RECORD_FORMAT = 'columnar'
+RECORD_FORMATS = (OBJECTS_RECORD_FORMAT, COLUMNAR_RECORD_FORMAT)
 
-class RecordListParameterSerializer(serializers.Serializer):
+
+class RecordParameterSerializer(serializers.Serializer):
+    # Only these columns (and the primary key) are returned, if given
+    columns = serializers.JSONField(required=False, default=None)
+
+
+class RecordListParameterSerializer(RecordParameterSerializer):
     filters = serializers.JSONField(required=False, default=[])
     order_by = serializers.JSONField(required=False, default=[])
     group_count_by = serializers.JSONField(required=False, default=[])
+    record_format = serializers.ChoiceField(
+        choices=RECORD_FORMATS, required=False, default=OBJECTS_RECORD_FORMAT
+    )
+    # Text and binary values are cut to this length, if given
+    preview_length = serializers.IntegerField(required=False, default=None, min_value=1)
+
+
+class RecordCellParameterSerializer(serializers.Serializer):
+    column = serializers.CharField()
+
+
+def get_record_column_names(row, column_count):
+    """
+    Returns the names of the first column_count columns of a record, which
+    leaves out the preview lengths after them (see
+    `db.records.operations.select.get_records`).
+    """
+    return list(row._fields[:column_count])
+
+
+def get_record_truncated_lengths(row, column_count, preview_column_names, preview_length):
+    """
+    Returns the full lengths of the values of a record that were truncated to
+    preview_length, by column name.  The lengths follow the first
+    column_count columns, in the order of preview_column_names.
+    """
+    return {
+        name: length
+        for name, length in zip(preview_column_names, row[column_count:])
+        if length is not None and length > preview_length
+    }
+
+
+class RecordListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # All rows of a result have the same columns, so we only get their
+        # names once, and zip them with the values of each row.
+        rows = list(data)
+        if not rows:
+            return []
+        column_count = self.context.get('column_count', len(rows[0]))
+        if self.context.get('record_format') == COLUMNAR_RECORD_FORMAT:
+            return [tuple(row)[:column_count] for row in rows]
+        # zip() leaves out the preview lengths, which come after the columns
+        column_names = get_record_column_names(rows[0], column_count)
+        return [dict(zip(column_names, row)) for row in rows]
 
 
 class RecordSerializer(serializers.BaseSerializer):
+    class Meta:
+        list_serializer_class = RecordListSerializer
+
     def to_representation(self, instance):
         return instance._asdict()
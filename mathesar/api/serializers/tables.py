@@ -2,6 +2,7 @@ from django.urls import reverse
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from db.tables.operations.infer_types import SAMPLE_METHODS
 from mathesar.api.serializers.columns import SimpleColumnSerializer
 from mathesar.models import Table, DataFile
 
@@ -17,13 +18,14 @@ class TableSerializer(serializers.ModelSerializer):
     data_files = serializers.PrimaryKeyRelatedField(
         required=False, many=True, queryset=DataFile.objects.all()
     )
+    infer_types = serializers.BooleanField(required=False, write_only=True)
 
     class Meta:
         model = Table
         fields = ['id', 'name', 'schema', 'created_at', 'updated_at', 'import_verified',
                   'columns', 'records_url', 'constraints_url', 'columns_url',
                   'type_suggestions_url', 'previews_url', 'data_files',
-                  'has_dependencies']
+                  'has_dependencies', 'infer_types']
 
     def get_records_url(self, obj):
         if isinstance(obj, Table):
@@ -74,3 +76,10 @@ class TableSerializer(serializers.ModelSerializer):
 class TablePreviewSerializer(serializers.Serializer):
     name = serializers.CharField(required=False)
     columns = SimpleColumnSerializer(many=True)
+
+
+class TypeSuggestionParameterSerializer(serializers.Serializer):
+    sample_size = serializers.IntegerField(required=False, min_value=1)
+    sample_method = serializers.ChoiceField(choices=SAMPLE_METHODS, required=False)
+    seed = serializers.IntegerField(required=False)
+    verify = serializers.BooleanField(required=False, default=True)
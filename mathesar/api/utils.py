@@ -1,7 +1,28 @@
-from rest_framework.exceptions import NotFound
+import hashlib
 
+from django.conf import settings
+from django.utils.http import parse_etags, quote_etag
+from psycopg2.errors import LockNotAvailable, QueryCanceled
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, Throttled, ValidationError
+from rest_framework.views import exception_handler as drf_exception_handler
+
+from db.admission import AdmissionRejectedError
+from db.utils import QUERY_TAG, QUERY_TAG_REGEX
 from mathesar.models import Table
 
+# Clients can tag the queries run for a request with this header, so that
+# they can be cancelled through the database cancel_query endpoint.
+QUERY_ID_HEADER = 'X-Mathesar-Query-Id'
+# In seconds, sent in the Retry-After header of shed requests
+ADMISSION_RETRY_AFTER = 5
+
+
+class QueryCancelled(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'The query was cancelled.'
+    default_code = 'query_cancelled'
+
 
 def get_table_or_404(pk):
     """
@@ -16,3 +37,82 @@ def get_table_or_404(pk):
     except Table.DoesNotExist:
         raise NotFound
     return table
+
+
+def get_records_etag(table, request, pk=None, query_options=None):
+    """
+    Gives the ETag of a records response, which changes whenever the
+    table's data version does (see `Table.get_data_version`), and differs
+    between query parameters and media types.  Tables whose data version
+    isn't tracked have no ETag.
+    """
+    version = table.get_data_version(query_options)
+    if version is None:
+        return None
+    query_params = sorted(
+        (key, value) for key, values in request.GET.lists() for value in values
+    )
+    representation = (pk, query_params, request.accepted_media_type)
+    digest = hashlib.sha256(repr(representation).encode()).hexdigest()[:16]
+    return quote_etag(f'{table.oid}-{version}-{digest}')
+
+
+def etag_matches(request, etag):
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return '*' in etags or etag in etags
+
+
+def get_records_body_cache_key(table, etag):
+    # The ETag already identifies the version and the representation
+    return f'{table.schema.database.name}_records_body_{table.oid}_{etag}'
+
+
+def get_records_query_options(request, action):
+    """
+    Gets the options (see `db.utils.set_local_query_options`) for the queries
+    run by a records API action: the configured timeouts, and the query id
+    sent by the client, if any.
+    """
+    query_options = dict(settings.MATHESAR_RECORDS_QUERY_TIMEOUTS.get(action, {}))
+    query_id = request.headers.get(QUERY_ID_HEADER)
+    if query_id is not None:
+        if not QUERY_TAG_REGEX.match(query_id):
+            raise ValidationError(
+                {'query_id': f'{QUERY_ID_HEADER} must match {QUERY_TAG_REGEX.pattern}'}
+            )
+        query_options[QUERY_TAG] = query_id
+    return query_options
+
+
+def get_cancelled_query_error(exc):
+    """
+    Maps a DB error raised by a cancelled query (because of a timeout, or
+    through the cancel_query endpoint) to an API error.  Returns None for
+    other errors.
+    """
+    orig = getattr(exc, 'orig', None)
+    if isinstance(orig, LockNotAvailable):
+        return QueryCancelled(
+            'The query timed out waiting for a lock on the table.', 'lock_timeout'
+        )
+    elif isinstance(orig, QueryCanceled):
+        if 'statement timeout' in str(orig):
+            return QueryCancelled('The query timed out.', 'statement_timeout')
+        return QueryCancelled()
+    return None
+
+
+def exception_handler(exc, context):
+    """
+    Sheds requests rejected by admission control (see `db.admission`) with a
+    429, on top of the default DRF exception handling.
+    """
+    if isinstance(exc, AdmissionRejectedError):
+        exc = Throttled(
+            wait=ADMISSION_RETRY_AFTER,
+            detail=f'The database is busy ({exc.reason}); please try again later.',
+        )
+    return drf_exception_handler(exc, context)
@@ -1,6 +1,7 @@
 import warnings
 from psycopg2.errors import DuplicateColumn, UndefinedFunction
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError, APIException
 from rest_framework.response import Response
 from sqlalchemy.exc import ProgrammingError
@@ -8,9 +9,16 @@ from sqlalchemy.exc import ProgrammingError
 from db.columns.exceptions import (
     DynamicDefaultWarning, InvalidDefaultError, InvalidTypeOptionError, InvalidTypeError
 )
-from db.columns.operations.select import get_columns_attnum_from_names
+from db.columns.operations.select import (
+    get_columns_attnum_from_names, get_columns_attnum_map_from_names
+)
+from db.tables.utils import get_primary_key_column
+from db.types.exceptions import UnsupportedTypeException
 from mathesar.api.pagination import DefaultLimitOffsetPagination
-from mathesar.api.serializers.columns import ColumnSerializer
+from mathesar.api.serializers.columns import (
+    ColumnBatchCreateSerializer, ColumnBatchDestroySerializer, ColumnCastCheckSerializer,
+    ColumnSerializer,
+)
 from mathesar.api.utils import get_table_or_404
 from mathesar.models import Column
 
@@ -38,6 +46,7 @@ class ColumnViewSet(viewsets.ModelViewSet):
                     serializer.validated_data['copy_source_data'],
                     serializer.validated_data['copy_source_constraints'],
                     serializer.validated_data.get('name'),
+                    batch_size=serializer.validated_data.get('copy_batch_size'),
                 )
             except IndexError:
                 _col_idx = serializer.validated_data['source_column']
@@ -82,7 +91,12 @@ class ColumnViewSet(viewsets.ModelViewSet):
         with warnings.catch_warnings():
             warnings.filterwarnings("error", category=DynamicDefaultWarning)
             try:
-                table.alter_column(column_instance._sa_column.column_index, serializer.validated_data)
+                table.alter_column(
+                    column_instance._sa_column.column_index,
+                    serializer.validated_data,
+                    online=serializer.validated_data.get('online', False),
+                    batch_size=serializer.validated_data.get('online_batch_size'),
+                )
             except ProgrammingError as e:
                 if type(e.orig) == UndefinedFunction:
                     raise ValidationError('This type cast is not implemented')
@@ -111,8 +125,12 @@ class ColumnViewSet(viewsets.ModelViewSet):
                 )
             except InvalidTypeError:
                 raise ValidationError('This type casting is invalid.')
+            except ValueError as e:
+                # The column can't be retyped online
+                raise ValidationError(str(e))
             except Exception as e:
                 raise APIException(e)
+        column_instance.refresh_from_db()
         serializer.update(column_instance, serializer.validated_model_fields)
         # Invalidate the cache as the underlying columns have changed
         out_serializer = ColumnSerializer(self.get_object())
@@ -127,3 +145,108 @@ class ColumnViewSet(viewsets.ModelViewSet):
         except IndexError:
             raise NotFound
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(methods=['post'], detail=False)
+    def batch_create(self, request, table_pk=None):
+        """
+        Adds several columns (from scratch) to the table in a single ALTER
+        TABLE statement.
+        """
+        table = get_table_or_404(table_pk)
+        batch_serializer = ColumnBatchCreateSerializer(data=request.data)
+        batch_serializer.is_valid(raise_exception=True)
+        column_data_list = batch_serializer.validated_data['columns']
+        serializers = [
+            ColumnSerializer(data=column_data, context={'request': request})
+            for column_data in column_data_list
+        ]
+        errors = {}
+        for index, serializer in enumerate(serializers):
+            if not serializer.is_valid():
+                errors[index] = serializer.errors
+            elif 'source_column' in serializer.validated_data:
+                errors[index] = {
+                    'source_column': ['Columns cannot be duplicated in a batch.']
+                }
+        if errors:
+            raise ValidationError(errors)
+
+        try:
+            columns = table.add_columns(column_data_list)
+        except ProgrammingError as e:
+            if type(e.orig) == DuplicateColumn:
+                raise ValidationError(str(e.orig).strip())
+            else:
+                raise APIException(e)
+        except TypeError:
+            raise ValidationError("Unknown type_option passed")
+        except InvalidDefaultError:
+            raise ValidationError('A default is invalid for the type of its column.')
+        except InvalidTypeOptionError:
+            raise ValidationError('A parameter dict is invalid for the type of its column.')
+        except InvalidTypeError:
+            raise ValidationError('This type casting is invalid.')
+        column_attnums = get_columns_attnum_map_from_names(
+            table.oid, [column.name for column in columns], table.schema._sa_engine
+        )
+        dj_columns = [
+            Column(
+                table=table,
+                attnum=column_attnums[column.name],
+                **serializer.validated_model_fields,
+            )
+            for column, serializer in zip(columns, serializers)
+        ]
+        Column.objects.bulk_create(dj_columns)
+        out_serializer = ColumnSerializer(self.get_queryset().filter(
+            attnum__in=column_attnums.values()
+        ), many=True)
+        return Response(out_serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(methods=['post'], detail=False)
+    def batch_destroy(self, request, table_pk=None):
+        """
+        Drops several columns from the table in a single ALTER TABLE
+        statement.
+        """
+        serializer = ColumnBatchDestroySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        column_ids = set(serializer.validated_data['columns'])
+        column_instances = list(self.get_queryset().filter(id__in=column_ids))
+        if len(column_instances) != len(column_ids):
+            raise NotFound
+        table = get_table_or_404(table_pk)
+        try:
+            table.drop_columns(
+                [column_instance.column_index for column_instance in column_instances]
+            )
+        except IndexError:
+            raise NotFound
+        Column.objects.filter(id__in=column_ids).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(methods=['post'], detail=True)
+    def cast_check(self, request, pk=None, table_pk=None):
+        column_instance = self.get_object()
+        table = column_instance.table
+        serializer = ColumnCastCheckSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            count, records = table.get_column_cast_failures(
+                column_instance.name,
+                serializer.validated_data['type'],
+                num_records=serializer.validated_data['limit'],
+                sample_percent=serializer.validated_data['sample_percent'],
+            )
+        except UnsupportedTypeException as e:
+            raise ValidationError(e)
+        except ProgrammingError as e:
+            if type(e.orig) == UndefinedFunction:
+                raise ValidationError('This type cast is not implemented')
+            raise
+        primary_key_name = get_primary_key_column(table._sa_table).name
+        return Response({
+            'count': count,
+            'primary_keys': [record[primary_key_name] for record in records],
+            'records': records,
+        })
@@ -5,6 +5,7 @@ from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.response import Response
 from sqlalchemy.exc import ProgrammingError, IntegrityError
 
+from db.constraints.exceptions import DuplicateValuesError
 from mathesar.api.pagination import DefaultLimitOffsetPagination
 from mathesar.api.serializers.constraints import ConstraintSerializer
 from mathesar.api.utils import get_table_or_404
@@ -31,7 +32,17 @@ class ConstraintViewSet(viewsets.GenericViewSet, ListModelMixin, RetrieveModelMi
             data = request.data
         try:
             name = data['name'] if 'name' in data else None
-            constraint = table.add_constraint(data['type'], data['columns'], name)
+            constraint = table.add_constraint(
+                data['type'],
+                data['columns'],
+                name,
+                concurrently=serializer.validated_data['concurrently'],
+            )
+        except DuplicateValuesError as e:
+            raise ValidationError({
+                'columns': ['These columns have non-unique values so a unique constraint cannot be set'],
+                'duplicate_groups': e.duplicate_groups,
+            })
         except ProgrammingError as e:
             if type(e.orig) == DuplicateTable:
                 raise ValidationError(
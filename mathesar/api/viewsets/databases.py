@@ -4,10 +4,12 @@ from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.response import Response
 
+from db.admission import get_admission_controller
+from db.utils import cancel_tagged_queries
 from mathesar.models import Database
 from mathesar.api.filters import DatabaseFilter
 from mathesar.api.pagination import DefaultLimitOffsetPagination
-from mathesar.api.serializers.databases import DatabaseSerializer, TypeSerializer
+from mathesar.api.serializers.databases import DatabaseSerializer, QueryCancelSerializer, TypeSerializer
 
 
 class DatabaseViewSet(viewsets.GenericViewSet, ListModelMixin, RetrieveModelMixin):
@@ -24,3 +26,26 @@ class DatabaseViewSet(viewsets.GenericViewSet, ListModelMixin, RetrieveModelMixi
         database = self.get_object()
         serializer = TypeSerializer(database.supported_types, many=True)
         return Response(serializer.data)
+
+    @action(methods=['get'], detail=True)
+    def query_load(self, request, pk=None):
+        """
+        Gives the admission control metrics of the database in this process:
+        the running and queued queries, and the admitted and rejected totals.
+        """
+        database = self.get_object()
+        return Response(get_admission_controller(database._sa_engine).get_metrics())
+
+    @action(methods=['post'], detail=True)
+    def cancel_query(self, request, pk=None):
+        """
+        Cancels the queries running on the database for the requests sent
+        with the given query id in their X-Mathesar-Query-Id header.
+        """
+        database = self.get_object()
+        serializer = QueryCancelSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        cancelled = cancel_tagged_queries(
+            database._sa_engine, serializer.validated_data['query_id']
+        )
+        return Response({'cancelled': cancelled})
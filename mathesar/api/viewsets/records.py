@@ -1,13 +1,27 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.renderers import BrowsableAPIRenderer
+from sqlalchemy.exc import OperationalError
 from sqlalchemy_filters.exceptions import BadFilterFormat, BadSortFormat, FilterFieldNotFound, SortFieldNotFound
 
-from db.records.exceptions import BadGroupFormat, GroupFieldNotFound
+from db.records.exceptions import (
+    BadGroupFormat, BadProjectionFormat, GroupFieldNotFound, ProjectionFieldNotFound,
+)
+from db.records.operations.select import get_preview_column_names, get_projected_columns
 from mathesar.api.pagination import TableLimitOffsetGroupPagination
-from mathesar.api.serializers.records import RecordListParameterSerializer, RecordSerializer
-from mathesar.api.utils import get_table_or_404
+from mathesar.api.serializers.records import (
+    COLUMNAR_RECORD_FORMAT, RecordCellParameterSerializer, RecordListParameterSerializer,
+    RecordParameterSerializer, RecordSerializer, get_record_truncated_lengths,
+)
+from mathesar.api.utils import (
+    etag_matches, get_cancelled_query_error, get_records_body_cache_key, get_records_etag,
+    get_records_query_options, get_table_or_404,
+)
 from mathesar.models import Table
 from mathesar.utils.json import MathesarJSONRenderer
 
@@ -21,22 +35,70 @@ class RecordViewSet(viewsets.ViewSet):
 
     renderer_classes = [MathesarJSONRenderer, BrowsableAPIRenderer]
 
+    def handle_exception(self, exc):
+        if isinstance(exc, OperationalError):
+            exc = get_cancelled_query_error(exc) or exc
+        return super().handle_exception(exc)
+
+    def _get_versioned_response(self, request, table, get_data, pk=None, query_options=None):
+        """
+        Responds with a 304 if the client already has the current version of
+        the table's records.  Otherwise, responds with get_data(), which is
+        cached per version if MATHESAR_RECORDS_BODY_CACHE_TTL is set.
+        Tables without a data version get neither.
+        """
+        # The version is read before the records, so that the ETag is never
+        # newer than the data it's sent with.
+        etag = get_records_etag(table, request, pk, query_options)
+        if etag is None:
+            return Response(get_data())
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        cache_ttl = settings.MATHESAR_RECORDS_BODY_CACHE_TTL
+        cache_key = get_records_body_cache_key(table, etag)
+        data = cache.get(cache_key) if cache_ttl else None
+        if data is None:
+            data = get_data()
+            if cache_ttl:
+                cache.set(cache_key, data, cache_ttl)
+        return Response(data, headers={'ETag': etag})
+
     # For filter parameter formatting, see:
     # https://github.com/centerofci/sqlalchemy-filters#filters-format
     # For sorting parameter formatting, see:
     # https://github.com/centerofci/sqlalchemy-filters#sort-format
+    # With record_format=columnar, the response has the list of column names
+    # under "columns", and each record is a list of values in that order.
+    # With columns=["name", ...], only those columns and the primary key are
+    # returned (this also applies to retrieve).
+    # With preview_length=N, text and binary values are cut to N characters
+    # (or bytes), and the response has, under "truncated", the full lengths
+    # of the values that were cut, per result.  The full values can be
+    # fetched from the cell endpoint.
     def list(self, request, table_pk=None):
-        paginator = TableLimitOffsetGroupPagination()
-
+        table = get_table_or_404(table_pk)
         serializer = RecordListParameterSerializer(data=request.GET)
         serializer.is_valid(raise_exception=True)
+        query_options = get_records_query_options(request, self.action)
+        return self._get_versioned_response(
+            request, table,
+            lambda: self._get_records_page(
+                request, table, serializer.validated_data, query_options
+            ),
+            query_options=query_options,
+        )
 
+    def _get_records_page(self, request, table, parameters, query_options):
+        paginator = TableLimitOffsetGroupPagination()
         try:
             records = paginator.paginate_queryset(
-                self.get_queryset(), request, table_pk,
-                filters=serializer.validated_data['filters'],
-                order_by=serializer.validated_data['order_by'],
-                group_count_by=serializer.validated_data['group_count_by'],
+                self.get_queryset(), request, table.id,
+                filters=parameters['filters'],
+                order_by=parameters['order_by'],
+                group_count_by=parameters['group_count_by'],
+                query_options=query_options,
+                columns=parameters['columns'],
+                preview_length=parameters['preview_length'],
             )
         except (BadFilterFormat, FilterFieldNotFound) as e:
             raise ValidationError({'filters': e})
@@ -44,33 +106,109 @@ class RecordViewSet(viewsets.ViewSet):
             raise ValidationError({'order_by': e})
         except (BadGroupFormat, GroupFieldNotFound) as e:
             raise ValidationError({'group_count_by': e})
+        except (BadProjectionFormat, ProjectionFieldNotFound) as e:
+            raise ValidationError({'columns': e})
 
-        serializer = RecordSerializer(records, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        # Any preview lengths come after the projected columns in the records
+        projected_columns = get_projected_columns(table._sa_table, parameters['columns'])
+        column_count = len(projected_columns)
+        record_format = parameters['record_format']
+        serializer = RecordSerializer(
+            records, many=True,
+            context={'record_format': record_format, 'column_count': column_count},
+        )
+        columns = None
+        truncated = None
+        if parameters['preview_length'] is not None:
+            preview_column_names = get_preview_column_names(
+                table._sa_table, parameters['columns']
+            )
+            truncated = [
+                get_record_truncated_lengths(
+                    record, column_count, preview_column_names, parameters['preview_length']
+                )
+                for record in records
+            ]
+        if record_format == COLUMNAR_RECORD_FORMAT:
+            columns = [col.name for col in projected_columns]
+        return paginator.get_paginated_response(
+            serializer.data, columns=columns, truncated=truncated
+        ).data
 
     def retrieve(self, request, pk=None, table_pk=None):
         table = get_table_or_404(table_pk)
-        record = table.get_record(pk)
+        serializer = RecordParameterSerializer(data=request.GET)
+        serializer.is_valid(raise_exception=True)
+        columns = serializer.validated_data['columns']
+        query_options = get_records_query_options(request, self.action)
+        return self._get_versioned_response(
+            request, table, lambda: self._get_record(table, pk, query_options, columns),
+            pk=pk, query_options=query_options,
+        )
+
+    def _get_record(self, table, pk, query_options, columns=None):
+        try:
+            record = table.get_record(pk, query_options, columns)
+        except (BadProjectionFormat, ProjectionFieldNotFound) as e:
+            raise ValidationError({'columns': e})
+        if not record:
+            raise NotFound
+        return RecordSerializer(record).data
+
+    @action(methods=['get'], detail=True)
+    def cell(self, request, pk=None, table_pk=None):
+        """
+        Responds with the full value of a column of the record.  Text values
+        are sent as text/plain, binary values as application/octet-stream,
+        and other values as JSON.
+        """
+        table = get_table_or_404(table_pk)
+        serializer = RecordCellParameterSerializer(data=request.GET)
+        serializer.is_valid(raise_exception=True)
+        column = serializer.validated_data['column']
+        query_options = get_records_query_options(request, 'retrieve')
+        etag = get_records_etag(table, request, pk, query_options)
+        if etag is not None and etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        try:
+            record = table.get_record(pk, query_options, [column])
+        except ProjectionFieldNotFound as e:
+            raise ValidationError({'column': e})
         if not record:
             raise NotFound
-        serializer = RecordSerializer(record)
-        return Response(serializer.data)
+        value = record[column]
+        if isinstance(value, str):
+            response = HttpResponse(value, content_type='text/plain; charset=utf-8')
+        elif isinstance(value, (bytes, memoryview)):
+            response = HttpResponse(bytes(value), content_type='application/octet-stream')
+        elif value is None:
+            # Response(None) would have an empty body
+            response = HttpResponse(b'null', content_type='application/json')
+        else:
+            response = Response(value)
+        if etag is not None:
+            response['ETag'] = etag
+        return response
 
     def create(self, request, table_pk=None):
         table = get_table_or_404(table_pk)
         # We only support adding a single record through the API.
         assert isinstance((request.data), dict)
-        record = table.create_record_or_records(request.data)
+        record = table.create_record_or_records(
+            request.data, get_records_query_options(request, self.action)
+        )
         serializer = RecordSerializer(record)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def partial_update(self, request, pk=None, table_pk=None):
         table = get_table_or_404(table_pk)
-        record = table.update_record(pk, request.data)
+        record = table.update_record(
+            pk, request.data, get_records_query_options(request, self.action)
+        )
         serializer = RecordSerializer(record)
         return Response(serializer.data)
 
     def destroy(self, request, pk=None, table_pk=None):
         table = get_table_or_404(table_pk)
-        table.delete_record(pk)
+        table.delete_record(pk, get_records_query_options(request, self.action))
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -10,7 +10,9 @@ from sqlalchemy.exc import ProgrammingError, DataError, IntegrityError
 from db.types.exceptions import UnsupportedTypeException
 from mathesar.api.filters import TableFilter
 from mathesar.api.pagination import DefaultLimitOffsetPagination
-from mathesar.api.serializers.tables import TableSerializer, TablePreviewSerializer
+from mathesar.api.serializers.tables import (
+    TableSerializer, TablePreviewSerializer, TypeSuggestionParameterSerializer
+)
 from mathesar.models import Table
 from mathesar.utils.tables import (
     get_table_column_types, create_table_from_datafile, create_empty_table,
@@ -33,11 +35,12 @@ class TableViewSet(viewsets.GenericViewSet, ListModelMixin, RetrieveModelMixin):
 
         schema = serializer.validated_data['schema']
         data_files = serializer.validated_data.get('data_files')
+        infer_types = serializer.validated_data.get('infer_types', False)
         name = serializer.validated_data.get('name') or gen_table_name(schema, data_files)
 
         try:
             if data_files:
-                table = create_table_from_datafile(data_files, name, schema)
+                table = create_table_from_datafile(data_files, name, schema, infer_types)
             else:
                 table = create_empty_table(name, schema)
         except ProgrammingError as e:
@@ -88,7 +91,9 @@ class TableViewSet(viewsets.GenericViewSet, ListModelMixin, RetrieveModelMixin):
     @action(methods=['get'], detail=True)
     def type_suggestions(self, request, pk=None):
         table = self.get_object()
-        col_types = get_table_column_types(table)
+        serializer = TypeSuggestionParameterSerializer(data=request.GET)
+        serializer.is_valid(raise_exception=True)
+        col_types = get_table_column_types(table, **serializer.validated_data)
         return Response(col_types)
 
     @action(methods=['post'], detail=True)
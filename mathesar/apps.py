@@ -1,4 +1,8 @@
 from django.apps import AppConfig
+from django.conf import settings
+
+from db.admission import configure_admission
+from db.records.coalescing import configure_coalescing
 
 
 class MathesarConfig(AppConfig):
@@ -6,3 +10,5 @@ class MathesarConfig(AppConfig):
 
     def ready(self):
         import mathesar.signals  # noqa
+        configure_admission(**settings.MATHESAR_ADMISSION_CONTROL)
+        configure_coalescing(**settings.MATHESAR_RECORDS_COALESCING)
@@ -1,22 +1,28 @@
 from io import TextIOWrapper
+from itertools import islice
 
 import clevercsv as csv
 
 from mathesar.database.base import create_mathesar_engine
 from mathesar.models import Table
-from db.records.operations.insert import insert_records_from_csv
-from db.tables.operations.create import create_string_column_table
+from db.admission import IMPORT, admit
+from db.columns.operations.infer_types import infer_column_type_from_values
+from db.records.operations.insert import insert_records_from_csv, insert_records_from_csv_with_casts
+from db.tables.operations.create import create_string_column_table, create_typed_column_table
 from db.tables.operations.select import get_oid_from_table
 from db.tables.operations.drop import drop_table
+from db.tables.operations.infer_types import update_table_column_types
 from mathesar.errors import InvalidTableError
 from db import constants
-from psycopg2.errors import IntegrityError, DataError
+from psycopg2.errors import IntegrityError, DataError, InternalError
+from sqlalchemy.exc import DatabaseError
 
 from mathesar.reflection import reflect_columns_from_table
 
 ALLOWED_DELIMITERS = ",\t:|"
 SAMPLE_SIZE = 20000
 CHECK_ROWS = 10
+TYPE_INFERENCE_SAMPLE_ROWS = 1000
 
 
 def get_file_encoding(file):
@@ -107,7 +113,62 @@ def get_sv_reader(file, header, dialect=None):
     return reader
 
 
-def create_db_table_from_data_file(data_file, name, schema):
+def get_sv_column_types(sv_reader, sample_size=TYPE_INFERENCE_SAMPLE_ROWS):
+    """
+    Infers the type of each column of a *sv file from its first sample_size
+    rows, without loading anything into the DB.
+
+    Args:
+        sv_reader: csv.DictReader object, positioned at the first data row
+        sample_size: int, the maximum number of rows to sample
+
+    Returns:
+        dict: maps each column name to a type string of TYPE_INFERENCE_DAG
+    """
+    sample_rows = list(islice(sv_reader, sample_size))
+    return {
+        column_name: infer_column_type_from_values(
+            [row.get(column_name) for row in sample_rows]
+        )
+        for column_name in sv_reader.fieldnames
+        if column_name != constants.ID
+    }
+
+
+def _create_typed_db_table_from_data_file(
+        name, schema, engine, sv_filename, column_names, column_types, header, dialect, encoding
+):
+    table = create_typed_column_table(
+        name=name,
+        schema=schema.name,
+        column_names=column_names,
+        column_types=column_types,
+        engine=engine
+    )
+    try:
+        insert_records_from_csv_with_casts(
+            table,
+            engine,
+            sv_filename,
+            column_names,
+            header,
+            delimiter=dialect.delimiter,
+            escape=dialect.escapechar,
+            quote=dialect.quotechar,
+            encoding=encoding
+        )
+    except (IntegrityError, DataError, InternalError, DatabaseError):
+        # Rows outside of the sample didn't fit the inferred types, so the
+        # caller should fall back to importing all columns as strings, and
+        # inferring their types from the whole table.
+        drop_table(name=name, schema=schema.name, engine=engine)
+        return None
+    return table
+
+
+def create_db_table_from_data_file(
+        data_file, name, schema, infer_types=False, parallel_inference=False
+):
     engine = create_mathesar_engine(schema.database.name)
     sv_filename = data_file.file.path
     header = data_file.header
@@ -118,12 +179,20 @@ def create_db_table_from_data_file(data_file, name, schema):
         sv_reader = get_sv_reader(sv_file, header, dialect=dialect)
         column_names = sv_reader.fieldnames
         column_names_alt = [fieldname if fieldname != constants.ID else constants.ID_ORIGINAL for fieldname in sv_reader.fieldnames]
-        table = create_string_column_table(
-            name=name,
-            schema=schema.name,
-            column_names=column_names,
-            engine=engine
+        column_types = get_sv_column_types(sv_reader) if infer_types else None
+    if column_types is not None:
+        table = _create_typed_db_table_from_data_file(
+            name, schema, engine, sv_filename, column_names, column_types,
+            header, dialect, encoding
         )
+        if table is not None:
+            return table
+    table = create_string_column_table(
+        name=name,
+        schema=schema.name,
+        column_names=column_names,
+        engine=engine
+    )
     try:
         insert_records_from_csv(
             table,
@@ -155,14 +224,23 @@ def create_db_table_from_data_file(data_file, name, schema):
             quote=dialect.quotechar,
             encoding=encoding
         )
+    if column_types is not None:
+        update_table_column_types(
+            schema.name, table.name, engine, parallel=parallel_inference
+        )
     return table
 
 
-def create_table_from_csv(data_file, name, schema):
+def create_table_from_csv(
+        data_file, name, schema, infer_types=False, parallel_inference=False
+):
     engine = create_mathesar_engine(schema.database.name)
-    db_table = create_db_table_from_data_file(
-        data_file, name, schema
-    )
+    # The import holds a single query slot for its whole duration
+    with admit(engine, IMPORT):
+        db_table = create_db_table_from_data_file(
+            data_file, name, schema, infer_types=infer_types,
+            parallel_inference=parallel_inference,
+        )
     db_table_oid = get_oid_from_table(db_table.name, db_table.schema, engine)
     # Using current_objects to create the table instead of objects. objects
     # triggers re-reflection, which will cause a race condition to create the table
@@ -1,5 +1,6 @@
 from typing import Any
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.db import models
@@ -8,24 +9,32 @@ from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
 
 from db.columns import utils as column_utils
-from db.columns.operations.create import create_column, duplicate_column
+from db.columns.operations.create import batch_create_columns, create_column, duplicate_column
 from db.columns.operations.alter import alter_column
-from db.columns.operations.drop import drop_column
-from db.columns.operations.select import get_column_name_from_attnum
-from db.constraints.operations.create import create_unique_constraint
+from db.columns.operations.drop import batch_drop_columns, drop_column
+from db.columns.operations.select import (
+    get_column_name_from_attnum, get_columns_attnum_from_names
+)
+from db.constraints.operations.create import (
+    create_unique_constraint, create_unique_constraint_concurrently
+)
 from db.constraints.operations.drop import drop_constraint
 from db.constraints.operations.select import get_constraint_oid_by_name_and_table_oid, get_constraint_from_oid
 from db.constraints import utils as constraint_utils
+from db.records.coalescing import invalidate_table_results
 from db.records.operations.delete import delete_record
 from db.records.operations.group import get_group_counts
 from db.records.operations.insert import insert_record_or_records
-from db.records.operations.select import get_column_cast_records, get_count, get_record, get_records
+from db.records.operations.select import (
+    get_column_cast_failures, get_column_cast_records, get_count, get_record, get_records
+)
 from db.records.operations.update import update_record
 from db.schemas.operations.drop import drop_schema
 from db.schemas import utils as schema_utils
 from db.tables import utils as table_utils
+from db.tables.operations.data_version import bump_data_version, get_data_version
 from db.tables.operations.drop import drop_table
-from db.tables.operations.select import reflect_table_from_oid
+from db.tables.operations.select import get_table_version, reflect_table_from_oid
 from mathesar import reflection
 from mathesar.utils import models as model_utils
 from mathesar.database.base import create_mathesar_engine
@@ -33,6 +42,7 @@ from mathesar.database.types import get_types
 
 
 NAME_CACHE_INTERVAL = 60 * 5
+TYPE_SUGGESTIONS_CACHE_INTERVAL = 60 * 60
 
 
 class BaseModel(models.Model):
@@ -214,6 +224,41 @@ class Table(DatabaseObject):
     def sa_constraints(self):
         return self._sa_table.constraints
 
+    @property
+    def type_suggestions_cache_key(self):
+        return f"{self.schema.database.name}_type_suggestions_{self.oid}"
+
+    def get_version(self):
+        return get_table_version(self.oid, self.schema._sa_engine)
+
+    def clear_type_suggestions_cache(self):
+        cache.delete(self.type_suggestions_cache_key)
+
+    @property
+    def data_version_cache_key(self):
+        return f"{self.schema.database.name}_data_version_{self.oid}"
+
+    def get_data_version(self, query_options=None):
+        """
+        Returns the data version of the table (see
+        `db.tables.operations.data_version`), or None if it isn't tracked.
+        """
+        # Wrapped in a tuple, since None is also cached
+        cached = cache.get(self.data_version_cache_key)
+        if cached is None:
+            cached = (get_data_version(self.oid, self.schema._sa_engine, query_options),)
+            cache.set(
+                self.data_version_cache_key, cached, settings.MATHESAR_RECORDS_VERSION_CACHE_TTL
+            )
+        return cached[0]
+
+    def clear_records_cache(self):
+        # The trigger only catches changes to the data, so the version is
+        # also bumped here, for changes to the columns.
+        bump_data_version(self.oid, self.schema._sa_engine)
+        cache.delete(self.data_version_cache_key)
+        invalidate_table_results(self.schema._sa_engine, self.oid)
+
     @property
     def sa_column_names(self):
         return self.sa_columns.keys()
@@ -224,19 +269,54 @@ class Table(DatabaseObject):
         return True
 
     def add_column(self, column_data):
-        return create_column(
+        column = create_column(
             self.schema._sa_engine,
             self.oid,
             column_data,
         )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return column
 
-    def alter_column(self, column_index, column_data):
-        return alter_column(
+    def add_columns(self, column_data_list):
+        columns = batch_create_columns(
             self.schema._sa_engine,
             self.oid,
+            column_data_list,
+        )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return columns
+
+    def alter_column(self, column_index, column_data, online=False, batch_size=None):
+        engine = self.schema._sa_engine
+        if online:
+            old_name = reflect_table_from_oid(self.oid, engine).columns[int(column_index)].name
+            old_attnum = get_columns_attnum_from_names(self.oid, [old_name], engine)[0][0]
+        column = alter_column(
+            engine,
+            self.oid,
             column_index,
             column_data,
+            online=online,
+            batch_size=batch_size,
         )
+        if online:
+            self._move_column_attnum(old_attnum, column.name)
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return column
+
+    def _move_column_attnum(self, old_attnum, column_name):
+        # An online type change replaces the column with a new one, so the
+        # column keeps its model (and display options) under the new attnum.
+        new_attnum = get_columns_attnum_from_names(
+            self.oid, [column_name], self.schema._sa_engine
+        )[0][0]
+        if new_attnum != old_attnum:
+            # Reflection may have added a model for the shadow column
+            Column.current_objects.filter(table=self, attnum=new_attnum).delete()
+            Column.current_objects.filter(table=self, attnum=old_attnum).update(attnum=new_attnum)
 
     def drop_column(self, column_index):
         drop_column(
@@ -244,49 +324,97 @@ class Table(DatabaseObject):
             column_index,
             self.schema._sa_engine,
         )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+
+    def drop_columns(self, column_indexes):
+        batch_drop_columns(
+            self.oid,
+            column_indexes,
+            self.schema._sa_engine,
+        )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
 
-    def duplicate_column(self, column_index, copy_data, copy_constraints, name=None):
-        return duplicate_column(
+    def duplicate_column(self, column_index, copy_data, copy_constraints, name=None, batch_size=None):
+        column = duplicate_column(
             self.oid,
             column_index,
             self.schema._sa_engine,
             new_column_name=name,
             copy_data=copy_data,
             copy_constraints=copy_constraints,
+            batch_size=batch_size,
         )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return column
 
     def get_preview(self, column_definitions):
         return get_column_cast_records(
             self.schema._sa_engine, self._sa_table, column_definitions
         )
 
+    def get_column_cast_failures(self, column_name, target_type, num_records=20, sample_percent=None):
+        return get_column_cast_failures(
+            self.schema._sa_engine,
+            self._sa_table,
+            column_name,
+            target_type,
+            num_records=num_records,
+            sample_percent=sample_percent,
+        )
+
     @property
     def sa_all_records(self):
         return get_records(self._sa_table, self.schema._sa_engine)
 
-    def sa_num_records(self, filters=[]):
-        return get_count(self._sa_table, self.schema._sa_engine, filters=filters)
+    def sa_num_records(self, filters=[], query_options=None):
+        return get_count(
+            self._sa_table, self.schema._sa_engine, filters=filters,
+            query_options=query_options, coalesce=True, table_oid=self.oid,
+            data_version=self.get_data_version(query_options),
+        )
 
     def update_sa_table(self, update_params):
-        return model_utils.update_sa_table(self, update_params)
+        result = model_utils.update_sa_table(self, update_params)
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return result
 
     def delete_sa_table(self):
-        return drop_table(self.name, self.schema.name, self.schema._sa_engine, cascade=True)
-
-    def get_record(self, id_value):
-        return get_record(self._sa_table, self.schema._sa_engine, id_value)
+        result = drop_table(self.name, self.schema.name, self.schema._sa_engine, cascade=True)
+        cache.delete(self.data_version_cache_key)
+        invalidate_table_results(self.schema._sa_engine, self.oid)
+        return result
+
+    def get_record(self, id_value, query_options=None, columns=None):
+        return get_record(
+            self._sa_table, self.schema._sa_engine, id_value, query_options, columns
+        )
 
-    def get_records(self, limit=None, offset=None, filters=[], order_by=[]):
+    def get_records(
+            self, limit=None, offset=None, filters=[], order_by=[], query_options=None,
+            columns=None, preview_length=None,
+    ):
         return get_records(
             self._sa_table,
             self.schema._sa_engine,
             limit,
             offset,
             filters=filters,
-            order_by=order_by
+            order_by=order_by,
+            query_options=query_options,
+            coalesce=True,
+            table_oid=self.oid,
+            data_version=self.get_data_version(query_options),
+            columns=columns,
+            preview_length=preview_length,
         )
 
-    def get_group_counts(self, group_by, limit=None, offset=None, filters=[], order_by=[]):
+    def get_group_counts(
+            self, group_by, limit=None, offset=None, filters=[], order_by=[], query_options=None
+    ):
         return get_group_counts(
             self._sa_table,
             self.schema._sa_engine,
@@ -294,22 +422,39 @@ class Table(DatabaseObject):
             limit,
             offset,
             filters=filters,
-            order_by=order_by
+            order_by=order_by,
+            query_options=query_options,
         )
 
-    def create_record_or_records(self, record_data):
-        return insert_record_or_records(self._sa_table, self.schema._sa_engine, record_data)
+    def create_record_or_records(self, record_data, query_options=None):
+        record = insert_record_or_records(
+            self._sa_table, self.schema._sa_engine, record_data, query_options
+        )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return record
 
-    def update_record(self, id_value, record_data):
-        return update_record(self._sa_table, self.schema._sa_engine, id_value, record_data)
+    def update_record(self, id_value, record_data, query_options=None):
+        record = update_record(
+            self._sa_table, self.schema._sa_engine, id_value, record_data, query_options
+        )
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return record
 
-    def delete_record(self, id_value):
-        return delete_record(self._sa_table, self.schema._sa_engine, id_value)
+    def delete_record(self, id_value, query_options=None):
+        result = delete_record(self._sa_table, self.schema._sa_engine, id_value, query_options)
+        self.clear_type_suggestions_cache()
+        self.clear_records_cache()
+        return result
 
-    def add_constraint(self, constraint_type, columns, name=None):
+    def add_constraint(self, constraint_type, columns, name=None, concurrently=False):
         if constraint_type != constraint_utils.ConstraintType.UNIQUE.value:
             raise ValueError('Only creating unique constraints is currently supported.')
-        create_unique_constraint(
+        create_constraint = (
+            create_unique_constraint_concurrently if concurrently else create_unique_constraint
+        )
+        create_constraint(
             self.name,
             self._sa_table.schema,
             self.schema._sa_engine,
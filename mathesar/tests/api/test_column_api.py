@@ -475,6 +475,51 @@ def test_column_update_type(column_test_table, client):
     assert response.json()["type"] == type_
 
 
+def test_column_update_type_online(column_test_table, client):
+    cache.clear()
+    type_ = "NUMERIC"
+    data = {"type": type_, "online": True, "online_batch_size": 2}
+    response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    columns = response.json()['results']
+    column_index = 2
+    column_id = columns[column_index]['id']
+    response = client.patch(
+        f"/api/v0/tables/{column_test_table.id}/columns/{column_id}/", data=data
+    )
+    assert response.status_code == 200
+    response_column = response.json()
+    assert response_column["id"] == column_id
+    assert response_column["name"] == "mycolumn2"
+    assert response_column["type"] == type_
+    # The column is moved to the end of the table
+    assert response_column["index"] == 3
+
+    response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    columns = response.json()['results']
+    assert [column["name"] for column in columns] == [
+        "mycolumn0", "mycolumn1", "mycolumn3", "mycolumn2"
+    ]
+    assert columns[3]["id"] == column_id
+
+
+def test_column_update_type_online_primary_key(column_test_table, client):
+    cache.clear()
+    data = {"type": "NUMERIC", "online": True}
+    response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    column_id = response.json()['results'][0]['id']
+    response = client.patch(
+        f"/api/v0/tables/{column_test_table.id}/columns/{column_id}/", data=data
+    )
+    assert response.status_code == 400
+    assert response.json()[0] == 'Key columns cannot be retyped online'
+
+
 def test_column_update_name_and_type(column_test_table, client):
     cache.clear()
     type_ = "BOOLEAN"
@@ -643,6 +688,20 @@ def test_column_update_type_invalid_cast(column_test_table, client):
     assert response.status_code == 400
 
 
+def test_column_cast_check_unimplemented_cast(column_test_table_with_service_layer_options, client):
+    cache.clear()
+    table, _ = column_test_table_with_service_layer_options
+    columns = client.get(f"/api/v0/tables/{table.id}/columns/").json()['results']
+    # There's no cast from BOOLEAN to EMAIL
+    column_id = columns[1]['id']
+    response = client.post(
+        f"/api/v0/tables/{table.id}/columns/{column_id}/cast_check/",
+        {"type": "MATHESAR_TYPES.EMAIL"}
+    )
+    assert response.status_code == 400
+    assert response.json() == ['This type cast is not implemented']
+
+
 def test_column_update_when_missing(column_test_table, client):
     cache.clear()
     name = "updatedname"
@@ -687,6 +746,115 @@ def test_column_destroy_when_missing(column_test_table, client):
     assert response.status_code == 404
 
 
+def test_column_batch_create(column_test_table, client):
+    cache.clear()
+    num_columns = len(column_test_table.sa_columns)
+    data = {
+        "columns": [
+            {"name": "batch_numeric", "type": "NUMERIC", "display_options": {"show_as_percentage": True}},
+            {"name": "batch_text", "type": "VARCHAR", "nullable": False, "default": "abc"},
+        ]
+    }
+    response = client.post(
+        f"/api/v0/tables/{column_test_table.id}/columns/batch_create/",
+        data=data,
+        format="json",
+    )
+    assert response.status_code == 201
+    response_data = response.json()
+    assert [col["name"] for col in response_data] == ["batch_numeric", "batch_text"]
+    assert response_data[0]["display_options"] == {"show_as_percentage": True}
+    assert response_data[1]["nullable"] is False
+    assert response_data[1]["default"] == "abc"
+    new_columns_response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    assert new_columns_response.json()["count"] == num_columns + 2
+
+
+def test_column_batch_create_invalid(column_test_table, client):
+    cache.clear()
+    num_columns = len(column_test_table.sa_columns)
+    data = {
+        "columns": [
+            {"name": "batch_numeric", "type": "NUMERIC"},
+            {"name": "only name"},
+        ]
+    }
+    response = client.post(
+        f"/api/v0/tables/{column_test_table.id}/columns/batch_create/",
+        data=data,
+        format="json",
+    )
+    assert response.status_code == 400
+    assert response.json()["1"]["type"][0] == "This field is required."
+    new_columns_response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    assert new_columns_response.json()["count"] == num_columns
+
+
+def test_column_batch_create_duplicate(column_test_table, client):
+    cache.clear()
+    data = {
+        "columns": [
+            {"name": "batch_numeric", "type": "NUMERIC"},
+            {"name": column_test_table.sa_columns[0].name, "type": "NUMERIC"},
+        ]
+    }
+    response = client.post(
+        f"/api/v0/tables/{column_test_table.id}/columns/batch_create/",
+        data=data,
+        format="json",
+    )
+    assert response.status_code == 400
+    new_columns_response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    assert "batch_numeric" not in [col["name"] for col in new_columns_response.json()["results"]]
+
+
+def test_column_batch_destroy(column_test_table, client):
+    cache.clear()
+    num_columns = len(column_test_table.sa_columns)
+    response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    columns = response.json()['results']
+    to_drop = [columns[1], columns[2]]
+    response = client.post(
+        f"/api/v0/tables/{column_test_table.id}/columns/batch_destroy/",
+        data={"columns": [col["id"] for col in to_drop]},
+        format="json",
+    )
+    assert response.status_code == 204
+    new_columns_response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    new_data = new_columns_response.json()
+    assert new_data["count"] == num_columns - 2
+    new_names = [col["name"] for col in new_data["results"]]
+    assert all(col["name"] not in new_names for col in to_drop)
+
+
+def test_column_batch_destroy_when_missing(column_test_table, client):
+    cache.clear()
+    response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    column_id = response.json()['results'][1]['id']
+    response = client.post(
+        f"/api/v0/tables/{column_test_table.id}/columns/batch_destroy/",
+        data={"columns": [column_id, 99999]},
+        format="json",
+    )
+    assert response.status_code == 404
+    new_columns_response = client.get(
+        f"/api/v0/tables/{column_test_table.id}/columns/"
+    )
+    assert column_id in [col["id"] for col in new_columns_response.json()["results"]]
+
+
 def test_column_duplicate(column_test_table, client):
     cache.clear()
     target_col_idx = 2
@@ -716,8 +884,28 @@ def test_column_duplicate(column_test_table, client):
     assert mock_infer.call_args[1] == {
         "new_column_name": data["name"],
         "copy_data": data["copy_source_data"],
-        "copy_constraints": data["copy_source_constraints"]
+        "copy_constraints": data["copy_source_constraints"],
+        "batch_size": None,
+    }
+
+
+def test_column_duplicate_batched(column_test_table, client):
+    cache.clear()
+    target_col_idx = 2
+    target_col = column_test_table.sa_columns[target_col_idx]
+    data = {
+        "name": "new_col_name",
+        "source_column": target_col_idx,
+        "copy_batch_size": 1000,
     }
+    with patch.object(models, "duplicate_column") as mock_infer:
+        mock_infer.return_value = target_col
+        response = client.post(
+            f"/api/v0/tables/{column_test_table.id}/columns/",
+            data=data
+        )
+    assert response.status_code == 201
+    assert mock_infer.call_args[1]["batch_size"] == 1000
 
 
 def test_column_duplicate_when_missing(column_test_table, client):
@@ -752,3 +940,37 @@ def test_column_duplicate_no_parameters(column_test_table, client):
     assert response.status_code == 400
     assert response_data["name"][0] == "This field is required."
     assert response_data["type"][0] == "This field is required."
+
+
+def test_column_cast_check(column_test_table, client):
+    cache.clear()
+    table = column_test_table
+    table.create_record_or_records([
+        {"mycolumn0": 1, "mycolumn1": 1, "mycolumn3": "1"},
+        {"mycolumn0": 2, "mycolumn1": 1, "mycolumn3": "not a number"},
+        {"mycolumn0": 3, "mycolumn1": 1, "mycolumn3": None},
+        {"mycolumn0": 4, "mycolumn1": 1, "mycolumn3": "still not a number"},
+    ])
+    columns = client.get(f"/api/v0/tables/{table.id}/columns/").json()['results']
+    column_id = columns[3]['id']
+    response = client.post(
+        f"/api/v0/tables/{table.id}/columns/{column_id}/cast_check/",
+        {"type": "NUMERIC", "limit": 1}
+    )
+    response_data = response.json()
+    assert response.status_code == 200
+    assert response_data['count'] == 2
+    assert response_data['primary_keys'] == [2]
+    assert response_data['records'][0]['mycolumn3'] == "not a number"
+
+
+def test_column_cast_check_unsupported_type(column_test_table, client):
+    cache.clear()
+    table = column_test_table
+    columns = client.get(f"/api/v0/tables/{table.id}/columns/").json()['results']
+    column_id = columns[3]['id']
+    response = client.post(
+        f"/api/v0/tables/{table.id}/columns/{column_id}/cast_check/",
+        {"type": "NOT_A_TYPE"}
+    )
+    assert response.status_code == 400
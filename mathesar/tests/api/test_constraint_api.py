@@ -161,6 +161,39 @@ def test_create_unique_constraint_for_non_unique_column(create_table, client):
     assert response.json() == ['This column has non-unique values so a unique constraint cannot be set']
 
 
+def test_create_unique_constraint_concurrently(create_table, client):
+    table_name = 'NASA Constraint List 11'
+    table = create_table(table_name)
+
+    data = {
+        'type': 'unique',
+        'columns': ['Case Number'],
+        'concurrently': True,
+    }
+    response = client.post(f'/api/v0/tables/{table.id}/constraints/', data=data)
+    assert response.status_code == 201
+    _verify_unique_constraint(response.json(), ['Case Number'], 'NASA Constraint List 11_Case Number_key')
+
+
+def test_create_unique_constraint_concurrently_for_non_unique_column(create_table, client):
+    table_name = 'NASA Constraint List 12'
+    table = create_table(table_name)
+
+    data = {
+        'type': 'unique',
+        'columns': ['Center'],
+        'concurrently': True,
+    }
+    response = client.post(f'/api/v0/tables/{table.id}/constraints/', data=data)
+    response_data = response.json()
+    assert response.status_code == 400
+    assert response_data['columns'] == [
+        'These columns have non-unique values so a unique constraint cannot be set'
+    ]
+    assert len(response_data['duplicate_groups']) > 0
+    assert all('Center' in group for group in response_data['duplicate_groups'])
+
+
 def test_drop_nonexistent_constraint(create_table, client):
     table_name = 'NASA Constraint List 10'
     table = create_table(table_name)
@@ -2,6 +2,7 @@ import pytest
 from django.conf import settings
 from django.core.cache import cache
 
+from db.admission import PRIORITIES
 from mathesar.api.display_options import DISPLAY_OPTIONS_BY_TYPE_IDENTIFIER
 from mathesar.api.filters import FILTER_OPTIONS_BY_TYPE_IDENTIFIER
 from mathesar.reflection import reflect_db_objects
@@ -258,3 +259,32 @@ def test_database_types_installed(client, test_db_name, engine_email_type):
 
     response = client.get(f'/api/v0/databases/{default_database.id}/types/').json()
     assert all([type_data in response for type_data in expected_custom_types])
+
+
+def test_database_cancel_query(client, test_db_name):
+    database = Database.objects.get(name=test_db_name)
+    response = client.post(
+        f'/api/v0/databases/{database.id}/cancel_query/', {'query_id': 'not-running'}
+    )
+    assert response.status_code == 200
+    assert response.json() == {'cancelled': 0}
+
+
+def test_database_cancel_query_bad_id(client, test_db_name):
+    database = Database.objects.get(name=test_db_name)
+    response = client.post(
+        f'/api/v0/databases/{database.id}/cancel_query/', {'query_id': "x'; --"}
+    )
+    assert response.status_code == 400
+    assert 'query_id' in response.json()
+
+
+def test_database_query_load(client, test_db_name):
+    database = Database.objects.get(name=test_db_name)
+    response = client.get(f'/api/v0/databases/{database.id}/query_load/')
+    response_data = response.json()
+    assert response.status_code == 200
+    assert response_data['running'] == 0
+    assert response_data['queued'] == 0
+    assert set(response_data['queued_by_priority']) == set(PRIORITIES)
+    assert response_data['max_concurrent'] == settings.MATHESAR_ADMISSION_CONTROL['max_concurrent']
@@ -1,9 +1,14 @@
 import json
 from unittest.mock import patch
 
+from django.conf import settings
+from django.core.cache import cache
+from psycopg2.errors import LockNotAvailable, QueryCanceled
 import pytest
+from sqlalchemy.exc import OperationalError
 from sqlalchemy_filters.exceptions import BadFilterFormat, BadSortFormat, FilterFieldNotFound, SortFieldNotFound
 
+from db.admission import AdmissionRejectedError
 from db.records.exceptions import BadGroupFormat, GroupFieldNotFound
 from mathesar import models
 
@@ -301,6 +306,154 @@ def test_record_list_pagination_offset(create_table, client):
     assert record_1_data['Application SN'] != record_2_data['Application SN']
 
 
+def test_record_list_columnar(create_table, client):
+    table_name = 'NASA Record List Columnar'
+    table = create_table(table_name)
+
+    query_str = 'record_format=columnar&limit=10&offset=5'
+    response = client.get(f'/api/v0/tables/{table.id}/records/?{query_str}')
+    response_data = response.json()
+    object_response = client.get(f'/api/v0/tables/{table.id}/records/?limit=10&offset=5')
+    object_results = object_response.json()['results']
+
+    assert response.status_code == 200
+    assert response_data['count'] == 1393
+    assert response_data['columns'] == list(table.sa_column_names)
+    assert len(response_data['results']) == 10
+    for values, record in zip(response_data['results'], object_results):
+        assert dict(zip(response_data['columns'], values)) == record
+
+
+def test_record_list_columnar_empty(create_table, client):
+    table_name = 'NASA Record List Columnar Empty'
+    table = create_table(table_name)
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/?record_format=columnar&offset=2000')
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert response_data['columns'] == list(table.sa_column_names)
+    assert response_data['results'] == []
+
+
+def test_record_list_bad_record_format(create_table, client):
+    table_name = 'NASA Record List Bad Format'
+    table = create_table(table_name)
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/?record_format=rows')
+
+    assert response.status_code == 400
+    assert 'record_format' in response.json()
+
+
+def test_record_list_columns(create_table, client):
+    table_name = 'NASA Record List Columns'
+    table = create_table(table_name)
+
+    columns = json.dumps(['Center', 'Title'])
+    response = client.get(f'/api/v0/tables/{table.id}/records/?columns={columns}&record_format=columnar')
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert response_data['count'] == 1393
+    assert response_data['columns'] == ['id', 'Center', 'Title']
+    assert all(len(values) == 3 for values in response_data['results'])
+
+
+@pytest.mark.parametrize("columns", [json.dumps(['Not a column']), json.dumps('Center')])
+def test_record_list_bad_columns(create_table, client, columns):
+    table_name = 'NASA Record List Bad Columns'
+    table = create_table(table_name)
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/?columns={columns}')
+
+    assert response.status_code == 400
+    assert 'columns' in response.json()
+
+
+def test_record_detail_columns(create_table, client):
+    table_name = 'NASA Record Detail Columns'
+    table = create_table(table_name)
+    record = table.get_records(limit=1)[0]
+
+    columns = json.dumps(['Title'])
+    response = client.get(f'/api/v0/tables/{table.id}/records/{record["id"]}/?columns={columns}')
+
+    assert response.status_code == 200
+    assert response.json() == {'id': record['id'], 'Title': record['Title']}
+
+
+def test_record_list_preview(create_table, client):
+    table_name = 'NASA Record List Preview'
+    table = create_table(table_name)
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/?preview_length=10&limit=20')
+    response_data = response.json()
+    full_records = client.get(f'/api/v0/tables/{table.id}/records/?limit=20').json()['results']
+
+    assert response.status_code == 200
+    assert len(response_data['truncated']) == 20
+    for record, truncated, full_record in zip(
+            response_data['results'], response_data['truncated'], full_records
+    ):
+        assert set(record) == set(full_record)
+        assert record['Title'] == full_record['Title'][:10]
+        if len(full_record['Title']) > 10:
+            assert truncated['Title'] == len(full_record['Title'])
+        else:
+            assert 'Title' not in truncated
+
+
+def test_record_list_preview_columnar(create_table, client):
+    table_name = 'NASA Record List Preview Columnar'
+    table = create_table(table_name)
+
+    query_str = 'preview_length=10&record_format=columnar&limit=5'
+    response = client.get(f'/api/v0/tables/{table.id}/records/?{query_str}')
+    response_data = response.json()
+
+    assert response.status_code == 200
+    assert response_data['columns'] == list(table.sa_column_names)
+    assert all(len(values) == len(response_data['columns']) for values in response_data['results'])
+
+
+def test_record_cell(create_table, client):
+    table_name = 'NASA Record Cell'
+    table = create_table(table_name)
+    record = table.get_records(limit=1)[0]
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/{record["id"]}/cell/?column=Title')
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'text/plain; charset=utf-8'
+    assert response.content.decode() == record['Title']
+    assert 'ETag' in response
+
+
+def test_record_cell_null(create_table, client):
+    table_name = 'NASA Record Cell Null'
+    table = create_table(table_name)
+    record = table.get_records(limit=1)[0]
+    table.update_record(record['id'], {'Title': None})
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/{record["id"]}/cell/?column=Title')
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/json'
+    assert response.json() is None
+
+
+def test_record_cell_bad_column(create_table, client):
+    table_name = 'NASA Record Cell Bad Column'
+    table = create_table(table_name)
+    record = table.get_records(limit=1)[0]
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/{record["id"]}/cell/?column=Nope')
+
+    assert response.status_code == 400
+    assert 'column' in response.json()
+
+
 def test_record_detail(create_table, client):
     table_name = 'NASA Record Detail'
     table = create_table(table_name)
@@ -454,3 +607,150 @@ def test_record_list_group_exceptions(create_table, client, exception):
     assert response.status_code == 400
     assert len(response_data) == 1
     assert "group_count_by" in response_data
+
+
+@pytest.mark.parametrize('db_error,expected_code', [
+    (QueryCanceled('canceling statement due to statement timeout'), 'statement_timeout'),
+    (LockNotAvailable('canceling statement due to lock timeout'), 'lock_timeout'),
+    (QueryCanceled('canceling statement due to user request'), 'query_cancelled'),
+])
+def test_record_list_cancelled_query(create_table, client, db_error, expected_code):
+    table = create_table('NASA Record List Cancelled')
+    with patch.object(
+        models.Table, 'get_records', side_effect=OperationalError('SELECT', {}, db_error)
+    ):
+        response = client.get(f'/api/v0/tables/{table.id}/records/')
+    assert response.status_code == 503
+    assert response.json()['detail']
+    assert response.data['detail'].code == expected_code
+
+
+def test_record_list_query_options(create_table, client):
+    table = create_table('NASA Record List Query Options')
+    with patch.object(models, "get_records", return_value=[]) as mock_get:
+        client.get(
+            f'/api/v0/tables/{table.id}/records/', HTTP_X_MATHESAR_QUERY_ID='my-query-1'
+        )
+    query_options = mock_get.call_args[1]['query_options']
+    assert query_options['query_tag'] == 'my-query-1'
+    assert query_options['statement_timeout'] == settings.MATHESAR_RECORDS_QUERY_TIMEOUTS['list']['statement_timeout']
+
+
+def test_record_list_bad_query_id(create_table, client):
+    table = create_table('NASA Record List Bad Query Id')
+    response = client.get(
+        f'/api/v0/tables/{table.id}/records/', HTTP_X_MATHESAR_QUERY_ID="'; --"
+    )
+    assert response.status_code == 400
+    assert 'query_id' in response.json()
+
+
+def test_record_list_shed_by_admission_control(create_table, client):
+    table = create_table('NASA Record List Shed')
+    with patch.object(
+        models.Table, 'get_records',
+        side_effect=AdmissionRejectedError('test', 'too many queued queries'),
+    ):
+        response = client.get(f'/api/v0/tables/{table.id}/records/')
+    assert response.status_code == 429
+    assert 'Retry-After' in response
+
+
+def test_record_list_etag_not_modified(create_table, client):
+    table = create_table('NASA Record List ETag')
+    response = client.get(f'/api/v0/tables/{table.id}/records/')
+    etag = response['ETag']
+    assert response.status_code == 200
+
+    with patch.object(models, "get_records") as mock_get:
+        response = client.get(f'/api/v0/tables/{table.id}/records/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+    assert mock_get.call_args is None
+
+
+def test_record_list_etag_changes_with_writes(create_table, client):
+    table = create_table('NASA Record List ETag Write')
+    etag = client.get(f'/api/v0/tables/{table.id}/records/')['ETag']
+
+    client.patch(f'/api/v0/tables/{table.id}/records/1/', data={'Center': 'NASA Example Space Center'})
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+def test_record_detail_etag_not_modified(create_table, client):
+    table = create_table('NASA Record Detail ETag')
+    response = client.get(f'/api/v0/tables/{table.id}/records/1/')
+    etag = response['ETag']
+    response = client.get(f'/api/v0/tables/{table.id}/records/1/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+
+def test_record_list_etag_changes_with_external_writes(create_table, client):
+    table = create_table('NASA Record List ETag External Write')
+    etag = client.get(f'/api/v0/tables/{table.id}/records/')['ETag']
+
+    sa_table = table._sa_table
+    with table.schema._sa_engine.begin() as conn:
+        conn.execute(sa_table.update().values(Center='NASA Example Space Center'))
+    # Otherwise, the version is only read again once its cache entry expires
+    cache.delete(table.data_version_cache_key)
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert response.json()['results'][0]['Center'] == 'NASA Example Space Center'
+
+
+def test_record_list_etag_ignores_uncommitted_external_writes(create_table, client):
+    table = create_table('NASA Record List ETag Uncommitted Write')
+    client.get(f'/api/v0/tables/{table.id}/records/')
+
+    sa_table = table._sa_table
+    with table.schema._sa_engine.connect() as conn:
+        trans = conn.begin()
+        conn.execute(sa_table.update().values(Center='NASA Example Space Center'))
+        cache.delete(table.data_version_cache_key)
+        response = client.get(f'/api/v0/tables/{table.id}/records/')
+        etag = response['ETag']
+        assert response.json()['results'][0]['Center'] != 'NASA Example Space Center'
+        trans.commit()
+    cache.delete(table.data_version_cache_key)
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert response.json()['results'][0]['Center'] == 'NASA Example Space Center'
+
+
+def test_record_list_etag_differs_by_query(create_table, client):
+    table = create_table('NASA Record List ETag Query')
+    etag = client.get(f'/api/v0/tables/{table.id}/records/?limit=5')['ETag']
+
+    response = client.get(f'/api/v0/tables/{table.id}/records/?limit=10', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+def test_record_list_untracked_table_has_no_etag(create_table, client):
+    table = create_table('NASA Record List Untracked')
+
+    with patch.object(models, "get_data_version", return_value=None):
+        cache.delete(table.data_version_cache_key)
+        response = client.get(f'/api/v0/tables/{table.id}/records/', HTTP_IF_NONE_MATCH='*')
+    assert response.status_code == 200
+    assert 'ETag' not in response
+    assert len(response.json()['results']) == 50
+
+
+def test_record_list_body_cache(create_table, client, settings):
+    settings.MATHESAR_RECORDS_BODY_CACHE_TTL = 60
+    table = create_table('NASA Record List Body Cache')
+    expected = client.get(f'/api/v0/tables/{table.id}/records/?limit=5').json()
+
+    with patch.object(models, "get_records") as mock_get:
+        response = client.get(f'/api/v0/tables/{table.id}/records/?limit=5')
+    assert mock_get.call_args is None
+    assert response.json() == expected
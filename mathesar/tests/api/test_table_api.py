@@ -7,8 +7,11 @@ from sqlalchemy import text
 
 from mathesar import reflection
 from mathesar import models
+from mathesar.imports import csv as csv_import
 from mathesar.models import Table, DataFile
+from mathesar.utils import tables as table_utils
 from db.tests.types import fixtures
+from db.types.base import PostgresType
 
 
 engine_with_types = fixtures.engine_with_types
@@ -386,6 +389,170 @@ def test_table_type_suggestion(client, schema, engine_email_type):
     assert response_table == EXPECTED_TYPES
 
 
+def _create_type_inference_table(client, schema, table_name):
+    file = 'mathesar/tests/data/type_inference.csv'
+    with open(file, 'rb') as csv_file:
+        data_file = DataFile.objects.create(file=File(csv_file))
+    body = {
+        'data_files': [data_file.id],
+        'name': table_name,
+        'schema': schema.id,
+    }
+    response_table = client.post('/api/v0/tables/', body).json()
+    return Table.objects.get(id=response_table['id'])
+
+
+def test_table_type_suggestion_cached(client, schema, engine_email_type):
+    cache.clear()
+    table = _create_type_inference_table(client, schema, 'Cached Type Inference Table')
+    infer_types = table_utils.infer_table_column_types_single_scan
+    with patch.object(
+        table_utils, 'infer_table_column_types_single_scan', wraps=infer_types
+    ) as mock_infer:
+        first_response = client.get(f'/api/v0/tables/{table.id}/type_suggestions/')
+        second_response = client.get(f'/api/v0/tables/{table.id}/type_suggestions/')
+    assert first_response.json() == second_response.json()
+    assert mock_infer.call_count == 1
+
+
+def test_table_type_suggestion_cache_cleared_on_record_create(client, schema, engine_email_type):
+    cache.clear()
+    table = _create_type_inference_table(client, schema, 'Cached Type Inference Table')
+    response = client.get(f'/api/v0/tables/{table.id}/type_suggestions/')
+    assert response.json()['col_1'] == 'NUMERIC'
+
+    client.post(f'/api/v0/tables/{table.id}/records/', {'col_1': 'not a number'})
+    response = client.get(f'/api/v0/tables/{table.id}/type_suggestions/')
+    assert response.json()['col_1'] == 'VARCHAR'
+
+
+@pytest.mark.parametrize('params', [
+    {'sample_size': 100},
+    {'sample_size': 100, 'sample_method': 'bernoulli', 'seed': 1, 'verify': False},
+])
+def test_table_type_suggestion_sampled(client, schema, engine_email_type, params):
+    table_name = 'Sampled Type Inference Table'
+    file = 'mathesar/tests/data/type_inference.csv'
+    with open(file, 'rb') as csv_file:
+        data_file = DataFile.objects.create(file=File(csv_file))
+
+    body = {
+        'data_files': [data_file.id],
+        'name': table_name,
+        'schema': schema.id,
+    }
+    response_table = client.post('/api/v0/tables/', body).json()
+    table = Table.objects.get(id=response_table['id'])
+
+    EXPECTED_TYPES = {
+        'col_1': 'NUMERIC',
+        'col_2': 'BOOLEAN',
+        'col_3': 'BOOLEAN',
+        'col_4': 'VARCHAR',
+        'col_5': 'VARCHAR',
+        'col_6': 'NUMERIC'
+    }
+    response = client.get(f'/api/v0/tables/{table.id}/type_suggestions/', params)
+    assert response.status_code == 200
+    assert response.json() == EXPECTED_TYPES
+
+
+def test_table_type_suggestion_bad_sample_method(client, schema, engine_email_type):
+    table_name = 'Sampled Type Inference Table'
+    file = 'mathesar/tests/data/type_inference.csv'
+    with open(file, 'rb') as csv_file:
+        data_file = DataFile.objects.create(file=File(csv_file))
+
+    body = {
+        'data_files': [data_file.id],
+        'name': table_name,
+        'schema': schema.id,
+    }
+    response_table = client.post('/api/v0/tables/', body).json()
+    response = client.get(
+        f'/api/v0/tables/{response_table["id"]}/type_suggestions/',
+        {'sample_size': 100, 'sample_method': 'not_a_method'}
+    )
+    assert response.status_code == 400
+    assert 'sample_method' in response.json()
+
+
+def test_table_create_with_inferred_types(client, schema, engine_email_type):
+    table_name = 'Import Inference Table'
+    file = 'mathesar/tests/data/type_inference.csv'
+    with open(file, 'rb') as csv_file:
+        data_file = DataFile.objects.create(file=File(csv_file))
+
+    body = {
+        'data_files': [data_file.id],
+        'name': table_name,
+        'schema': schema.id,
+        'infer_types': True,
+    }
+    response = client.post('/api/v0/tables/', body)
+    response_table = response.json()
+    assert response.status_code == 201
+    assert 'infer_types' not in response_table
+
+    EXPECTED_TYPES = {
+        'id': 'INTEGER',
+        'col_1': 'NUMERIC',
+        'col_2': 'BOOLEAN',
+        'col_3': 'BOOLEAN',
+        'col_4': 'VARCHAR',
+        'col_5': 'VARCHAR',
+        'col_6': 'NUMERIC'
+    }
+    actual_types = {
+        column['name']: column['type'] for column in response_table['columns']
+    }
+    assert actual_types == EXPECTED_TYPES
+
+    table = Table.objects.get(id=response_table['id'])
+    assert table.sa_num_records() == 4
+    assert table.get_records()[1] == (2, 2, True, False, 'false', 'cat', 1)
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_table_create_with_inferred_types_fallback(
+        client, schema, engine_email_type, monkeypatch, settings, parallel
+):
+    settings.MATHESAR_PARALLEL_TYPE_INFERENCE = parallel
+    # Types that the rows can't be cast to, as if the sample didn't match
+    # the rest of the file
+    monkeypatch.setattr(
+        csv_import, 'get_sv_column_types',
+        lambda sv_reader: {name: PostgresType.BOOLEAN.value for name in sv_reader.fieldnames}
+    )
+    file = 'mathesar/tests/data/type_inference.csv'
+    with open(file, 'rb') as csv_file:
+        data_file = DataFile.objects.create(file=File(csv_file))
+
+    body = {
+        'data_files': [data_file.id],
+        'name': 'Import Inference Fallback Table',
+        'schema': schema.id,
+        'infer_types': True,
+    }
+    response = client.post('/api/v0/tables/', body)
+    response_table = response.json()
+    assert response.status_code == 201
+
+    EXPECTED_TYPES = {
+        'id': 'INTEGER',
+        'col_1': 'NUMERIC',
+        'col_2': 'BOOLEAN',
+        'col_3': 'BOOLEAN',
+        'col_4': 'VARCHAR',
+        'col_5': 'VARCHAR',
+        'col_6': 'NUMERIC'
+    }
+    actual_types = {
+        column['name']: column['type'] for column in response_table['columns']
+    }
+    assert actual_types == EXPECTED_TYPES
+
+
 def _check_columns(actual_column_list, expected_column_list):
     # Columns will return an extra type_options key in actual_dict
     # so we need to check equality only for the keys in expect_dict
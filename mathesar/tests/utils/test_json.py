@@ -0,0 +1,54 @@
+import datetime
+from decimal import Decimal
+import uuid
+
+from rest_framework.renderers import JSONRenderer
+
+from mathesar.utils.json import MathesarJSONEncoder, MathesarJSONRenderer
+
+
+class DRFMathesarJSONRenderer(JSONRenderer):
+    encoder_class = MathesarJSONEncoder
+
+
+def _get_record_data():
+    return {
+        "count": 2,
+        "results": [
+            {
+                "id": 1,
+                "name": "text with \u2028 separator and ünïcödé",
+                "price": Decimal("12.50"),
+                "day": datetime.date(2021, 10, 5),
+                "at": datetime.datetime(2021, 10, 5, 13, 2, 3, 123456),
+                "at_utc": datetime.datetime(2021, 10, 5, 13, 2, 3, tzinfo=datetime.timezone.utc),
+                "time": datetime.time(13, 2, 3, 123456),
+                "time_tz": datetime.time(13, 2, 3, tzinfo=datetime.timezone.utc),
+                "duration": datetime.timedelta(days=1, hours=2, microseconds=5),
+                "uid": uuid.UUID("6b5e6a5c-0dc9-4c4b-9a4f-38e5a7b0c1d2"),
+                "flag": True,
+                "nothing": None,
+                "ratio": 0.5,
+                "tags": ("a", "b"),
+            },
+            {"id": 2, "name": None},
+        ],
+    }
+
+
+def test_json_renderer_matches_drf_renderer():
+    data = _get_record_data()
+    expected = DRFMathesarJSONRenderer().render(data)
+    assert MathesarJSONRenderer().render(data) == expected
+
+
+def test_json_renderer_indent_matches_drf_renderer():
+    data = _get_record_data()
+    renderer_context = {"indent": 4}
+    expected = DRFMathesarJSONRenderer().render(data, renderer_context=renderer_context)
+    actual = MathesarJSONRenderer().render(data, renderer_context=renderer_context)
+    assert actual == expected
+
+
+def test_json_renderer_none():
+    assert MathesarJSONRenderer().render(None) == b''
@@ -1,11 +1,16 @@
+from django.conf import settings
+from django.core.cache import cache
 from sqlalchemy import MetaData
 
+from db.admission import INFERENCE, admit
 from db.tables.operations.create import create_mathesar_table
 from db.tables.operations.select import get_oid_from_table
-from db.tables.operations.infer_types import infer_table_column_types
+from db.tables.operations.infer_types import (
+    infer_table_column_types_from_sample, infer_table_column_types_single_scan
+)
 from mathesar.database.base import create_mathesar_engine
 from mathesar.imports.csv import create_table_from_csv
-from mathesar.models import Table
+from mathesar.models import Table, TYPE_SUGGESTIONS_CACHE_INTERVAL
 from mathesar.reflection import reflect_columns_from_table
 
 TABLE_NAME_TEMPLATE = 'Table'
@@ -13,9 +18,16 @@ TABLE_NAME_TEMPLATE = 'Table'
 POSTGRES_NAME_LEN_CAP = 63
 
 
-def get_table_column_types(table):
+def _infer_table_column_types(table, sample_size, sample_method, seed, verify):
     schema = table.schema
-    types = infer_table_column_types(schema.name, table.name, schema._sa_engine)
+    with admit(schema._sa_engine, INFERENCE):
+        if sample_size is None:
+            types = infer_table_column_types_single_scan(schema.name, table.name, schema._sa_engine)
+        else:
+            types = infer_table_column_types_from_sample(
+                schema.name, table.name, schema._sa_engine, sample_size=sample_size,
+                sample_method=sample_method, seed=seed, verify=verify,
+            )
     col_types = {
         col.name: t().compile(dialect=schema._sa_engine.dialect)
         for col, t in zip(table.sa_columns, types)
@@ -26,6 +38,29 @@ def get_table_column_types(table):
     return col_types
 
 
+def get_table_column_types(table, sample_size=None, sample_method=None, seed=None, verify=True):
+    """
+    Gives the inferred type of each inferable column of the table.
+
+    Results are cached per table, and are only reused while the table's
+    version (see get_table_version) is unchanged.  The Table model also
+    clears the cache whenever it changes the table's records or columns.
+    """
+    parameters = (sample_size, sample_method, seed, verify)
+    version = table.get_version()
+    cached = cache.get(table.type_suggestions_cache_key)
+    if cached is None or cached['version'] != version:
+        cached = {'version': version, 'suggestions': {}}
+    if parameters not in cached['suggestions']:
+        cached['suggestions'][parameters] = _infer_table_column_types(
+            table, sample_size, sample_method, seed, verify
+        )
+        cache.set(
+            table.type_suggestions_cache_key, cached, TYPE_SUGGESTIONS_CACHE_INTERVAL
+        )
+    return cached['suggestions'][parameters]
+
+
 def gen_table_name(schema, data_files=None):
     if data_files:
         data_file = data_files[0]
@@ -56,9 +91,12 @@ def gen_table_name(schema, data_files=None):
     return name
 
 
-def create_table_from_datafile(data_files, name, schema):
+def create_table_from_datafile(data_files, name, schema, infer_types=False):
     data_file = data_files[0]
-    table = create_table_from_csv(data_file, name, schema)
+    table = create_table_from_csv(
+        data_file, name, schema, infer_types=infer_types,
+        parallel_inference=settings.MATHESAR_PARALLEL_TYPE_INFERENCE,
+    )
     return table
 
 